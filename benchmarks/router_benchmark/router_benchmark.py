@@ -0,0 +1,327 @@
+"""
+This module defines the router benchmark suite, which measures the routing layer against
+synthetic route tables of static and dynamic routes.
+
+For every table, the suite reports the time to register and compile the routes, the memory
+they take per route, the latency of a `RouteRegistry.lookup` for matching, unknown and
+wrongly requested paths, and the latency of a full dispatch through `HTTPHandler`.
+
+Run it from the repository root, and optionally save the JSON results to a file:
+
+    python -m benchmarks.router_benchmark.router_benchmark --output router.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from typing import Any, Callable
+
+from handlers.http_handler.http_handler import HTTPHandler
+
+from parsers.request_parser.http_request import HTTPRequest
+from parsers.request_parser.request_body import RequestBody
+
+from route_registry.router_registry import RouteRegistry
+
+
+ROUTE_COUNTS = (10, 1000, 10000)
+"""
+The number of routes of the generated route tables.
+"""
+
+ROUTE_KINDS = ('static', 'dynamic')
+"""
+The kinds of generated route tables.
+"""
+
+
+def handler (
+    id: int = 0,
+) -> str:
+
+    """
+    The handler of every generated route.
+    """
+
+    return 'ok'
+
+
+def generate_routes (
+    count: int,
+    kind: str,
+) -> list[tuple[str, str]]:
+
+    """
+    Generates the paths of a synthetic route table, with the path of a request matching each route.
+
+    Routes are spread over ten top-level sections, like the modules of a real service.
+
+    Args:
+        count (int): The number of routes.
+        kind (str): 'static' for literal paths, or 'dynamic' for paths ending with an `<int:id>` parameter.
+
+    Returns:
+        list[tuple[str, str]]: The route path and a matching request path of every route.
+    """
+
+    routes = []
+    for index in range(count):
+        path = f"/section{index % 10}/resource{index}"
+        if kind == 'dynamic':
+            routes.append((f"{path}/<int:id>", f"{path}/{index}"))
+        else:
+            routes.append((path, path))
+    return routes
+
+
+def build_registry (
+    routes: list[tuple[str, str]],
+) -> RouteRegistry:
+
+    """
+    Registers the generated routes for GET and compiles the routing table.
+
+    Args:
+        routes (list[tuple[str, str]]): The generated routes.
+
+    Returns:
+        RouteRegistry: The registry holding the compiled table.
+    """
+
+    registry = RouteRegistry()
+    for path, _ in routes:
+        registry.add_route(path, handler, ['GET'], False)
+    registry.compile()
+    return registry
+
+
+def measure_build (
+    routes: list[tuple[str, str]],
+) -> dict[str, float]:
+
+    """
+    Measures the time and memory taken to register and compile a route table.
+
+    The time is measured apart from the memory, as tracing allocations slows the build down.
+
+    Args:
+        routes (list[tuple[str, str]]): The generated routes.
+
+    Returns:
+        dict[str, float]: The build time in milliseconds, and the memory of the table in bytes,
+                          in total and per route.
+    """
+
+    gc.collect()
+    started = time.perf_counter()
+    build_registry(routes)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        registry = build_registry(routes)
+        memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del registry
+    return {
+        'build_ms': elapsed * 1e3,
+        'memory_bytes': memory,
+        'memory_bytes_per_route': memory / len(routes),
+    }
+
+
+def measure_latency (
+    call: Callable[[str, str], Any],
+    requests: list[tuple[str, str]],
+    lookups: int,
+    repeats: int,
+) -> dict[str, float]:
+
+    """
+    Measures the latency of a routing call.
+
+    The requests are cycled until `lookups` calls are made, and the measure is repeated
+    to smooth out the noise of the machine.
+
+    Args:
+        call (Callable[[str, str], Any]): The call taking the method and path of a request.
+        requests (list[tuple[str, str]]): The methods and paths of the requests.
+        lookups (int): The number of calls of a measure.
+        repeats (int): The number of measures.
+
+    Returns:
+        dict[str, float]: The best and median latency of a call, in nanoseconds.
+    """
+
+    batch = [requests[index % len(requests)] for index in range(lookups)]
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter_ns()
+        for method, path in batch:
+            call(method, path)
+        timings.append((time.perf_counter_ns() - started) / lookups)
+
+    timings.sort()
+    return {
+        'best_ns': timings[0],
+        'median_ns': timings[len(timings) // 2],
+    }
+
+
+def measure_dispatch (
+    registry: RouteRegistry,
+    requests: list[tuple[str, str]],
+    lookups: int,
+    repeats: int,
+) -> dict[str, float]:
+
+    """
+    Measures the latency of serving a request through `HTTPHandler`, from routing to the encoded response.
+
+    Args:
+        registry (RouteRegistry): The registry holding the compiled table.
+        requests (list[tuple[str, str]]): The methods and paths of the requests.
+        lookups (int): The number of requests of a measure.
+        repeats (int): The number of measures.
+
+    Returns:
+        dict[str, float]: The best and median latency of a request, in nanoseconds.
+    """
+
+    http_handler = HTTPHandler()
+    batch = [
+        HTTPRequest(method, path, path, '', 'HTTP/1.1', {}, RequestBody(bytearray()))
+        for method, path in requests
+    ]
+
+    async def serve (
+        count: int,
+    ) -> int:
+
+        started = time.perf_counter_ns()
+        for index in range(count):
+            await http_handler.handle_http_request(batch[index % len(batch)], registry)
+        return time.perf_counter_ns() - started
+
+    timings = sorted(asyncio.run(serve(lookups)) / lookups for _ in range(repeats))
+    return {
+        'best_ns': timings[0],
+        'median_ns': timings[len(timings) // 2],
+    }
+
+
+def run_benchmark (
+    count: int,
+    kind: str,
+    lookups: int = 100000,
+    repeats: int = 5,
+    seed: int = 0,
+) -> dict[str, Any]:
+
+    """
+    Benchmarks the routing layer against one synthetic route table.
+
+    Args:
+        count (int): The number of routes.
+        kind (str): The kind of routes, 'static' or 'dynamic'.
+        lookups (int, optional): The number of lookups of a latency measure. Defaults to 100000.
+        repeats (int, optional): The number of latency measures. Defaults to 5.
+        seed (int, optional): The seed of the order the routes are requested in. Defaults to 0.
+
+    Returns:
+        dict[str, Any]: The results of the benchmark.
+    """
+
+    routes = generate_routes(count, kind)
+    result = {'routes': count, 'kind': kind, **measure_build(routes)}
+
+    registry = build_registry(routes)
+    hits = [('GET', request_path) for _, request_path in routes]
+    random.Random(seed).shuffle(hits)
+    scenarios = {
+        'hit': hits,
+        'not_found': [('GET', f"{path}/missing") for _, path in hits],
+        'method_not_allowed': [('POST', path) for _, path in hits],
+    }
+    result['lookup'] = {
+        name: measure_latency(registry.lookup, requests, lookups, repeats)
+        for name, requests in scenarios.items()
+    }
+    result['dispatch'] = measure_dispatch(registry, hits, max(lookups // 10, 1), repeats)
+    return result
+
+
+def run_benchmarks (
+    counts: tuple[int, ...] = ROUTE_COUNTS,
+    kinds: tuple[str, ...] = ROUTE_KINDS,
+    lookups: int = 100000,
+    repeats: int = 5,
+) -> dict[str, Any]:
+
+    """
+    Runs the benchmark of every route table and collects the results with the environment they ran in.
+
+    Args:
+        counts (tuple[int, ...], optional): The numbers of routes. Defaults to `ROUTE_COUNTS`.
+        kinds (tuple[str, ...], optional): The kinds of routes. Defaults to `ROUTE_KINDS`.
+        lookups (int, optional): The number of lookups of a latency measure. Defaults to 100000.
+        repeats (int, optional): The number of latency measures. Defaults to 5.
+
+    Returns:
+        dict[str, Any]: The environment and the results of every benchmark.
+    """
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'lookups': lookups,
+        'repeats': repeats,
+        'results': [
+            run_benchmark(count, kind, lookups, repeats)
+            for kind in kinds
+            for count in counts
+        ],
+    }
+
+
+def main (
+    argv: list[str] | None = None,
+) -> None:
+
+    """
+    Runs the router benchmarks from the command line and writes the results as JSON.
+
+    Args:
+        argv (list[str] | None, optional): The command line arguments. Defaults to `sys.argv`.
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the SocketIO routing layer.")
+    parser.add_argument('--counts', type=int, nargs='+', default=list(ROUTE_COUNTS), help="numbers of routes")
+    parser.add_argument('--kinds', nargs='+', choices=ROUTE_KINDS, default=list(ROUTE_KINDS), help="kinds of routes")
+    parser.add_argument('--lookups', type=int, default=100000, help="lookups of a latency measure")
+    parser.add_argument('--repeats', type=int, default=5, help="latency measures")
+    parser.add_argument('--output', help="file the JSON results are written to, instead of stdout")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(tuple(args.counts), tuple(args.kinds), args.lookups, args.repeats)
+    report = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as output:
+            output.write(report + '\n')
+    else:
+        sys.stdout.write(report + '\n')
+
+
+if __name__ == '__main__':
+    main()
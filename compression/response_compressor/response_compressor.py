@@ -0,0 +1,353 @@
+"""
+This module defines the `ResponseCompressor` class, which compresses response bodies with
+the content coding negotiated from the `Accept-Encoding` header of the request.
+"""
+
+import asyncio
+import copy
+import gzip
+import hashlib
+
+from collections import OrderedDict
+from typing import Any, Callable
+
+from configs.compression_config.compression_config import CompressionConfig
+
+from parsers.request_parser.http_request import HTTPRequest
+
+from returnables.file_response.file_response import FileResponse
+from returnables.response.response import Response
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+VARY_HEADER = b"Vary: Accept-Encoding\r\n"
+CONTENT_ENCODING_HEADERS = {
+    'br': b"Content-Encoding: br\r\n",
+    'gzip': b"Content-Encoding: gzip\r\n",
+}
+CACHEABLE_DIRECTIVES = ('public', 'max-age', 's-maxage', 'immutable')
+UNCACHEABLE_DIRECTIVES = ('no-store', 'private', 'no-cache')
+MAX_ACCEPT_ENCODINGS = 256
+
+
+class ResponseCompressor:
+
+    """
+    Compresses the responses of a server.
+
+    A response is compressed when the client accepts gzip, or brotli when it is installed,
+    its body is at least `minimum_size` bytes and its media type is compressible. Bodies
+    larger than `executor_threshold` are compressed in the default executor so the event
+    loop keeps serving other connections. Static files up to `max_file_size` bytes are
+    compressed too. The `ETag` of a compressed response is made weak, as its bytes differ
+    from the uncompressed representation.
+
+    The compressed bodies of static files, and of responses whose `Cache-Control` header
+    allows caching, are kept in a cache bounded to `cache_size` bytes and evicted in least
+    recently used order, so identical payloads are only compressed once.
+
+    Attributes:
+        config (CompressionConfig): The compression settings.
+    """
+
+    def __init__ (
+        self,
+        config: CompressionConfig,
+    ) -> None:
+
+        """
+        Initializes the compressor.
+
+        Args:
+            config (CompressionConfig): The compression settings.
+        """
+
+        self.config = config
+        self._compressors: dict[str, Callable[[bytes], bytes]] = {
+            'gzip': lambda body: gzip.compress(body, config.gzip_level, mtime=0),
+        }
+        if brotli is not None:
+            self._compressors['br'] = lambda body: brotli.compress(body, quality=config.brotli_quality)
+
+        self._cache: OrderedDict[tuple, bytes] = OrderedDict()
+        self._cache_bytes = 0
+        self._encodings: dict[str, str | None] = {}
+        self._media_types: dict[str, bool] = {}
+
+    async def compress (
+        self,
+        request: HTTPRequest,
+        response: Response,
+    ) -> Response:
+
+        """
+        Compresses a response for the client of a request, when it is worth it.
+
+        Args:
+            request (HTTPRequest): The request being served.
+            response (Response): The response of the handler.
+
+        Returns:
+            Response: The compressed response, the response itself, or a copy of it varying on `Accept-Encoding`.
+        """
+
+        if (
+            isinstance(response, StreamingResponse)
+            or response.status_code not in (200, 203)
+            or any(name.lower() == 'content-encoding' for name in response.headers)
+            or b"content-encoding:" in response.raw_headers.lower()
+            or not self.is_compressible(response.media_type)
+        ):
+            return response
+
+        if isinstance(response, FileResponse):
+            if (
+                response.ranges
+                or not response.include_body
+                or not self.config.minimum_size <= response.size <= self.config.max_file_size
+            ):
+                return response
+        elif len(response.body) < self.config.minimum_size:
+            return response
+
+        encoding = self.select_encoding(request.headers.get('accept-encoding'))
+        if encoding is None:
+            if VARY_HEADER not in response.raw_headers:
+                response = copy.copy(response)
+                response.raw_headers += VARY_HEADER
+                response._header_block = None
+            return response
+
+        raw_headers = response.raw_headers
+        if isinstance(response, FileResponse):
+            # The headers of a static file carry its ETag, so a modified file misses the cache.
+            key = (encoding, response.path, raw_headers)
+            body = self._cache_get(key)
+            if body is None:
+                body = await self._run(response.size, self._compress_file, encoding, response.path)
+                self._cache_put(key, body)
+            raw_headers = raw_headers.replace(b"Accept-Ranges: bytes\r\n", b"")
+        elif self.is_cacheable(response):
+            key = (encoding, hashlib.blake2b(response.body, digest_size=16).digest())
+            body = self._cache_get(key)
+            if body is None:
+                body = await self._run(len(response.body), self._compressors[encoding], response.body)
+                self._cache_put(key, body)
+        else:
+            body = await self._run(len(response.body), self._compressors[encoding], response.body)
+
+        headers = response.headers
+        if any(name.lower() == 'etag' for name in headers):
+            headers = {
+                name: f"W/{value}" if name.lower() == 'etag' and not value.startswith('W/') else value
+                for name, value in headers.items()
+            }
+
+        return Response (
+            body,
+            response.status_code,
+            headers,
+            response.media_type,
+            raw_headers.replace(b'ETag: "', b'ETag: W/"') + CONTENT_ENCODING_HEADERS[encoding] + VARY_HEADER,
+        )
+
+    def select_encoding (
+        self,
+        accept_encoding: str | None,
+    ) -> str | None:
+
+        """
+        Selects the content coding of a response from the `Accept-Encoding` header of the request.
+
+        The coding with the highest quality value is selected, preferring brotli to gzip on a tie,
+        and `*` stands for any coding not listed. The choice is cached per header value, as clients
+        send few distinct values.
+
+        Args:
+            accept_encoding (str | None): The value of the `Accept-Encoding` header, or None if it is missing.
+
+        Returns:
+            str | None: 'br' or 'gzip', or None if the body must be sent as it is.
+        """
+
+        if not accept_encoding:
+            return None
+
+        try:
+            return self._encodings[accept_encoding]
+        except KeyError:
+            pass
+
+        qualities = {}
+        for coding in accept_encoding.split(','):
+            name, _, params = coding.partition(';')
+            quality = 1.0
+            for param in params.split(';'):
+                key, _, value = param.partition('=')
+                if key.strip().lower() == 'q':
+                    try:
+                        quality = float(value)
+                    except ValueError:
+                        quality = 0.0
+            qualities[name.strip().lower()] = quality
+
+        any_quality = qualities.get('*', 0.0)
+        encoding, best = None, 0.0
+        for name in ('br', 'gzip'):
+            quality = qualities.get(name, any_quality)
+            if name in self._compressors and quality > best:
+                encoding, best = name, quality
+
+        if len(self._encodings) >= MAX_ACCEPT_ENCODINGS:
+            self._encodings.clear()
+        self._encodings[accept_encoding] = encoding
+        return encoding
+
+    def is_compressible (
+        self,
+        media_type: str,
+    ) -> bool:
+
+        """
+        Checks whether a media type is in the allowlist of compressible media types, once per media type.
+
+        Args:
+            media_type (str): The media type of the body, possibly with parameters (e.g., "text/html; charset=utf-8").
+
+        Returns:
+            bool: True if bodies of the media type are compressed.
+        """
+
+        compressible = self._media_types.get(media_type)
+        if compressible is None:
+            essence = media_type.partition(';')[0].strip().lower()
+            compressible = self._media_types[media_type] = any (
+                essence.startswith(allowed) if allowed.endswith('/') else essence == allowed
+                for allowed in self.config.media_types
+            )
+        return compressible
+
+    def is_cacheable (
+        self,
+        response: Response,
+    ) -> bool:
+
+        """
+        Checks whether the `Cache-Control` header of a response marks it as cacheable,
+        in which case its compressed body is kept in the cache.
+
+        Args:
+            response (Response): The response of the handler.
+
+        Returns:
+            bool: True if the response is public or has a lifetime, and may be stored.
+        """
+
+        cache_control = next (
+            (value for name, value in response.headers.items() if name.lower() == 'cache-control'),
+            None,
+        )
+        if cache_control is None:
+            return False
+
+        directives = {directive.partition('=')[0].strip().lower() for directive in cache_control.split(',')}
+        return bool(directives.intersection(CACHEABLE_DIRECTIVES)) and not directives.intersection(UNCACHEABLE_DIRECTIVES)
+
+    async def _run (
+        self,
+        size: int,
+        function: Callable[..., bytes],
+        *args: Any,
+    ) -> bytes:
+
+        """
+        Runs a compression, in the default executor when the body is at least `executor_threshold` bytes.
+
+        Args:
+            size (int): The size of the body to compress, in bytes.
+            function (Callable[..., bytes]): The compression function.
+            *args (Any): The arguments of the function.
+
+        Returns:
+            bytes: The compressed body.
+        """
+
+        if size < self.config.executor_threshold:
+            return function(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+    def _compress_file (
+        self,
+        encoding: str,
+        path: str,
+    ) -> bytes:
+
+        """
+        Reads and compresses a file.
+
+        Args:
+            encoding (str): The content coding.
+            path (str): The path of the file.
+
+        Returns:
+            bytes: The compressed content of the file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+
+        with open(path, 'rb') as file:
+            return self._compressors[encoding](file.read())
+
+    def _cache_get (
+        self,
+        key: tuple,
+    ) -> bytes | None:
+
+        """
+        Returns a compressed body from the cache, marking it as recently used.
+
+        Args:
+            key (tuple): The content coding and the identity of the payload.
+
+        Returns:
+            bytes | None: The compressed body, or None if it is not cached.
+        """
+
+        body = self._cache.get(key)
+        if body is not None:
+            self._cache.move_to_end(key)
+        return body
+
+    def _cache_put (
+        self,
+        key: tuple,
+        body: bytes,
+    ) -> None:
+
+        """
+        Stores a compressed body in the cache, evicting the least recently used bodies
+        beyond `cache_size` bytes. A body larger than a quarter of the cache is not stored.
+
+        Args:
+            key (tuple): The content coding and the identity of the payload.
+            body (bytes): The compressed body.
+        """
+
+        if len(body) > self.config.cache_size // 4:
+            return
+
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._cache_bytes -= len(previous)
+
+        self._cache[key] = body
+        self._cache_bytes += len(body)
+        while self._cache_bytes > self.config.cache_size:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_bytes -= len(evicted)
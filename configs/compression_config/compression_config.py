@@ -0,0 +1,44 @@
+"""
+CompressionConfig dataclass
+
+This module defines the CompressionConfig dataclass, which encapsulates the settings
+controlling how the SocketIO server compresses response bodies, such as the size
+threshold, the compressible content types and the cache of compressed bodies.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass
+class CompressionConfig:
+
+    """
+    CompressionConfig defines how response bodies are compressed.
+
+    Attributes:
+        minimum_size (int): Minimum size of a body worth compressing, in bytes.
+        media_types (tuple[str, ...]): The compressible media types. An entry ending with '/'
+            matches every media type of its top-level type (e.g., 'text/').
+        gzip_level (int): The gzip compression level, from 1 (fastest) to 9 (smallest).
+        brotli_quality (int): The brotli compression quality, from 0 (fastest) to 11 (smallest).
+            Brotli is only offered when the brotli package is installed.
+        executor_threshold (int): Minimum size of a body compressed in the default executor
+            instead of on the event loop, in bytes.
+        max_file_size (int): Maximum size of a static file compressed, in bytes.
+        cache_size (int): Maximum total size of the compressed bodies kept in the cache, in bytes.
+            Only static files and responses with a cacheable `Cache-Control` header are cached.
+    """
+
+    minimum_size: int = 1024
+    media_types: tuple[str, ...] = (
+        'text/',
+        'application/json',
+        'application/javascript',
+        'application/xml',
+        'image/svg+xml',
+    )
+    gzip_level: int = 6
+    brotli_quality: int = 4
+    executor_threshold: int = 65536
+    max_file_size: int = 8388608
+    cache_size: int = 16777216
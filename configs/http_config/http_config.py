@@ -0,0 +1,47 @@
+"""
+HTTPConfig dataclass
+
+This module defines the HTTPConfig dataclass, which encapsulates the settings
+controlling how the SocketIO server handles HTTP connections, such as persistent
+connection limits, timeouts and request size limits.
+"""
+
+from dataclasses import dataclass
+
+from configs.compression_config.compression_config import CompressionConfig
+
+
+@dataclass
+class HTTPConfig:
+    
+    """
+    HTTPConfig defines how HTTP connections are served.
+
+    Attributes:
+        keep_alive (bool): If True, connections are kept open between requests (HTTP/1.1 keep-alive).
+        keep_alive_timeout (float): Seconds a connection may stay idle while waiting for a request.
+        max_keep_alive_requests (int): Maximum number of requests served on a single connection.
+        pipeline_concurrency (bool): If True, pipelined requests received together are dispatched
+            concurrently. Their responses are always written back in request order.
+        max_request_line_size (int): Maximum size of the request line, in bytes.
+        max_header_size (int): Maximum size of the request line and headers, in bytes.
+        max_headers (int): Maximum number of headers in a request.
+        max_body_size (int): Maximum size of a request body, in bytes, for routes that do not set their own.
+        parser_backend (str): The request parser backend: 'python', or 'auto' to use the first available backend.
+        compression (CompressionConfig | None): The settings of response compression, negotiated
+            from the `Accept-Encoding` header of each request, or None to send bodies uncompressed.
+        response_cache_size (int): Maximum total size of the response bodies kept by the response cache,
+            in bytes, for routes with a `cache_ttl` and responses with a shared `Cache-Control` lifetime.
+    """
+    
+    keep_alive: bool = True
+    keep_alive_timeout: float = 5.0
+    max_keep_alive_requests: int = 100
+    pipeline_concurrency: bool = False
+    max_request_line_size: int = 8190
+    max_header_size: int = 65536
+    max_headers: int = 100
+    max_body_size: int = 1048576
+    parser_backend: str = 'python'
+    compression: CompressionConfig | None = None
+    response_cache_size: int = 33554432
@@ -6,12 +6,24 @@ processing of these requests to appropriate handlers.
 """
 
 import asyncio
+import inspect
 import socket
-from typing import Callable
+from typing import Any, Callable
+
+from configs.http_config.http_config import HTTPConfig
 
 from handlers.request_handler.request_handler import RequestHandler
+from returnables.event_stream_response.event_stream_response import EventStreamResponse
+from returnables.response.response import Response
+
 from route_registry.router_registry import RouteRegistry
 
+from server_sent_events.server_sent_events import EventChannel
+
+from socketio_router.socketio_router import SocketIORouter
+
+from static_files.static_files import StaticFiles
+
 
 class IORouter:
     
@@ -27,13 +39,17 @@ class IORouter:
 
     def __init__ (
         self,
+        http_config: HTTPConfig = None,
     ) -> None:
         
         """
         Initializes the IORouter instance with a request handler and route registry.
+
+        Args:
+            http_config (HTTPConfig, optional): The settings controlling how HTTP connections are served.
         """
         
-        self.request_handler = RequestHandler()
+        self.request_handler = RequestHandler(http_config or HTTPConfig())
         self.router_registry = RouteRegistry()
 
     def route (
@@ -41,18 +57,49 @@ class IORouter:
         path: str, 
         methods: list[str] = ['GET'],
         protected: bool = True,
+        max_body_size: int = None,
+        cache_ttl: float = None,
+        etag: bool | Callable[..., Any] = False,
+        constant: bool | int = False,
     ) -> Callable[[Callable[..., None]], Callable[..., None]]:
         
         """
         Registers an HTTP route handler for a specific path and method.
 
+        A handler declaring a `request` parameter receives the `HTTPRequest` being served,
+        whose body can be read with `await request.body.read()` or streamed with
+        `async for chunk in request.body`.
+
         Args:
             path (str): The path to register the route for.
             methods (list[str], optional): The HTTP methods (e.g., 'GET', 'POST') for this route. Defaults to ['GET'].
             protected (bool, optional): Whether the route is protected (requires authentication). Defaults to True.
+            max_body_size (int, optional): The maximum size of a request body accepted by this route, in bytes.
+                                           Defaults to the `max_body_size` of the server's `HTTPConfig`.
+            cache_ttl (float, optional): The number of seconds the encoded responses of this route are served
+                                         from the response cache, per path, query and `Vary` headers, without
+                                         running the handler. Defaults to None, caching only the responses
+                                         whose `Cache-Control` header is public with a lifetime.
+            etag (bool | Callable[..., Any], optional): Whether GET responses of this route get a strong `ETag`,
+                                                        and requests whose `If-None-Match` matches it are answered
+                                                        with a bodiless 304. True hashes the body of the response.
+                                                        A function returning a cheap version of the resource, such
+                                                        as a revision number, is called with the arguments of the
+                                                        handler before it, so the body is never built when the client
+                                                        already holds the current version. Defaults to False.
+            constant (bool | int, optional): Whether the handler always returns the same response, such as a
+                                             health check or robots.txt. The full response is then encoded once
+                                             and written to every request without running the handler, nor
+                                             compressing it. True builds it when the server starts, and a number
+                                             freezes the response once the handler returned it that many times
+                                             in a row. Only GET and HEAD routes can be constant. Defaults to False.
 
         Returns:
             Callable[[Callable[..., None]], Callable[..., None]]: A decorator that registers the handler function for the route.
+
+        Raises:
+            InvalidRoutePath: If the path is malformed, or if a constant route has a dynamic path, takes the request,
+                              or serves a method other than GET and HEAD.
         """
         
         def wrapper (
@@ -64,6 +111,10 @@ class IORouter:
                 handler,
                 methods,
                 protected,
+                max_body_size,
+                cache_ttl,
+                etag,
+                constant,
             )
             return handler
         return wrapper
@@ -87,11 +138,164 @@ class IORouter:
             handler: Callable[..., None],
         ) -> Callable[..., None]:
             
-            self.router_registry.websockets[path] = handler
+            self.router_registry.add_websocket_route(path, handler)
             return handler
         return wrapper
 
-    def handle_request (
+    def sse (
+        self,
+        path: str,
+        heartbeat_interval: float = 15.0,
+        history_size: int = 1000,
+        max_pending: int = 1000,
+        protected: bool = True,
+    ) -> Callable[[Callable[..., Any]], EventChannel]:
+        
+        """
+        Registers a Server-Sent Events endpoint for a specific path.
+
+        A GET request for the path opens a `text/event-stream` stream, subscribed to the channel
+        of the endpoint, that stays open until the client disconnects. The handler is called
+        when a client connects, with the path parameters and, when it declares it, the request.
+        It may return a `Response`, such as a 401, which is sent instead of opening the stream.
+
+        The decorator returns the `EventChannel` of the endpoint, whose `publish` method encodes
+        an event once and queues the same bytes for every connected client:
+
+            @app.sse('/dashboard')
+            async def dashboard():
+                ...
+
+            dashboard.publish({'cpu': 0.42}, event='metrics')
+
+        Args:
+            path (str): The path to register the endpoint for.
+            heartbeat_interval (float, optional): The number of idle seconds before a heartbeat comment
+                                                  is sent to a client. Defaults to 15.0.
+            history_size (int, optional): The number of recent events kept to resume the streams of
+                                          clients reconnecting with `Last-Event-ID`. Defaults to 1000.
+            max_pending (int, optional): The number of events a client may fall behind before it is
+                                         disconnected. Defaults to 1000.
+            protected (bool, optional): Whether the route is protected (requires authentication). Defaults to True.
+
+        Returns:
+            Callable[[Callable[..., Any]], EventChannel]: A decorator that registers the handler and returns
+                                                          the channel of the endpoint.
+        """
+        
+        channel = EventChannel(history_size, max_pending)
+
+        def wrapper (
+            handler: Callable[..., Any],
+        ) -> EventChannel:
+            
+            wants_request = 'request' in inspect.signature(handler).parameters
+
+            async def subscribe (
+                request: Any,
+                **path_params: str,
+            ) -> Response:
+                
+                if wants_request:
+                    path_params['request'] = request
+                result = handler(**path_params)
+                if asyncio.iscoroutine(result):
+                    result = await result
+                if isinstance(result, Response):
+                    return result
+                return EventStreamResponse (
+                    channel,
+                    request.headers.get('last-event-id'),
+                    heartbeat_interval,
+                )
+
+            self.router_registry.add_route (
+                path,
+                subscribe,
+                ['GET'],
+                protected,
+            )
+            return channel
+        return wrapper
+
+    def static (
+        self,
+        prefix: str,
+        directory: str,
+        stat_ttl: float = 1.0,
+    ) -> StaticFiles:
+        
+        """
+        Serves the files of a directory under a path prefix.
+
+        A GET or HEAD request for `<prefix>/<file>` is answered with the file, sent with `sendfile`,
+        or with a 304 when the client already holds its current version.
+
+        Args:
+            prefix (str): The path prefix of the files (e.g., "/static").
+            directory (str): The directory to serve.
+            stat_ttl (float, optional): The number of seconds the metadata of a file is cached
+                                        without checking it. Defaults to 1.0.
+
+        Returns:
+            StaticFiles: The static file server of the directory.
+
+        Raises:
+            NotADirectoryError: If the directory does not exist.
+        """
+        
+        static_files = StaticFiles(directory, stat_ttl)
+        self.router_registry.add_route (
+            f"{prefix.rstrip('/')}/<path:file>",
+            static_files.serve,
+            ['GET', 'HEAD'],
+            False,
+        )
+        return static_files
+
+    def include_router (
+        self,
+        router: SocketIORouter,
+        prefix: str = "",
+    ) -> None:
+        
+        """
+        Mounts the routes of a `SocketIORouter` under a path prefix.
+
+        The routes are merged into the routing table compiled when the server starts,
+        so a mounted route is looked up as fast as a route registered on the application.
+
+        Args:
+            router (SocketIORouter): The router to mount.
+            prefix (str, optional): The prefix of the mounted paths (e.g., "/api/v1"). Defaults to no prefix.
+
+        Raises:
+            InvalidRoutePath: If the prefix is malformed.
+        """
+        
+        self.router_registry.include(router.router_registry, prefix)
+
+    def compile_routes (
+        self,
+    ) -> None:
+        
+        """
+        Compiles the registered routes into the immutable routing table used to serve requests.
+        """
+        
+        self.router_registry.compile()
+
+    async def build_constant_responses (
+        self,
+    ) -> None:
+        
+        """
+        Runs the handlers of the routes declared constant once, and encodes their responses.
+        """
+        
+        await self.request_handler.build_constant_responses(self.router_registry)
+
+    async def handle_request (
         self, 
         client_socket: socket.socket,
         allowed_hosts: list[str],
@@ -101,6 +305,8 @@ class IORouter:
         Processes an incoming request by delegating it to the appropriate 
         request handler and routing it to the correct handler.
 
+        The request is processed on the running event loop of the server.
+
         Args:
             client_socket (socket.socket): The client socket to interact with.
             allowed_hosts (list[str]): A list of allowed hosts to authorize the request.
@@ -109,9 +315,9 @@ class IORouter:
             None: The function does not return anything. It processes the request.
         """
         
-        asyncio.run(self.request_handler.handle_request(
+        await self.request_handler.handle_request (
             client_socket,
-            self.router_registry.routes,
-            self.router_registry.websockets,
+            self.router_registry,
+            (self.router_registry.table or self.router_registry.compile()).websockets,
             allowed_hosts,
-        ))
+        )
@@ -0,0 +1,145 @@
+"""
+This module provides the helpers of entity tags: building strong `ETag` values from a response
+body or a version, matching them against `If-None-Match`, and building the 304 responses.
+"""
+
+import hashlib
+import re
+
+from typing import Any
+
+from returnables.response.response import Response
+
+
+ENTITY_TAG_PATTERN = re.compile(r'[\x21\x23-\x7e]*')
+"""
+The pattern of the characters allowed inside the quotes of an entity tag.
+"""
+
+ETAG_HEADER_PATTERN = re.compile(rb'^ETag:[ \t]*(\S+)[ \t]*\r$', re.IGNORECASE | re.MULTILINE)
+"""
+The pattern of an encoded `ETag` header line, capturing its entity tag.
+"""
+
+NOT_MODIFIED_HEADERS = ('cache-control', 'content-location', 'expires', 'vary')
+"""
+The headers of a response repeated by the 304 response answered in its place, along with its `ETag`.
+"""
+
+
+def hash_entity_tag (
+    body: bytes,
+) -> str:
+
+    """
+    Builds the strong entity tag of a body from its hash.
+
+    Args:
+        body (bytes): The body of the response.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def make_entity_tag (
+    version: Any,
+) -> str:
+
+    """
+    Builds the strong entity tag of a version, such as a revision number or an update timestamp.
+
+    A version containing characters not allowed in an entity tag is hashed.
+
+    Args:
+        version (Any): The version of the resource, converted to a string.
+
+    Returns:
+        str: The quoted entity tag.
+    """
+
+    version = str(version)
+    if ENTITY_TAG_PATTERN.fullmatch(version):
+        return f'"{version}"'
+    return hash_entity_tag(version.encode())
+
+
+def matches_if_none_match (
+    if_none_match: str | None,
+    etag: str,
+) -> bool:
+
+    """
+    Checks whether an `If-None-Match` header matches an entity tag, with the weak comparison
+    RFC 9110 requires for it, so a weak tag matches the strong tag with the same value.
+
+    Args:
+        if_none_match (str | None): The value of the `If-None-Match` header, or None if it is missing.
+        etag (str): The entity tag of the current representation.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+    """
+
+    if if_none_match is None:
+        return False
+
+    etag = etag.removeprefix('W/')
+    return any (
+        tag.strip().removeprefix('W/') in (etag, '*')
+        for tag in if_none_match.split(',')
+    )
+
+
+def get_entity_tag (
+    response: Response,
+) -> str | None:
+
+    """
+    Returns the entity tag of a response, set in its custom or encoded headers.
+
+    Args:
+        response (Response): The response.
+
+    Returns:
+        str | None: The entity tag, or None if the response has no `ETag` header.
+    """
+
+    for name, value in response.headers.items():
+        if name.lower() == 'etag':
+            return value
+
+    match = ETAG_HEADER_PATTERN.search(response.raw_headers)
+    return match.group(1).decode('latin-1') if match else None
+
+
+def not_modified (
+    etag: str,
+    response: Response | None = None,
+) -> Response:
+
+    """
+    Builds the bodiless 304 response answered in place of a response the client already holds.
+
+    Args:
+        etag (str): The entity tag of the response.
+        response (Response | None, optional): The response replaced, whose caching headers are repeated.
+                                              Defaults to None.
+
+    Returns:
+        Response: The 304 response.
+    """
+
+    headers, raw_headers = {}, b""
+    if response is not None:
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() in NOT_MODIFIED_HEADERS
+        }
+        raw_headers = b"".join (
+            line + b"\r\n" for line in response.raw_headers.split(b"\r\n")
+            if line.partition(b":")[0].strip().lower().decode('latin-1') in NOT_MODIFIED_HEADERS
+        )
+    return Response(b"", 304, headers, raw_headers=raw_headers + f"ETag: {etag}\r\n".encode('latin-1'))
@@ -0,0 +1,43 @@
+"""
+This module defines a custom exception for handling invalid route paths
+within the SocketIO framework.
+
+Exceptions:
+    - InvalidRoutePath: Raised when a route path cannot be registered.
+"""
+
+from exceptions.base_exception.socketio_exception import SocketIOException
+
+
+class InvalidRoutePath(SocketIOException):
+    
+    """
+    Exception raised when a route path uses an unknown or misplaced path converter.
+    """
+
+    def __init__ (
+        self,
+        path: str,
+        reason: str,
+    ) -> None:
+        
+        """
+        Initializes the InvalidRoutePath with a custom error message.
+
+        Args:
+            path (str): The route path that cannot be registered.
+            reason (str): The reason the path is invalid.
+
+        Raises:
+            SocketIOException: Inherited base exception.
+        """
+        
+        message = f"""
+{'#' * 80}
+# ERROR: Invalid route path {path}: {reason}.
+#
+# Path parameters are written <name> or <converter:name>, where converter is
+# one of str, int, uuid, slug or path. A <path:name> parameter ends the route.
+{'#' * 80}
+"""
+        super().__init__(message.strip())
@@ -0,0 +1,49 @@
+"""
+This module defines custom exceptions for malformed or oversized HTTP requests
+received by the SocketIO server.
+
+Exceptions:
+    - SocketIOMalformedRequestError: Raised when an HTTP request cannot be parsed
+      or exceeds a configured size limit.
+"""
+
+from exceptions.base_exception.socketio_exception import SocketIOException
+
+
+class SocketIOMalformedRequestError(SocketIOException):
+    
+    """
+    Exception raised when an HTTP request cannot be served as received.
+
+    The exception carries the HTTP status line answered to the client (e.g., 400 for
+    a malformed request or 413 for an oversized body) before the connection is closed.
+    """
+
+    def __init__ (
+        self, 
+        status_line: str,
+        reason: str,
+    ) -> None:
+        
+        """
+        Initializes the SocketIOMalformedRequestError with a custom error message.
+
+        Args:
+            status_line (str): The status line of the response sent to the client
+                               (e.g., "HTTP/1.1 400 Bad Request\\r\\n").
+            reason (str): A description of what is wrong with the request.
+
+        Raises:
+            SocketIOException: Inherits from the base `SocketIOException` class.
+        """
+        
+        self.status_line = status_line
+        
+        message = f"""
+{'#' * 80}
+# ERROR: Malformed HTTP request, {reason}.
+#
+# The request was answered with {status_line.strip()} and the connection closed.
+{'#' * 80}
+"""
+        super().__init__(message.strip())
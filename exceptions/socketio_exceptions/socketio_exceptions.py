@@ -1,12 +1,16 @@
 """
 This module defines custom exceptions for errors related to invalid or 
-forbidden port numbers during SocketIO operations.
+forbidden port numbers and worker counts during SocketIO operations.
 
 Exceptions:
     - SocketIOInproperPortError: Raised when an invalid port number is 
       specified (outside the valid port range).
     - SocketIOForbieddenPortError: Raised when a reserved (system) port 
       is used for SocketIO.
+    - SocketIOInproperWorkersError: Raised when an invalid number of worker
+      processes is specified.
+    - SocketIOInproperMaxConnectionsError: Raised when an invalid cap of
+      connections served at once is specified.
 """
 
 from exceptions.base_exception.socketio_exception import SocketIOException
@@ -82,3 +86,176 @@ class SocketIOForbieddenPortError(SocketIOException):
 {"#" * 80}
         """
         super().__init__(message)
+
+
+class SocketIOInproperWorkersError(SocketIOException):
+    
+    """
+    Exception raised when an invalid number of worker processes is specified for SocketIO.
+
+    This exception is raised if the number of workers is not a positive integer, or if
+    more than one worker is requested on a platform that does not support `os.fork`.
+    """
+
+    def __init__ (
+        self, 
+        workers: str,
+    ) -> None:
+        
+        """
+        Initializes the SocketIOInproperWorkersError with a custom error message.
+
+        Args:
+            workers (str): The invalid number of workers that was specified.
+
+        Raises:
+            SocketIOException: Inherits from the base `SocketIOException` class.
+        """
+        
+        message = f"""
+\n
+{"#" * 75}
+#  ERROR: Invalid number of workers '{workers}'.                          #
+#  Workers must be a positive integer. Default SocketIO workers is 1      #
+#  Multiple workers require a platform that supports os.fork.             #
+{"#" * 75}
+        """
+        super().__init__(message)
+
+
+class SocketIOWorkersWithGRPCError(SocketIOException):
+    
+    """
+    Exception raised when a gRPC server is requested along with several worker processes.
+
+    The gRPC server is only served by a single process, so a worker pool cannot serve it.
+    """
+
+    def __init__ (
+        self, 
+        workers: str,
+    ) -> None:
+        
+        """
+        Initializes the SocketIOWorkersWithGRPCError with a custom error message.
+
+        Args:
+            workers (str): The number of workers that was specified.
+
+        Raises:
+            SocketIOException: Inherits from the base `SocketIOException` class.
+        """
+        
+        message = f"""
+\n
+{"#" * 75}
+#  ERROR: Cannot serve gRPC with '{workers}' workers.                             #
+#  The gRPC server only runs in a single process. Remove grpc_port, or    #
+#  serve with a single worker.                                            #
+{"#" * 75}
+        """
+        super().__init__(message)
+
+
+class SocketIOInproperMaxConnectionsError(SocketIOException, ValueError):
+    
+    """
+    Exception raised when an invalid maximum number of connections is specified for SocketIO.
+
+    This exception is raised if the cap of connections served at once by each process is
+    neither None nor a positive integer. It is also a `ValueError`.
+    """
+
+    def __init__ (
+        self, 
+        max_connections: str,
+    ) -> None:
+        
+        """
+        Initializes the SocketIOInproperMaxConnectionsError with a custom error message.
+
+        Args:
+            max_connections (str): The invalid maximum number of connections that was specified.
+
+        Raises:
+            SocketIOException: Inherits from the base `SocketIOException` class.
+        """
+        
+        message = f"""
+\n
+{"#" * 75}
+#  ERROR: Invalid maximum number of connections '{max_connections}'.     #
+#  The cap of connections must be a positive integer, or None to serve   #
+#  every connection at once.                                             #
+{"#" * 75}
+        """
+        super().__init__(message)
+
+
+class SocketIOInproperParserBackendError(SocketIOException):
+    
+    """
+    Exception raised when an unknown or unavailable request parser backend is specified for SocketIO.
+
+    This exception is raised if the backend name is not known, or if the backend
+    is not available on this installation.
+    """
+
+    def __init__ (
+        self, 
+        backend: str,
+    ) -> None:
+        
+        """
+        Initializes the SocketIOInproperParserBackendError with a custom error message.
+
+        Args:
+            backend (str): The invalid parser backend that was specified.
+
+        Raises:
+            SocketIOException: Inherits from the base `SocketIOException` class.
+        """
+        
+        message = f"""
+\n
+{"#" * 75}
+#  ERROR: Unknown or unavailable parser backend '{backend}'.             #
+#  Available backends are 'auto' and 'python'.                           #
+{"#" * 75}
+        """
+        super().__init__(message)
+
+
+class SocketIOInproperJsonBackendError(SocketIOException):
+    
+    """
+    Exception raised when an unknown or unavailable JSON serialization backend is specified for SocketIO.
+
+    This exception is raised if the backend name is not known, or if the optional dependency
+    of the backend, such as `orjson` or `ujson`, is not installed.
+    """
+
+    def __init__ (
+        self, 
+        backend: str,
+    ) -> None:
+        
+        """
+        Initializes the SocketIOInproperJsonBackendError with a custom error message.
+
+        Args:
+            backend (str): The invalid JSON backend that was specified.
+
+        Raises:
+            SocketIOException: Inherits from the base `SocketIOException` class.
+        """
+        
+        message = f"""
+\n
+{"#" * 75}
+#  ERROR: Unknown or unavailable JSON backend '{backend}'.               #
+#  Available backends are 'auto', 'orjson', 'ujson' and 'json'.          #
+#  The 'orjson' and 'ujson' backends require their packages.             #
+{"#" * 75}
+        """
+        super().__init__(message)
@@ -1,9 +1,33 @@
-from .preparation_handler.preparation_handler import PreparationHandler
-from .request_consumer_handler.request_consumer_handler import RequestConsumerHandler
-from .grpc_handler.grpc_handler import GRPCHandler
+"""
+The handlers of the SocketIO server.
+
+The server handlers are imported on first access, so importing a single handler module,
+such as `handlers.request_handler.request_handler`, does not pull in the optional
+dependencies of the others, such as grpc for `GRPCHandler` or watchdog for `PreparationHandler`.
+"""
+
+from importlib import import_module
+
+
+_HANDLERS = {
+    'PreparationHandler': '.preparation_handler.preparation_handler',
+    'RequestConsumerHandler': '.request_consumer_handler.request_consumer_handler',
+    'GRPCHandler': '.grpc_handler.grpc_handler',
+    'WorkerPoolHandler': '.worker_pool_handler.worker_pool_handler',
+}
 
 __all__ = [
     'PreparationHandler',
     'RequestConsumerHandler',
     'GRPCHandler',
-]
\ No newline at end of file
+    'WorkerPoolHandler',
+]
+
+
+def __getattr__ (
+    name: str,
+) -> type:
+
+    if name not in _HANDLERS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_HANDLERS[name], __name__), name)
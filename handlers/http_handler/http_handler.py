@@ -1,14 +1,39 @@
 """
-This module defines the `HTTPHandler` class, which handles HTTP requests by parsing them, verifying REST methods, 
-and sending appropriate responses based on the defined routes.
+This module defines the `HTTPHandler` class, which handles HTTP requests by routing them to their handlers
+and building appropriate responses based on the defined routes.
 """
 
 import asyncio
-import socket
+import copy
+import inspect
 
-from typing import Callable
+from typing import Any
 
-from exceptions.handler_exceptions.invalid_rest_operation_type import InvalidRestOperationType
+from compression.response_compressor.response_compressor import ResponseCompressor
+
+from configs.compression_config.compression_config import CompressionConfig
+
+from entity_tags.entity_tags import (
+    get_entity_tag,
+    hash_entity_tag,
+    make_entity_tag,
+    matches_if_none_match,
+    not_modified,
+)
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+from parsers.request_parser.http_request import READ_METHODS, HTTPRequest
+from parsers.request_parser.request_body import PAYLOAD_TOO_LARGE
+
+from response_cache.response_cache import ResponseCache
+
+from returnables.constant_response.constant_response import ConstantResponse
+from returnables.file_response.file_response import FileResponse
+from returnables.response.response import Response
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+from route_registry.router_registry import RouteRegistry
 
 from utils.static.privacy.privacy import privatemethod
 
@@ -16,150 +41,399 @@ from utils.static.privacy.privacy import privatemethod
 class HTTPHandler:
     
     """
-    A class that handles HTTP requests, verifies REST operation types, executes the corresponding handler,
-    and sends responses back to the client.
+    A class that handles HTTP requests, executes the handler of the matching route,
+    and builds the responses sent back to the client.
+
+    Attributes:
+        compressor (ResponseCompressor | None): The compressor of the responses of the routes,
+                                                or None when compression is disabled.
+        response_cache (ResponseCache): The cache of the encoded responses of cacheable routes.
     """
+
+    def __init__ (
+        self,
+        compression_config: CompressionConfig | None = None,
+        response_cache_size: int = 33554432,
+    ) -> None:
+
+        """
+        Initializes the HTTP handler.
+
+        Args:
+            compression_config (CompressionConfig | None, optional): The settings of response compression.
+                                                                     Defaults to None, disabling compression.
+            response_cache_size (int, optional): The maximum total size of the cached response bodies,
+                                                 in bytes. Defaults to 32 MiB.
+        """
+
+        self.compressor = ResponseCompressor(compression_config) if compression_config is not None else None
+        self.response_cache = ResponseCache(response_cache_size)
     
     async def handle_http_request (
         self, 
-        data: str, 
-        path: str, 
-        parsed_path: str, 
-        client_socket: socket.socket,
-        http_routes: dict,
-    ) -> None:
+        request: HTTPRequest,
+        router_registry: RouteRegistry,
+    ) -> Response:
         
         """
-        Handles an HTTP request by verifying the method, getting the corresponding handler,
-        and sending a response.
+        Handles an HTTP request by getting the route matching its method and path,
+        and building a response.
+
+        A path that exists but does not serve the method is answered with a 405 and the
+        precomputed `Allow` header of the path, and an unknown path with a 404.
+
+        The parameters captured by a dynamic route are stored on the request and passed
+        to the handler as keyword arguments. The route's `max_body_size`, or the server
+        default already set on the request body, bounds the body the handler may read.
+        A body announced larger than that is rejected before the handler runs. The connection
+        is closed after the response when the body could not be read, or when the handler
+        left part of a streamed body unread.
 
         Args:
-            data (str): The raw HTTP request data.
-            path (str): The path extracted from the HTTP request.
-            parsed_path (str): The parsed URL path.
-            client_socket (socket.socket): The client socket to send the response.
-            http_routes (dict): A dictionary mapping paths to route definitions, including handler functions.
+            request (HTTPRequest): The request being served.
+            router_registry (RouteRegistry): The registry matching request paths to routes.
+
+        A handler may return a `Response`, which is sent as it is, bytes sent as a plain body,
+        a generator or an asynchronous generator, whose items are streamed as a chunked body,
+        or any other value, which is converted to a string. When compression is enabled, the response
+        is compressed with the coding negotiated from the `Accept-Encoding` header of the request.
+
+        The response of a GET or HEAD request is served from the response cache while a fresh entry
+        matches its path, query and varying headers, without running the handler. Responses of routes
+        with a `cache_ttl`, and responses with a shared `Cache-Control` lifetime, are stored in it.
+
+        The encoded response of a constant route is written without running its handler.
+
+        On a route with `etag` enabled, the response of a GET or HEAD request gets a strong `ETag`,
+        and is replaced by a bodiless 304 when it matches the `If-None-Match` header of the request.
 
         Returns:
-            None
+            Response: The response to send to the client, rendered with `request.keep_alive`.
         """
-        
-        if parsed_path.path == "/favicon.ico":
-            return
 
         try:
-            self._verify_rest_method (
-                data, 
-                path,
-                http_routes,
-            )
-            handler = self._get_handler (
-                parsed_path.path,
-                http_routes
+            route, request.path_params, allow = self._get_route (
+                request.method,
+                request.path,
+                router_registry,
             )
 
-            if handler:
-                response_body = await self._execute_handler(handler)
-                status_line = "HTTP/1.1 200 OK\r\n"
+            if route:
+                response = route.get('constant_response') or self.response_cache.get(request)
+                if response is None:
+                    response = await self._handle_route(route, request)
+                if route.get('etag') and response.status_code == 200 and request.method in READ_METHODS:
+                    etag = get_entity_tag(response)
+                    if etag is not None and matches_if_none_match(request.headers.get('if-none-match'), etag):
+                        response = not_modified(etag, response)
+            elif allow:
+                response = Response("405 Method Not Allowed", 405, raw_headers=allow)
             else:
-                response_body = "404 Not Found"
-                status_line = "HTTP/1.1 404 Not Found\r\n"
+                response = Response("404 Not Found", 404)
+
+        except SocketIOMalformedRequestError as e:
+            request.keep_alive = False
+            return self._build_error(e.status_line)
 
         except Exception as e:
-            response_body = f"500 Internal Server Error: {e}"
-            status_line = "HTTP/1.1 500 Internal Server Error\r\n"
-
-        self._send_response (
-            client_socket, 
-            status_line, 
-            response_body,
-        )
+            response = Response(f"500 Internal Server Error: {e}", 500)
+
+        if not request.body.is_complete:
+            request.keep_alive = False
+
+        return response
     
     @privatemethod
-    def _get_handler (
+    async def _handle_route (
+        self,
+        route: dict,
+        request: HTTPRequest,
+    ) -> Response:
+        
+        """
+        Runs the handler of a route and builds its response, compressing and caching it when enabled.
+
+        When the `etag` of the route is a version function, it is called first, and a request whose
+        `If-None-Match` header matches the version is answered with a 304 without running the handler.
+        Otherwise the `ETag` of the response is the version, or the hash of the body when `etag` is True.
+        Streamed and file responses are never tagged, as their body is not held by the response.
+
+        The response of a constant route is frozen into a `ConstantResponse` stored on the route, on
+        the first response, or once the handler returned the same response `constant` times in a row.
+        Constant responses are not compressed.
+
+        Args:
+            route (dict): The route definition matched by the request.
+            request (HTTPRequest): The request being served.
+
+        Returns:
+            Response: The response of the handler.
+
+        Raises:
+            SocketIOMalformedRequestError: If the announced `Content-Length` exceeds the body limit of the route.
+        """
+        
+        etag = route.get('etag')
+        conditional = bool(etag) and request.method in READ_METHODS
+        version_tag = None
+        if conditional and callable(etag):
+            version_tag = make_entity_tag(await self._get_version(route, request))
+            if matches_if_none_match(request.headers.get('if-none-match'), version_tag):
+                return not_modified(version_tag)
+
+        self._limit_body(request, route)
+        response = await self._execute_handler(route, request)
+        if inspect.isgenerator(response) or inspect.isasyncgen(response):
+            return StreamingResponse(response)
+        if not isinstance(response, Response):
+            response = Response(response)
+        if (
+            conditional
+            and response.status_code == 200
+            and not isinstance(response, (StreamingResponse, FileResponse))
+            and get_entity_tag(response) is None
+        ):
+            response = self._set_entity_tag(response, version_tag or hash_entity_tag(response.body))
+        if route.get('constant') and self._is_constant(route, response):
+            route['constant_response'] = ConstantResponse(response)
+            return route['constant_response']
+        if self.compressor is not None:
+            response = await self.compressor.compress(request, response)
+        self.response_cache.store(request, response, route.get('cache_ttl'))
+        return response
+
+    async def build_constant_responses (
+        self,
+        router_registry: RouteRegistry,
+    ) -> None:
+        
+        """
+        Runs the handler of every route declared constant once, and stores its encoded response.
+
+        Constant routes neither capture path parameters nor take the request, so their handlers
+        are called without arguments. Only GET and HEAD routes are built, as a handler of any
+        other method may have effects.
+
+        Args:
+            router_registry (RouteRegistry): The registry of the compiled routes.
+        """
+        
+        for route in (router_registry.table or router_registry.compile()).routes.values():
+            if (
+                route.get('constant') is True
+                and 'constant_response' not in route
+                and READ_METHODS.issuperset(route['methods'])
+            ):
+                response = route['handler']()
+                if inspect.isawaitable(response):
+                    response = await response
+                if not isinstance(response, Response):
+                    response = Response(response)
+                if route.get('etag') is True and response.status_code == 200 and get_entity_tag(response) is None:
+                    response = self._set_entity_tag(response, hash_entity_tag(response.body))
+                if self._is_constant(route, response):
+                    route['constant_response'] = ConstantResponse(response)
+
+    @privatemethod
+    def _set_entity_tag (
+        self,
+        response: Response,
+        etag: str,
+    ) -> Response:
+        
+        """
+        Returns a copy of a response with an `ETag` header, leaving the response of the handler untouched.
+
+        Args:
+            response (Response): The response of the handler.
+            etag (str): The quoted entity tag.
+
+        Returns:
+            Response: The tagged response.
+        """
+        
+        response = copy.copy(response)
+        response.raw_headers += f"ETag: {etag}\r\n".encode()
+        response._header_block = None
+        return response
+
+    @privatemethod
+    def _is_constant (
+        self,
+        route: dict,
+        response: Response,
+    ) -> bool:
+        
+        """
+        Checks whether the response of a constant route can be frozen.
+
+        A route declared with `constant=True` is frozen on its first response. A route declared
+        with a number of responses is frozen once its handler returned the same status, headers
+        and body that many times in a row, counted on the route.
+
+        Args:
+            route (dict): The route definition matched by the request.
+            response (Response): The response of the handler.
+
+        Returns:
+            bool: True if the response is frozen for the route.
+        """
+        
+        if isinstance(response, (StreamingResponse, FileResponse)):
+            return False
+        
+        constant = route['constant']
+        if constant is True:
+            return True
+        
+        fingerprint = (response.status_code, response.media_type, tuple(response.headers.items()), response.raw_headers, response.body)
+        previous, streak = route.get('constant_streak', (None, 0))
+        streak = streak + 1 if fingerprint == previous else 1
+        route['constant_streak'] = (fingerprint, streak)
+        return streak >= constant
+
+    @privatemethod
+    async def _get_version (
+        self,
+        route: dict,
+        request: HTTPRequest,
+    ) -> Any:
+        
+        """
+        Calls the version function of a route, awaiting it if it is asynchronous.
+
+        The function receives the same arguments as the handler of the route.
+
+        Args:
+            route (dict): The route definition matched by the request.
+            request (HTTPRequest): The request being served.
+
+        Returns:
+            Any: The version of the resource served by the route.
+        """
+        
+        kwargs = dict(request.path_params)
+        if route.get('etag_wants_request'):
+            kwargs['request'] = request
+        version = route['etag'](**kwargs)
+        if inspect.isawaitable(version):
+            version = await version
+        return version
+
+    @privatemethod
+    def _limit_body (
+        self,
+        request: HTTPRequest,
+        route: dict,
+    ) -> None:
+        
+        """
+        Applies the body size limit of the route to the request.
+
+        Args:
+            request (HTTPRequest): The request being served.
+            route (dict): The route definition matched by the request.
+
+        Raises:
+            SocketIOMalformedRequestError: If the announced `Content-Length` exceeds the limit.
+        """
+        
+        body = request.body
+        if route.get('max_body_size') is not None:
+            body.max_size = route['max_body_size']
+        
+        if body.max_size is not None and (body.content_length or 0) > body.max_size:
+            raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "body too large")
+
+    @privatemethod
+    def _get_route (
         self, 
+        method: str,
         path: str,
-        http_routes: dict,
-    ) -> Callable[..., None]:
+        router_registry: RouteRegistry,
+    ) -> tuple[dict | None, dict, bytes | None]:
         
         """
-        Retrieves the handler function for a given path from the route definitions.
+        Retrieves the route definition for a given method and path.
 
         Args:
+            method (str): The HTTP method of the request.
             path (str): The path of the HTTP request.
-            http_routes (dict): A dictionary mapping paths to route definitions, including handler functions.
+            router_registry (RouteRegistry): The registry matching request paths to routes.
 
         Returns:
-            Callable[..., None]: The handler function for the requested path, or None if no handler is found.
+            tuple[dict | None, dict, bytes | None]: The route definition, or None if no route is found,
+                                                  the parameters captured from the path, and the
+                                                  `Allow` header line of a path not serving the method.
         """
         
-        route = http_routes.get(path)
-        return route['handler'] if route else None
+        return router_registry.lookup(method, path)
 
     @privatemethod
     async def _execute_handler (
         self, 
-        handler: Callable[..., None],
-    ) -> str:
+        route: dict,
+        request: HTTPRequest,
+    ) -> Any:
         
         """
-        Executes the given handler function, awaiting it if it is asynchronous.
+        Executes the handler of the given route, awaiting it if it is asynchronous.
+
+        The parameters captured from the path are passed as keyword arguments, and the request
+        as the `request` keyword argument to handlers declaring it.
+        Synchronous handlers run directly on the event loop, so blocking work
+        should be offloaded with the `IOBound` or `CPUBound` decorators.
 
         Args:
-            handler (Callable[..., None]): The handler function to be executed.
+            route (dict): The route definition matched by the request.
+            request (HTTPRequest): The request being served.
 
         Returns:
-            str: The response body returned by the handler function.
+            Any: The response or the response body returned by the handler function.
         """
 
-        return await handler() if asyncio.iscoroutinefunction(handler) else handler()
+        handler = route['handler']
+        kwargs = dict(request.path_params)
+        if route.get('wants_request'):
+            kwargs['request'] = request
+        if asyncio.iscoroutinefunction(handler):
+            return await handler(**kwargs)
+        return handler(**kwargs)
 
-    @privatemethod
-    def _send_response (
-        self, 
-        client_socket: socket.socket, 
-        status_line: str, 
-        body: str,
-    ) -> None:
+    def build_error_response (
+        self,
+        status_line: str,
+    ) -> bytes:
         
         """
-        Sends the HTTP response back to the client.
+        Builds the response answered to a request that cannot be served, such as a malformed request.
+
+        The connection is always closed after an error response.
 
         Args:
-            client_socket (socket.socket): The client socket to send the response to.
-            status_line (str): The status line of the HTTP response (e.g., "HTTP/1.1 200 OK").
-            body (str): The body content of the HTTP response.
+            status_line (str): The status line of the HTTP response (e.g., "HTTP/1.1 400 Bad Request").
 
         Returns:
-            None
+            bytes: The encoded HTTP response.
         """
-
-        response = f"{status_line}Content-Type: text/plain\r\n\r\n{body}"
-        client_socket.sendall(response.encode())
         
+        return b"".join(self._build_error(status_line).render(False))
+
     @privatemethod
-    def _verify_rest_method (
+    def _build_error (
         self,
-        data: str,
-        parsed_path: str,
-        http_routes: dict
-    ) -> None:
+        status_line: str,
+    ) -> Response:
         
         """
-        Verifies if the HTTP request method (e.g., GET, POST) is allowed for the requested path.
+        Builds the response of an error status line, whose body repeats the status.
 
         Args:
-            data (str): The raw HTTP request data.
-            parsed_path (str): The parsed URL path from the HTTP request.
-            http_routes (dict): A dictionary of routes and their allowed HTTP methods.
+            status_line (str): The status line of the HTTP response (e.g., "HTTP/1.1 400 Bad Request").
 
-        Raises:
-            InvalidRestOperationType: If the HTTP method is not allowed for the requested path.
+        Returns:
+            Response: The error response.
         """
         
-        operation_type = data.split('\n')[0].split('/')[0].strip(' ')
-        if operation_type not in http_routes[parsed_path]['methods']:
-            raise InvalidRestOperationType (
-                http_routes.get(parsed_path.path)['methods'],
-                operation_type,  
-            ) 
\ No newline at end of file
+        status = status_line.split(' ', 1)[1].strip()
+        return Response(status, int(status.split(' ', 1)[0]))
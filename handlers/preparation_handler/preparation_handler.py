@@ -8,6 +8,9 @@ by performing several key tasks:
   - Displaying a welcome message with server details.
   - Starting a file observer to watch for file changes and trigger a server restart.
 
+The master process of a worker pool only binds the shared socket and displays the welcome
+message: it runs no event loop and no file observer thread, so it can fork its workers safely.
+
 The `PreparationHandler` class assumes the existence of several attributes in the consuming class, 
 such as host, port, backlog, running flag, and methods for restarting and shutting down the server.
 """
@@ -38,6 +41,8 @@ class PreparationHandler:
         - self.host: The server host.
         - self.port: The server port.
         - self.backlog: The maximum number of queued connections.
+        - self.workers: The number of worker processes serving requests.
+        - self.reuse_port: A flag indicating whether each worker binds its own socket with SO_REUSEPORT.
         - self.running: A flag indicating whether the server is running.
         - self.server_socket: The socket instance.
         - self.restart: A method to restart the server.
@@ -53,7 +58,7 @@ class PreparationHandler:
 
         This method sequentially calls internal methods to:
           - Register signal handlers.
-          - Bind the server socket.
+          - Bind the server socket, unless every worker binds its own socket.
           - Display a welcome message.
           - Start the file observer.
 
@@ -62,10 +67,49 @@ class PreparationHandler:
         """
         
         await self._register_signal_handlers()
-        await self._bind_socket()
-        await self._print_hello_message()
+        if not self.reuse_port:
+            self._bind_socket()
+        self._print_hello_message()
         await self._start_file_observer()
     
+    def prepare_master (
+        self,
+    ) -> None:
+        
+        """
+        Perform the preparation steps of the master process of a worker pool.
+
+        This method binds the socket the workers inherit, unless every worker binds its own
+        socket, and displays a welcome message. It starts neither an event loop nor a thread,
+        so it can run before the workers are forked, and the master does not watch the files.
+
+        Raises:
+            OSError: If the socket cannot be bound to the specified address.
+        """
+        
+        if not self.reuse_port:
+            self._bind_socket()
+        self._print_hello_message()
+    
+    async def prepare_worker (
+        self,
+    ) -> None:
+        
+        """
+        Perform the preparation steps of a forked worker process.
+
+        This method registers the worker's own signal handlers and, when SO_REUSEPORT
+        is used, binds the worker's own listening socket. Otherwise the worker keeps
+        serving the socket inherited from the master process.
+
+        Raises:
+            Exception: Propagates any exceptions raised during the preparation steps.
+        """
+        
+        await self._register_signal_handlers()
+        if self.reuse_port:
+            self._bind_socket()
+    
     @privatemethod
     async def _register_signal_handlers (
         self,
@@ -78,7 +122,7 @@ class PreparationHandler:
         are received, the server's shutdown method is scheduled to run asynchronously.
 
         Note:
-            The consuming class must define a shutdown method that accepts a signal parameter.
+            The consuming class must define a shutdown method.
         """
         
         loop = asyncio.get_running_loop()
@@ -86,11 +130,11 @@ class PreparationHandler:
         for sig in (signal.SIGINT, signal.SIGTERM):
             loop.add_signal_handler (
                 sig, 
-                lambda: asyncio.create_task(self.shutdown(sig))
+                lambda: asyncio.create_task(self.shutdown())
             )
     
     @privatemethod
-    async def _bind_socket (
+    def _bind_socket (
         self,
     ) -> None:
         
@@ -100,7 +144,7 @@ class PreparationHandler:
         This method:
           - Marks the server as running.
           - Creates a new socket with IPv4 and TCP.
-          - Configures the socket to allow address reuse.
+          - Configures the socket to allow address reuse, and port reuse between workers.
           - Binds the socket to (self.host, self.port).
           - Starts listening for incoming connections with a defined backlog.
 
@@ -118,18 +162,26 @@ class PreparationHandler:
             socket.SO_REUSEADDR, 
             1,
         )
+        if self.reuse_port:
+            self.server_socket.setsockopt (
+                socket.SOL_SOCKET, 
+                socket.SO_REUSEPORT, 
+                1,
+            )
         self.server_socket.bind (
             (self.host, self.port)
         )
         self.server_socket.listen(self.backlog)
     
     @privatemethod 
-    async def _print_hello_message (
+    def _print_hello_message (
         self,
     ) -> None:
         
         print('Wecolme to SocketIO!')
         print(f"HTTP Server running on http://{self.host}:{self.port}")            
+        if self.workers > 1:
+            print(f"Serving with {self.workers} worker processes")
         if getattr(self, 'grpc_port', None):
             print(f"gRPC Server running on {self.host}:{self.grpc_port}")
         print('Quit the server with CONTROL-C.')
@@ -1,24 +1,128 @@
-import threading
+"""
+Module for consuming incoming client connections.
+
+This module contains the `RequestConsumerHandler` class, which runs the accept loop of the
+SocketIO server. Connections are accepted with the event loop's non-blocking `sock_accept`
+and every client is served by a coroutine scheduled on the same long-lived event loop,
+so no thread or event loop is created per request.
+
+The number of connections served at once can be capped. When the cap is reached the
+server either stops accepting, leaving the burst in the kernel backlog, or answers new
+clients with a precomputed `503 Service Unavailable` response and closes them.
+"""
+
+import asyncio
+import socket
+
+
+SERVICE_UNAVAILABLE_RESPONSE = (
+    b"HTTP/1.1 503 Service Unavailable\r\n"
+    b"Content-Length: 0\r\n"
+    b"Retry-After: 1\r\n"
+    b"Connection: close\r\n\r\n"
+)
+
 
 class RequestConsumerHandler:
-    
+
+    """
+    A helper class that accepts client connections and dispatches them to the router.
+
+    Note:
+      The class assumes that the following attributes are defined in the consuming class:
+        - self.running: A flag indicating whether the server is running.
+        - self.server_socket: The bound and listening socket instance.
+        - self.connections: A set holding the tasks of the connections being served.
+        - self.max_connections: The maximum number of connections served at once, or None.
+        - self.reject_overload: A flag choosing a 503 reply over pausing accepts at the cap.
+        - self.allowed_hosts: A list of client addresses allowed to connect.
+        - self.IORouter: The router used to process the requests of a connection.
+        - self.shutdown: A method to shut down the server.
+    """
+
     async def consume_requests (
         self,
     ) -> None:
+
+        """
+        Accept client connections until the server stops running.
+
+        The listening socket is switched to non-blocking mode and every accepted client
+        is handled by its own task on the running event loop. Tasks are kept in
+        `self.connections` while they run and are discarded as soon as they finish.
+
+        When `self.max_connections` is set, a semaphore bounds the connections being
+        served. A saturated server waits for a free slot before accepting again, or,
+        with `self.reject_overload`, accepts and immediately rejects the client.
+
+        Raises:
+            Exception: Any exception raised by the accept loop is printed and the
+                       server is shut down.
+        """
+
+        loop = asyncio.get_running_loop()
+        self.server_socket.setblocking(False)
         
+        limiter = None
+        if self.max_connections is not None:
+            limiter = asyncio.Semaphore(self.max_connections)
+
         try:
             while self.running:
-                client_socket, client_address = self.server_socket.accept()
+                if limiter and not self.reject_overload:
+                    await limiter.acquire()
                 
-                client_thread = threading.Thread (
-                    target=self.IORouter.handle_request, 
-                    args=(client_socket, self.allowed_hosts,)
+                client_socket, client_address = await loop.sock_accept (
+                    self.server_socket,
+                )
+                
+                if limiter and self.reject_overload:
+                    if limiter.locked():
+                        self._reject_connection(client_socket)
+                        continue
+                    await limiter.acquire()
+                
+                client_socket.setsockopt (
+                    socket.IPPROTO_TCP,
+                    socket.TCP_NODELAY,
+                    1,
                 )
-                client_thread.start()
-                self.threads.append(client_thread)
+
+                connection = loop.create_task (
+                    self.IORouter.handle_request (
+                        client_socket,
+                        self.allowed_hosts,
+                    )
+                )
+                self.connections.add(connection)
+                connection.add_done_callback(self.connections.discard)
+                if limiter:
+                    connection.add_done_callback(lambda _: limiter.release())
 
         except Exception as e:
             print(f"Error: {e}")
 
         finally:
-            await self.shutdown()
\ No newline at end of file
+            await self.shutdown()
+
+    def _reject_connection (
+        self,
+        client_socket: socket.socket,
+    ) -> None:
+
+        """
+        Reply to a client with the precomputed 503 response and close its connection.
+
+        The response fits in the socket's send buffer, so it is written with a single
+        non-blocking send and no task is scheduled for the rejected client.
+
+        Args:
+            client_socket (socket.socket): The socket of the rejected client.
+        """
+
+        try:
+            client_socket.send(SERVICE_UNAVAILABLE_RESPONSE)
+        except OSError:
+            pass
+        finally:
+            client_socket.close()
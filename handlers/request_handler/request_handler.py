@@ -3,18 +3,39 @@ This module defines a `RequestHandler` class responsible for handling incoming H
 It processes requests, verifies the host, and delegates the handling of WebSocket and HTTP requests to their respective handlers.
 """
 
+import asyncio
 import socket
 from urllib.parse import urlparse
-from typing import Any
+from typing import Any, Awaitable, Callable
+
+from configs.http_config.http_config import HTTPConfig
 
 from handlers.http_handler.http_handler import HTTPHandler
 from handlers.websocket_handler.websocket_handler import WebsocketHandler
 
-from parsers.request_parser.request_parser import RequestParser
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+from interfaces.request_parser_interface.request_parser_interface import RequestParserInterface
+
+from parsers.request_parser.header_view import HeaderView
+from parsers.request_parser.http_request import HTTPRequest
+from parsers.request_parser.request_body import RequestBody
+from parsers.request_parser.parser_backends import get_parser_backend
+from parsers.request_parser.request_head import RequestHead
+
+from returnables.file_response.file_response import FileResponse
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+from route_registry.router_registry import RouteRegistry
 
+from utils.socket_writer.socket_writer import send_buffers
 from utils.static.privacy.privacy import privatemethod
 from utils.static.privacy.protected_class import ProtectedClass
 
+
+CONTINUE_RESPONSE = b"HTTP/1.1 100 Continue\r\n\r\n"
+
+
 class RequestHandler(ProtectedClass):
     
     """
@@ -24,33 +45,43 @@ class RequestHandler(ProtectedClass):
     
     def __init__ (
         self,
+        http_config: HTTPConfig,
     ) -> None:
         
         """
         Initializes the `RequestHandler` with instances of WebSocket and HTTP handlers.
 
         Args:
-            None
+            http_config (HTTPConfig): The settings controlling how HTTP connections are served.
         """
         
+        self.http_config = http_config
+        self._parser_backend = get_parser_backend(http_config.parser_backend)
         self._websocket_handler = WebsocketHandler()
-        self._http_handler = HTTPHandler()
+        self._http_handler = HTTPHandler(http_config.compression, http_config.response_cache_size)
     
     async def handle_request (
         self, 
         client_socket: socket.socket,
-        http_routes: dict[str, Any],
+        router_registry: RouteRegistry,
         websocket_routes: dict[str, Any],
         allowed_hosts: list[int],
     ) -> None:
         
         """
-        Handles an incoming request by verifying the host, parsing the request, 
+        Handles the requests of a connection by verifying the host, parsing each request, 
         and delegating it to either the WebSocket or HTTP handler.
 
+        HTTP requests are served in a loop on the same connection while both sides
+        agree to keep it alive, until the connection has served
+        `max_keep_alive_requests` requests or stays idle for `keep_alive_timeout` seconds.
+        Pipelined requests received together are served as a batch whose responses are
+        written back in request order. A request whose body has not fully arrived is served
+        on its own, with its body streamed from the connection as the handler reads it.
+
         Args:
             client_socket (socket.socket): The socket representing the client's connection.
-            http_routes (dict): A dictionary of available HTTP routes for handling requests.
+            router_registry (RouteRegistry): The registry matching request paths to HTTP routes.
             websocket_routes (dict): A dictionary of available WebSocket routes for handling requests.
             allowed_hosts (list): A list of allowed IP addresses for the client.
 
@@ -59,64 +90,397 @@ class RequestHandler(ProtectedClass):
         """
         
         try:
-            request_data = await self._read_request(client_socket)
-            if not request_data:
-                return
-            
             if not await (
                 self._verify_host (
                     client_socket, 
                     allowed_hosts,
                 )
             ):
-                client_socket.close()
                 return
-
-            request_line, headers = RequestParser.parse_request(request_data)
-            method, path, _ = request_line.split(' ')
-            parsed_path = urlparse(path)
             
-            if self._is_websocket_request(headers):
-                await self._websocket_handler.handle_websocket (
-                    client_socket, 
-                    request_data, 
-                    headers, 
-                    websocket_routes,
-                )
-            else:
-                await self._http_handler.handle_http_request (
-                    request_data, 
-                    path, 
-                    parsed_path, 
-                    client_socket, 
-                    http_routes,
-                )
+            buffer = bytearray()
+            parser = self._parser_backend (
+                max_request_line_size=self.http_config.max_request_line_size,
+                max_header_size=self.http_config.max_header_size,
+                max_headers=self.http_config.max_headers,
+            )
+            served_requests = 0
             
+            while True:
+                batch = await self._read_requests (
+                    client_socket,
+                    buffer,
+                    parser,
+                )
+                if not batch:
+                    return
+                
+                streamed = batch[-1].chunked or batch[-1].body_end > len(buffer)
+                requests = []
+                
+                for head in batch:
+                    if self._is_websocket_request(head.headers):
+                        await self._write_responses(client_socket, requests, router_registry)
+                        await self._websocket_handler.handle_websocket (
+                            client_socket, 
+                            urlparse(head.target).path, 
+                            head.headers, 
+                            websocket_routes,
+                        )
+                        return
+                    
+                    served_requests += 1
+                    keep_alive = (
+                        served_requests < self.http_config.max_keep_alive_requests
+                        and self._is_keep_alive_request(head.version, head.headers)
+                    )
+                    requests.append (
+                        self._build_request(client_socket, buffer, head, keep_alive)
+                    )
+                    if not keep_alive:
+                        break
+                
+                if not await self._write_responses(client_socket, requests, router_registry):
+                    return
+                
+                if not streamed:
+                    del buffer[:batch[-1].body_end]
+        
+        except SocketIOMalformedRequestError as e:
+            await self._reject_request(client_socket, e.status_line)
         except Exception as e:
             print(f'Error processing request: {e}')
         finally:
             client_socket.close()
 
+    async def build_constant_responses (
+        self,
+        router_registry: RouteRegistry,
+    ) -> None:
+        
+        """
+        Builds the encoded responses of the constant routes.
+
+        Args:
+            router_registry (RouteRegistry): The registry of the compiled routes.
+        """
+        
+        await self._http_handler.build_constant_responses(router_registry)
+
     @privatemethod
-    async def _read_request (
+    async def _reject_request (
         self,
         client_socket: socket.socket,
-    ) -> str:
+        status_line: str,
+    ) -> None:
         
         """
-        Reads data from the client socket.
+        Answers a request that cannot be served with an error response before closing the connection.
 
         Args:
             client_socket (socket.socket): The socket representing the client's connection.
+            status_line (str): The status line of the error response.
 
         Returns:
-            str: The data read from the socket, decoded as a string, or an empty string if an error occurs.
+            None
         """
         
         try:
-            return client_socket.recv(1024).decode().strip()
-        except Exception:
-            return ''
+            loop = asyncio.get_running_loop()
+            await loop.sock_sendall (
+                client_socket, 
+                self._http_handler.build_error_response(status_line),
+            )
+        except OSError:
+            pass
+
+    @privatemethod
+    def _build_request (
+        self,
+        client_socket: socket.socket,
+        buffer: bytearray,
+        head: RequestHead,
+        keep_alive: bool,
+    ) -> HTTPRequest:
+        
+        """
+        Builds the request object handed to the HTTP handler.
+
+        A body already received along with its head is read from its place in the connection
+        buffer. Any other body is streamed: the head is removed from the buffer, and the body
+        is received from the connection as the handler reads it, answering an
+        `Expect: 100-continue` request right before the first receive.
+
+        Args:
+            client_socket (socket.socket): The socket representing the client's connection.
+            buffer (bytearray): The bytes received on the connection and not consumed yet.
+            head (RequestHead): The head of the request.
+            keep_alive (bool): Whether the connection stays open after the response.
+
+        Returns:
+            HTTPRequest: The request to serve.
+        """
+        
+        parsed_path = urlparse(head.target)
+        max_size = self.http_config.max_body_size
+        
+        if head.chunked or head.body_end > len(buffer):
+            del buffer[:head.body_start]
+            body = RequestBody (
+                buffer,
+                content_length=None if head.chunked else head.body_end - head.body_start,
+                chunked=head.chunked,
+                receive=self._body_receiver(client_socket, buffer, head),
+                max_size=max_size,
+            )
+        else:
+            body = RequestBody (
+                buffer,
+                head.body_start,
+                head.body_end - head.body_start,
+                max_size=max_size,
+            )
+        
+        return HTTPRequest (
+            method=head.method,
+            target=head.target,
+            path=parsed_path.path,
+            query=parsed_path.query,
+            version=head.version,
+            headers=head.headers,
+            body=body,
+            keep_alive=keep_alive,
+        )
+    
+    @privatemethod
+    def _body_receiver (
+        self,
+        client_socket: socket.socket,
+        buffer: bytearray,
+        head: RequestHead,
+    ) -> Callable[[], Awaitable[bool]]:
+        
+        """
+        Builds the coroutine function receiving the streamed body of a request.
+
+        Args:
+            client_socket (socket.socket): The socket representing the client's connection.
+            buffer (bytearray): The buffer the received data is appended to.
+            head (RequestHead): The head of the request.
+
+        Returns:
+            Callable[[], Awaitable[bool]]: A coroutine function receiving the next chunk of the body,
+                                           and returning `False` once the connection is closed.
+        """
+        
+        loop = asyncio.get_running_loop()
+        expect_continue = (
+            head.version == 'HTTP/1.1'
+            and head.headers.get('expect', '').lower() == '100-continue'
+        )
+        
+        async def receive (
+        ) -> bool:
+            
+            nonlocal expect_continue
+            if expect_continue:
+                expect_continue = False
+                await loop.sock_sendall(client_socket, CONTINUE_RESPONSE)
+            return await self._receive(loop, client_socket, buffer)
+        
+        return receive
+
+    @privatemethod
+    async def _write_responses (
+        self,
+        client_socket: socket.socket,
+        requests: list[HTTPRequest],
+        router_registry: RouteRegistry,
+    ) -> bool:
+        
+        """
+        Dispatches a batch of HTTP requests and writes their responses in request order.
+
+        Requests are dispatched one after the other, or concurrently when `pipeline_concurrency`
+        is enabled. The heads and bodies of all the responses of the batch are then sent with
+        a single scatter-gather write, up to the first response closing the connection.
+        A streaming response is written as its iterator produces the body, after the
+        responses before it, and is delimited by closing the connection for HTTP/1.0 clients.
+        A file response is written with `sendfile` after the responses before it. The response to
+        a HEAD request is written without its body, streamed or not, keeping its headers.
+
+        Args:
+            client_socket (socket.socket): The socket representing the client's connection.
+            requests (list[HTTPRequest]): The requests of the batch.
+            router_registry (RouteRegistry): The registry matching request paths to HTTP routes.
+
+        Returns:
+            bool: `True` if the connection stays open after the batch, otherwise `False`.
+        """
+        
+        if not requests:
+            return True
+        
+        if self.http_config.pipeline_concurrency and len(requests) > 1:
+            responses = await asyncio.gather(*(
+                self._http_handler.handle_http_request(request, router_registry)
+                for request in requests
+            ))
+        else:
+            responses = [
+                await self._http_handler.handle_http_request(request, router_registry)
+                for request in requests
+            ]
+        
+        buffers = []
+        for request, response in zip(requests, responses):
+            include_body = request.method != 'HEAD'
+            if isinstance(response, StreamingResponse):
+                chunked = request.version == 'HTTP/1.1'
+                request.keep_alive = request.keep_alive and (chunked or not include_body)
+                buffers.append(response.render_head(request.keep_alive, chunked))
+                if include_body:
+                    await send_buffers(client_socket, buffers)
+                    await response.stream(client_socket, chunked)
+                    buffers = []
+            elif isinstance(response, FileResponse):
+                buffers.extend(response.render(request.keep_alive))
+                if include_body:
+                    await send_buffers(client_socket, buffers)
+                    await response.send_file(client_socket)
+                    buffers = []
+            else:
+                buffers.extend(response.render(request.keep_alive, include_body))
+            if not request.keep_alive:
+                break
+        
+        await send_buffers(client_socket, buffers)
+        return request.keep_alive
+
+    @privatemethod
+    async def _read_requests (
+        self,
+        client_socket: socket.socket,
+        buffer: bytearray,
+        parser: RequestParserInterface,
+    ) -> list[RequestHead]:
+        
+        """
+        Reads every complete request available on the connection without blocking the event loop.
+
+        Data is received into the connection buffer until at least one request head is parsed.
+        A request is complete once the `Content-Length` bytes of its body have arrived as well.
+        All the complete requests found in the buffer are then returned together, which lets
+        pipelined requests sent in a single segment be served as one batch. The buffer is left
+        untouched, so the bodies can be sliced out of it until the batch has been served.
+
+        A request whose body is chunked or has not fully arrived is returned alone, once the
+        requests before it have been served, so its body can be streamed to the handler.
+
+        Args:
+            client_socket (socket.socket): The socket representing the client's connection.
+            buffer (bytearray): The bytes received on the connection and not consumed yet.
+            parser (RequestParserInterface): The incremental parser of the connection.
+
+        Returns:
+            list[RequestHead]: The heads of the requests to serve, or an empty list if the connection
+                               was closed or stayed idle for too long.
+
+        Raises:
+            SocketIOMalformedRequestError: If the first request of the batch is malformed or too large.
+                                           A malformed request later in the batch is left in the buffer
+                                           and raised on the next call, once the batch has been answered.
+        """
+        
+        loop = asyncio.get_running_loop()
+        requests = []
+        start = 0
+        head = None
+        
+        while True:
+            if head is None:
+                try:
+                    head = parser.parse_head(buffer, start)
+                except SocketIOMalformedRequestError:
+                    if requests:
+                        return requests
+                    raise
+            
+            if head is not None and not head.chunked and head.body_end <= len(buffer):
+                requests.append(head)
+                start = head.body_end
+                head = None
+                continue
+            
+            if requests:
+                return requests
+            
+            if head is not None:
+                return [head]
+            
+            if not await self._receive(loop, client_socket, buffer):
+                return []
+    
+    @privatemethod
+    async def _receive (
+        self,
+        loop: asyncio.AbstractEventLoop,
+        client_socket: socket.socket,
+        buffer: bytearray,
+    ) -> bool:
+        
+        """
+        Receives the next chunk of data of the connection into its buffer.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+            client_socket (socket.socket): The socket representing the client's connection.
+            buffer (bytearray): The buffer the received data is appended to.
+
+        Returns:
+            bool: `False` if the client closed the connection or stayed idle longer than
+                  the keep-alive timeout, otherwise `True`.
+        """
+        
+        try:
+            data = await asyncio.wait_for (
+                loop.sock_recv(client_socket, 65536),
+                self.http_config.keep_alive_timeout,
+            )
+        except asyncio.TimeoutError:
+            return False
+        
+        buffer += data
+        return bool(data)
+    
+    @privatemethod
+    def _is_keep_alive_request (
+        self,
+        version: str,
+        headers: HeaderView,
+    ) -> bool:
+        
+        """
+        Negotiates whether the connection stays open after the current request.
+
+        HTTP/1.1 connections are persistent unless the client sends `Connection: close`,
+        while HTTP/1.0 connections are only kept open on `Connection: keep-alive`.
+
+        Args:
+            version (str): The HTTP version of the request line (e.g., 'HTTP/1.1').
+            headers (HeaderView): The headers of the incoming request.
+
+        Returns:
+            bool: `True` if the connection should be kept alive, otherwise `False`.
+        """
+        
+        if not self.http_config.keep_alive:
+            return False
+        
+        connection = headers.get('connection', '').lower()
+        if version == 'HTTP/1.1':
+            return connection != 'close'
+        return connection == 'keep-alive'
     
     @privatemethod
     async def _verify_host (
@@ -142,19 +506,19 @@ class RequestHandler(ProtectedClass):
     @privatemethod
     def _is_websocket_request (
         self,
-        headers: dict[str, Any],
+        headers: HeaderView,
     ) -> bool:
         
         """
         Checks if the request is a WebSocket upgrade request based on the headers.
 
         Args:
-            headers (dict): The headers of the incoming request.
+            headers (HeaderView): The headers of the incoming request.
 
         Returns:
             bool: `True` if the request is a WebSocket upgrade request, otherwise `False`.
         """
         
-        return 'Upgrade' in headers and headers['Upgrade'].lower() == 'websocket'
+        return headers.get('upgrade', '').lower() == 'websocket'
         
     
\ No newline at end of file
@@ -3,6 +3,7 @@ This module defines a WebSocket handler that can manage WebSocket connections,
 receive and send messages, and handle the handshake process for WebSocket communication.
 """
 
+import asyncio
 import socket
 import base64
 import hashlib
@@ -26,7 +27,7 @@ class WebsocketHandler(ProtectedClass):
     async def handle_websocket (
         self, 
         client_socket: socket.socket, 
-        requests: str,
+        path: str,
         headers: dict,
         websockets: dict,
     ) -> None:
@@ -35,9 +36,12 @@ class WebsocketHandler(ProtectedClass):
         Handles the WebSocket handshake by verifying the WebSocket key, generating the accept key,
         and upgrading the connection to a WebSocket connection.
 
+        WebSocket route handlers use blocking socket calls, so once the handshake is done the
+        socket is switched back to blocking mode and the handler runs in the default executor.
+
         Args:
             client_socket (socket.socket): The socket representing the client's connection.
-            requests (str): The HTTP request string received from the client.
+            path (str): The path requested by the client.
             headers (dict): The headers from the HTTP request.
             websockets (dict): A dictionary of active WebSocket connections, indexed by their paths.
 
@@ -46,7 +50,6 @@ class WebsocketHandler(ProtectedClass):
         """
         
         sec_websocket_key = headers.get('Sec-WebSocket-Key')
-        path = requests.split('\n')[0].split(' ')[1]
         
         if not sec_websocket_key or path not in websockets:
             client_socket.close()
@@ -62,9 +65,15 @@ class WebsocketHandler(ProtectedClass):
             "Connection: Upgrade\r\n"
             f"Sec-WebSocket-Accept: {accept_key}\r\n\r\n"
         )
-        client_socket.send(response.encode())
+        loop = asyncio.get_running_loop()
+        await loop.sock_sendall(client_socket, response.encode())
         
-        websockets[path](client_socket)
+        client_socket.setblocking(True)
+        await loop.run_in_executor (
+            None,
+            websockets[path],
+            client_socket,
+        )
     
     def receive_message (
         self, 
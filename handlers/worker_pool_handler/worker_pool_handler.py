@@ -0,0 +1,182 @@
+"""
+Module for running a SocketIO server as a pool of pre-forked worker processes.
+
+This module contains the `WorkerPoolHandler` class, which lets a master process fork
+several workers that each run their own event loop and accept connections, so the
+server is no longer limited to a single core by the GIL.
+
+When the platform supports `SO_REUSEPORT`, every worker binds its own listening socket
+on the same address and the kernel balances new connections between them. Otherwise
+the master binds the listening socket before forking and the workers inherit it.
+"""
+
+import asyncio
+import os
+import signal
+import time
+import traceback
+
+
+class WorkerPoolHandler:
+
+    """
+    A helper class that forks, supervises and respawns the worker processes of the server.
+
+    The master forks and supervises the workers from the main thread, before any event loop
+    or thread is started, so a worker never inherits the state of a running event loop or of
+    a thread holding a lock. The master therefore runs no event loop and no file observer:
+    it only binds the shared socket, when needed, and waits for its workers.
+
+    Note:
+      The class assumes that the following attributes are defined in the consuming class:
+        - self.workers: The number of worker processes to run.
+        - self.worker_pids: A dictionary mapping worker process ids to worker indexes.
+        - self.running: A flag indicating whether the server is running.
+        - self.connections: A set holding the tasks of the connections being served.
+        - self.prepare_master: A method preparing the master process.
+        - self.serve_worker: A coroutine method serving requests in a worker process until it shuts down.
+    """
+
+    RESPAWN_DELAY = 1.0
+    """
+    Minimum lifetime of a worker, in seconds, below which its respawn is delayed
+    to avoid a fork loop when workers crash on startup.
+    """
+
+    def supervise_workers (
+        self,
+    ) -> None:
+
+        """
+        Prepare the master process, fork the workers and keep them alive until the server shuts down.
+
+        Must be called from the main thread, before any event loop or thread is started.
+        SIGINT and SIGTERM stop the workers and end the supervision once they have exited.
+        """
+
+        self.running = True
+        self.prepare_master()
+
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self._stop_supervising)
+
+        self._supervise()
+
+    def stop_workers (
+        self,
+    ) -> None:
+
+        """
+        Ask every running worker to shut down gracefully by sending it SIGTERM.
+        """
+
+        for pid in list(self.worker_pids):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self.worker_pids.pop(pid, None)
+
+    def _stop_supervising (
+        self,
+        signum: int,
+        frame: object,
+    ) -> None:
+
+        """
+        Handle a shutdown signal in the master: stop respawning workers and ask them to shut down.
+
+        Args:
+            signum (int): The number of the received signal.
+            frame (object): The frame interrupted by the signal.
+        """
+
+        self.running = False
+        self.stop_workers()
+
+    def _supervise (
+        self,
+    ) -> None:
+
+        """
+        Fork every worker, then wait for workers to exit and respawn them while the server runs.
+
+        Once the server stops, the loop keeps reaping the workers until all of them have exited.
+        """
+
+        started_at = {}
+        for worker_id in range(self.workers):
+            started_at[worker_id] = self._spawn_worker(worker_id)
+
+        while self.worker_pids:
+            try:
+                pid, status = os.waitpid(-1, 0)
+            except ChildProcessError:
+                break
+
+            worker_id = self.worker_pids.pop(pid, None)
+            if worker_id is None or not self.running:
+                continue
+
+            if time.monotonic() - started_at[worker_id] < self.RESPAWN_DELAY:
+                time.sleep(self.RESPAWN_DELAY)
+            if not self.running:
+                continue
+
+            print (
+                f"Worker {worker_id} (pid {pid}) exited with code "
+                f"{os.waitstatus_to_exitcode(status)}, respawning."
+            )
+            started_at[worker_id] = self._spawn_worker(worker_id)
+
+    def _spawn_worker (
+        self,
+        worker_id: int,
+    ) -> float:
+
+        """
+        Fork a single worker process.
+
+        The child restores the default signal handlers, which its event loop then replaces,
+        runs the worker on a fresh event loop and never returns into the master's code:
+        it exits as soon as its event loop finishes.
+
+        Args:
+            worker_id (int): The index of the worker in the pool.
+
+        Returns:
+            float: The monotonic time at which the worker was started.
+        """
+
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 0
+            try:
+                for sig in (signal.SIGINT, signal.SIGTERM):
+                    signal.signal(sig, signal.SIG_DFL)
+                asyncio.run(self._serve_worker(worker_id))
+            except BaseException:
+                traceback.print_exc()
+                exit_code = 1
+            finally:
+                os._exit(exit_code)
+
+        self.worker_pids[pid] = worker_id
+        return time.monotonic()
+
+    async def _serve_worker (
+        self,
+        worker_id: int,
+    ) -> None:
+
+        """
+        Reset the state inherited from the master and serve requests in the worker.
+
+        Args:
+            worker_id (int): The index of the worker in the pool.
+        """
+
+        self.worker_id = worker_id
+        self.worker_pids = {}
+        self.connections = set()
+
+        await self.serve_worker()
@@ -0,0 +1,61 @@
+"""
+Base class for HTTP request parser backends.
+
+This module defines the abstract base class `RequestParserInterface` which every request
+parser backend implements. A backend is created once per connection and parses the heads
+of the requests received on that connection, so the request handler, and the route
+handlers after it, cannot tell which backend parsed a request.
+"""
+
+from abc import ABC, abstractmethod
+
+from parsers.request_parser.request_head import RequestHead
+
+
+class RequestParserInterface(ABC):
+
+    """
+    Abstract base class for HTTP request parser backends.
+
+    Subclasses must implement the abstract methods:
+    - `is_available`: Tells whether the backend can be used on this interpreter.
+    - `parse_head`: Parses the head of the next request of the connection buffer.
+    """
+
+    @classmethod
+    @abstractmethod
+    def is_available (
+        cls,
+    ) -> bool:
+
+        """
+        Abstract method telling whether the backend can be used.
+
+        Returns:
+            bool: False if an optional dependency of the backend is not installed.
+        """
+
+        ...
+
+    @abstractmethod
+    def parse_head (
+        self,
+        buffer: bytearray,
+        start: int = 0,
+    ) -> RequestHead | None:
+
+        """
+        Abstract method parsing the head of the request starting at `start` in the connection buffer.
+
+        Args:
+            buffer (bytearray): The bytes received on the connection.
+            start (int): The offset of the request in the buffer.
+
+        Returns:
+            RequestHead | None: The parsed head, or None if the head is not complete yet.
+
+        Raises:
+            SocketIOMalformedRequestError: If the request is malformed or exceeds a size limit.
+        """
+
+        ...
@@ -0,0 +1,87 @@
+"""
+This module defines the `FormData` and `UploadFile` classes, which hold the result of parsing
+a `multipart/form-data` request body.
+"""
+
+from dataclasses import dataclass, field
+from tempfile import SpooledTemporaryFile
+
+from parsers.request_parser.header_view import HeaderView
+
+
+@dataclass
+class UploadFile:
+
+    """
+    A file part of a `multipart/form-data` body.
+
+    The content is kept in memory while it is small and moved to a temporary file on disk
+    once it grows over the spooling threshold of the parser.
+
+    Attributes:
+        name (str): The name of the form field.
+        filename (str): The name of the file given by the client.
+        content_type (str): The media type of the file given by the client.
+        headers (HeaderView): The headers of the part.
+        file (SpooledTemporaryFile): The content of the file.
+        size (int): The size of the file, in bytes.
+    """
+
+    name: str
+    filename: str
+    content_type: str
+    headers: HeaderView
+    file: SpooledTemporaryFile
+    size: int = 0
+
+    def read (
+        self,
+    ) -> bytes:
+
+        """
+        Reads the whole content of the file.
+
+        Returns:
+            bytes: The content of the file.
+        """
+
+        self.file.seek(0)
+        return self.file.read()
+
+    def close (
+        self,
+    ) -> None:
+
+        """
+        Closes the file, removing it from disk if it was spooled.
+        """
+
+        self.file.close()
+
+
+@dataclass
+class FormData:
+
+    """
+    The fields and files of a `multipart/form-data` body.
+
+    When a name is sent more than once, the last part with that name is kept.
+
+    Attributes:
+        fields (dict[str, str]): The values of the form fields, by name.
+        files (dict[str, UploadFile]): The uploaded files, by field name.
+    """
+
+    fields: dict[str, str] = field(default_factory=dict)
+    files: dict[str, UploadFile] = field(default_factory=dict)
+
+    def close (
+        self,
+    ) -> None:
+
+        """
+        Closes every uploaded file.
+        """
+
+        for upload in self.files.values():
+            upload.close()
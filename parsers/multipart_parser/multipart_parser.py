@@ -0,0 +1,308 @@
+"""
+This module defines the `MultipartParser` class, a streaming parser for `multipart/form-data`
+request bodies that keeps small fields in memory and spools large files to disk.
+"""
+
+import asyncio
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from tempfile import SpooledTemporaryFile
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+from parsers.multipart_parser.form_data import FormData, UploadFile
+from parsers.request_parser.header_view import HeaderView
+
+
+BAD_REQUEST = "HTTP/1.1 400 Bad Request\r\n"
+PAYLOAD_TOO_LARGE = "HTTP/1.1 413 Payload Too Large\r\n"
+UNSUPPORTED_MEDIA_TYPE = "HTTP/1.1 415 Unsupported Media Type\r\n"
+
+PARAMETER_PATTERN = re.compile(r';\s*([^\s=;]+)\s*=\s*("(?:[^"\\]|\\.)*"|[^;]*)')
+
+
+class MultipartParser:
+
+    """
+    A streaming parser for `multipart/form-data` request bodies.
+
+    The body is parsed chunk by chunk as it is received. Only the bytes that may hold the start
+    of the next boundary are kept between chunks, so the memory used while parsing does not grow
+    with the size of the upload. Fields are collected in memory up to `max_field_size`, while
+    file parts are written as they arrive to a `SpooledTemporaryFile`, which moves them to disk
+    once they grow over `spool_threshold`.
+
+    Writes to a file held in memory are made on the event loop, as they only copy bytes. Once a
+    file grows over `spool_threshold`, the write moving it to disk and every write after it may
+    block on the disk, so they are made in the default executor of the loop instead, trading a
+    thread hop per chunk for an event loop that keeps serving other connections.
+    """
+
+    def __init__ (
+        self,
+        max_parts: int = 100,
+        max_field_size: int = 65536,
+        max_part_header_size: int = 16384,
+        spool_threshold: int = 1048576,
+        max_file_size: int | None = None,
+    ) -> None:
+
+        """
+        Initializes the parser with the limits of a form.
+
+        Args:
+            max_parts (int): Maximum number of parts, fields and files included.
+            max_field_size (int): Maximum size of a field kept in memory, in bytes.
+            max_part_header_size (int): Maximum size of the headers of a part, in bytes.
+            spool_threshold (int): Size over which a file is moved from memory to disk, in bytes.
+            max_file_size (int | None): Maximum size of each file, in bytes, or None to only
+                                        bound files by the maximum size of the request body.
+        """
+
+        self.max_parts = max_parts
+        self.max_field_size = max_field_size
+        self.max_part_header_size = max_part_header_size
+        self.spool_threshold = spool_threshold
+        self.max_file_size = max_file_size
+
+    async def parse (
+        self,
+        body: AsyncIterator[bytes],
+        content_type: str,
+    ) -> FormData:
+
+        """
+        Parses a `multipart/form-data` body as it is received.
+
+        Args:
+            body (AsyncIterator[bytes]): The body of the request, such as a `RequestBody`.
+            content_type (str): The `Content-Type` header of the request.
+
+        Returns:
+            FormData: The fields and files of the form.
+
+        Raises:
+            SocketIOMalformedRequestError: If the request is not a multipart form, the body is
+                                           malformed, or a limit of the parser is exceeded.
+        """
+
+        loop = asyncio.get_running_loop()
+        delimiter = b'\r\n--' + self._get_boundary(content_type)
+        chunks = aiter(body)
+        buffer = bytearray(b'\r\n')
+        form = FormData()
+
+        async def fill (
+        ) -> None:
+
+            chunk = await anext(chunks, None)
+            if chunk is None:
+                raise SocketIOMalformedRequestError(BAD_REQUEST, "incomplete multipart body")
+            buffer.extend(chunk)
+
+        try:
+            while (index := buffer.find(delimiter)) == -1:
+                del buffer[:max(0, len(buffer) - len(delimiter))]
+                await fill()
+            del buffer[:index + len(delimiter)]
+
+            parts = 0
+            while True:
+                while len(buffer) < 2:
+                    await fill()
+                if buffer.startswith(b'--'):
+                    break
+
+                parts += 1
+                if parts > self.max_parts:
+                    raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "too many multipart parts")
+
+                headers = await self._read_part_headers(buffer, fill)
+                name, filename = self._get_disposition(headers)
+
+                if filename is None:
+                    value = bytearray()
+                    async for data in self._read_part_data(buffer, fill, delimiter):
+                        if len(value) + len(data) > self.max_field_size:
+                            raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "multipart field too large")
+                        value += data
+                    form.fields[name] = value.decode('utf-8', 'replace')
+                else:
+                    upload = UploadFile (
+                        name=name,
+                        filename=filename,
+                        content_type=headers.get('content-type', 'application/octet-stream'),
+                        headers=headers,
+                        file=SpooledTemporaryFile(max_size=self.spool_threshold),
+                    )
+                    if name in form.files:
+                        form.files[name].close()
+                    form.files[name] = upload
+                    async for data in self._read_part_data(buffer, fill, delimiter):
+                        size = upload.size + len(data)
+                        if self.max_file_size is not None and size > self.max_file_size:
+                            raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "multipart file too large")
+                        if size > self.spool_threshold:
+                            await loop.run_in_executor(None, upload.file.write, data)
+                        else:
+                            upload.file.write(data)
+                        upload.size = size
+                    upload.file.seek(0)
+
+            async for _ in chunks:
+                pass
+
+        except BaseException:
+            form.close()
+            raise
+
+        return form
+
+    def _get_boundary (
+        self,
+        content_type: str,
+    ) -> bytes:
+
+        """
+        Extracts the boundary of a multipart body from its `Content-Type` header.
+
+        Args:
+            content_type (str): The `Content-Type` header of the request.
+
+        Returns:
+            bytes: The boundary of the body.
+
+        Raises:
+            SocketIOMalformedRequestError: If the request is not a multipart form with a valid boundary.
+        """
+
+        media_type, _, _ = content_type.partition(';')
+        if media_type.strip().lower() != 'multipart/form-data':
+            raise SocketIOMalformedRequestError(UNSUPPORTED_MEDIA_TYPE, "not a multipart form")
+
+        boundary = self._get_parameters(content_type).get('boundary', '')
+        if not 0 < len(boundary) <= 70:
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid multipart boundary")
+
+        return boundary.encode('latin-1')
+
+    async def _read_part_headers (
+        self,
+        buffer: bytearray,
+        fill: Callable[[], Awaitable[None]],
+    ) -> HeaderView:
+
+        """
+        Reads the headers of the next part, right after its boundary.
+
+        Args:
+            buffer (bytearray): The unparsed bytes of the body.
+            fill (Callable[[], Awaitable[None]]): A coroutine function receiving the next chunk of the body.
+
+        Returns:
+            HeaderView: The headers of the part.
+
+        Raises:
+            SocketIOMalformedRequestError: If the headers are malformed or too large.
+        """
+
+        while (line_end := buffer.find(b'\r\n')) == -1:
+            if len(buffer) > self.max_part_header_size:
+                raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid multipart boundary")
+            await fill()
+
+        if buffer[:line_end].strip(b' \t'):
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid multipart boundary")
+
+        while (head_end := buffer.find(b'\r\n\r\n', line_end)) == -1:
+            if len(buffer) > self.max_part_header_size:
+                raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "multipart headers too large")
+            await fill()
+
+        if head_end - line_end > self.max_part_header_size:
+            raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "multipart headers too large")
+
+        raw = bytes(buffer[line_end + 2:head_end]) if head_end > line_end else b''
+        del buffer[:head_end + 4]
+        return HeaderView.parse(raw)
+
+    async def _read_part_data (
+        self,
+        buffer: bytearray,
+        fill: Callable[[], Awaitable[None]],
+        delimiter: bytes,
+    ) -> AsyncIterator[bytes]:
+
+        """
+        Yields the content of the current part until the next boundary, as it is received.
+
+        The bytes that could be the beginning of a boundary split across two chunks are held
+        back until the next chunk arrives.
+
+        Args:
+            buffer (bytearray): The unparsed bytes of the body.
+            fill (Callable[[], Awaitable[None]]): A coroutine function receiving the next chunk of the body.
+            delimiter (bytes): The boundary delimiter, including its leading CRLF.
+
+        Yields:
+            bytes: The next piece of the content of the part.
+        """
+
+        keep = len(delimiter) - 1
+        while (index := buffer.find(delimiter)) == -1:
+            if len(buffer) > keep:
+                yield bytes(buffer[:len(buffer) - keep])
+                del buffer[:len(buffer) - keep]
+            await fill()
+
+        if index:
+            yield bytes(buffer[:index])
+        del buffer[:index + len(delimiter)]
+
+    def _get_disposition (
+        self,
+        headers: HeaderView,
+    ) -> tuple[str, str | None]:
+
+        """
+        Extracts the field name and file name of a part from its `Content-Disposition` header.
+
+        Args:
+            headers (HeaderView): The headers of the part.
+
+        Returns:
+            tuple[str, str | None]: The name of the field, and the name of the file or None for a field.
+
+        Raises:
+            SocketIOMalformedRequestError: If the part is not a named form-data part.
+        """
+
+        disposition = headers.get('content-disposition', '')
+        parameters = self._get_parameters(disposition)
+        if disposition.partition(';')[0].strip().lower() != 'form-data' or 'name' not in parameters:
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid multipart Content-Disposition")
+
+        return parameters['name'], parameters.get('filename')
+
+    def _get_parameters (
+        self,
+        value: str,
+    ) -> dict[str, str]:
+
+        """
+        Parses the parameters of a header value, such as `form-data; name="file"`.
+
+        Args:
+            value (str): The header value.
+
+        Returns:
+            dict[str, str]: The parameters, by lowercased name, with quoted values unquoted.
+        """
+
+        parameters = {}
+        for name, parameter in PARAMETER_PATTERN.findall(value):
+            parameter = parameter.strip()
+            if parameter.startswith('"'):
+                parameter = re.sub(r'\\(.)', r'\1', parameter[1:-1])
+            parameters[name.lower()] = parameter
+        return parameters
@@ -0,0 +1,202 @@
+"""
+This module defines the `HeaderView` class, a read-only, case-insensitive view over the raw
+header block of an HTTP request that only decodes the headers actually looked up.
+"""
+
+from collections.abc import Iterator, Mapping
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+
+BAD_REQUEST = "HTTP/1.1 400 Bad Request\r\n"
+
+
+class HeaderView(Mapping):
+
+    """
+    A lazy, case-insensitive mapping of request headers backed by the raw request head.
+
+    Parsing a head only records the offsets of every header name and value in the raw bytes.
+    A header is matched by comparing the length of its name first, and only names of the same
+    length are lowercased. Values are decoded from `memoryview` slices of the head the first time
+    they are looked up, and cached afterwards, so a route reading no header pays for no decoding.
+
+    Attributes:
+        raw (bytes): The raw request head the view is backed by.
+    """
+
+    __slots__ = ('raw', '_view', '_offsets', '_cache')
+
+    def __init__ (
+        self,
+        raw: bytes,
+        offsets: list[int],
+    ) -> None:
+
+        """
+        Initializes the view over a raw request head.
+
+        Args:
+            raw (bytes): The raw request head.
+            offsets (list[int]): A flat list holding, for every header, the start and end offsets
+                                 of its name followed by the start and end offsets of its value.
+        """
+
+        self.raw = raw
+        self._view = memoryview(raw)
+        self._offsets = offsets
+        self._cache = {}
+
+    @classmethod
+    def parse (
+        cls,
+        raw: bytes,
+        start: int = 0,
+    ) -> 'HeaderView':
+
+        """
+        Indexes the header lines of a raw request head without decoding them.
+
+        Args:
+            raw (bytes): The raw request head, without the final empty line.
+            start (int): The offset of the first header line in the head.
+
+        Returns:
+            HeaderView: The view over the headers of the head.
+
+        Raises:
+            SocketIOMalformedRequestError: If a header line is malformed.
+        """
+
+        offsets = []
+        end = len(raw)
+        position = start
+
+        while position < end:
+            line_end = raw.find(b'\r\n', position)
+            if line_end == -1:
+                line_end = end
+
+            colon = raw.find(b':', position, line_end)
+            if colon <= position or raw[position] in b' \t' or raw[colon - 1] in b' \t':
+                raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid header line")
+
+            offsets += (position, colon, colon + 1, line_end)
+            position = line_end + 2
+
+        return cls(raw, offsets)
+
+    def get (
+        self,
+        name: str,
+        default: str | None = None,
+    ) -> str | None:
+
+        """
+        Returns the value of the first header with the given name, compared case-insensitively.
+
+        Args:
+            name (str): The name of the header.
+            default (str | None): The value returned if the header is missing.
+
+        Returns:
+            str | None: The stripped value of the header, or `default` if it is missing.
+        """
+
+        key = name.lower()
+        if key in self._cache:
+            return self._cache[key]
+
+        for value_start, value_end in self._find(key):
+            value = str(self._view[value_start:value_end], 'latin-1').strip(' \t')
+            self._cache[key] = value
+            return value
+
+        return default
+
+    def get_all (
+        self,
+        name: str,
+    ) -> list[str]:
+
+        """
+        Returns the values of every header with the given name, compared case-insensitively.
+
+        Args:
+            name (str): The name of the header.
+
+        Returns:
+            list[str]: The stripped values of the headers, in the order they were received.
+        """
+
+        return [
+            str(self._view[value_start:value_end], 'latin-1').strip(' \t')
+            for value_start, value_end in self._find(name.lower())
+        ]
+
+    def __getitem__ (
+        self,
+        name: str,
+    ) -> str:
+
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def __contains__ (
+        self,
+        name: object,
+    ) -> bool:
+
+        return isinstance(name, str) and next(self._find(name.lower()), None) is not None
+
+    def __iter__ (
+        self,
+    ) -> Iterator[str]:
+
+        offsets = self._offsets
+        for index in range(0, len(offsets), 4):
+            yield str(self._view[offsets[index]:offsets[index + 1]], 'latin-1')
+
+    def __len__ (
+        self,
+    ) -> int:
+
+        return len(self._offsets) // 4
+
+    def __repr__ (
+        self,
+    ) -> str:
+
+        return f"HeaderView({dict(self.items())!r})"
+
+    def _find (
+        self,
+        key: str,
+    ) -> Iterator[tuple[int, int]]:
+
+        """
+        Yields the value offsets of every header whose lowercased name equals `key`.
+
+        A name that cannot be encoded in latin-1 matches no header, as no header name received can.
+
+        Args:
+            key (str): The lowercased name of the header.
+
+        Yields:
+            tuple[int, int]: The start and end offsets of a matching header value.
+        """
+
+        try:
+            encoded = key.encode('latin-1')
+        except UnicodeEncodeError:
+            return
+        length = len(encoded)
+        raw = self.raw
+        offsets = self._offsets
+
+        for index in range(0, len(offsets), 4):
+            name_start, name_end = offsets[index], offsets[index + 1]
+            if name_end - name_start == length and raw[name_start:name_end].lower() == encoded:
+                yield offsets[index + 2], offsets[index + 3]
@@ -0,0 +1,75 @@
+"""
+This module defines the `HTTPRequest` class, the request object handed to HTTP route handlers.
+"""
+
+from dataclasses import dataclass, field
+
+from parsers.multipart_parser.form_data import FormData
+from parsers.multipart_parser.multipart_parser import MultipartParser
+from parsers.request_parser.header_view import HeaderView
+from parsers.request_parser.request_body import RequestBody
+
+
+READ_METHODS = frozenset(('GET', 'HEAD'))
+"""
+The methods only reading a resource, whose responses may be cached, tagged with an `ETag`
+or encoded once for all.
+"""
+
+
+@dataclass
+class HTTPRequest:
+
+    """
+    An HTTP request being served.
+
+    Route handlers receive it when they declare a `request` parameter.
+
+    Attributes:
+        method (str): The request method (e.g., 'GET').
+        target (str): The request target, including the query string.
+        path (str): The path of the request target.
+        query (str): The query string of the request target, without the leading '?'.
+        version (str): The HTTP version of the request (e.g., 'HTTP/1.1').
+        headers (HeaderView): The lazy, case-insensitive view of the request headers.
+        body (RequestBody): The body of the request, read on demand.
+        keep_alive (bool): Whether the connection stays open after the response.
+        path_params (dict[str, str]): The parameters captured from the path by a dynamic route.
+    """
+
+    method: str
+    target: str
+    path: str
+    query: str
+    version: str
+    headers: HeaderView
+    body: RequestBody
+    keep_alive: bool = True
+    path_params: dict[str, str] = field(default_factory=dict)
+
+    async def form (
+        self,
+        parser: MultipartParser | None = None,
+    ) -> FormData:
+
+        """
+        Parses the `multipart/form-data` body of the request as it is received.
+
+        Small fields are kept in memory, while files are spooled to temporary files on disk
+        once they grow over the spooling threshold of the parser.
+
+        Args:
+            parser (MultipartParser | None): The parser to use, for custom limits.
+                                             Defaults to a parser with the default limits.
+
+        Returns:
+            FormData: The fields and files of the form.
+
+        Raises:
+            SocketIOMalformedRequestError: If the body is not a valid multipart form, or a limit is exceeded.
+        """
+
+        return await (parser or MultipartParser()).parse (
+            self.body,
+            self.headers.get('content-type', ''),
+        )
@@ -0,0 +1,48 @@
+"""
+This module selects the request parser backend used to parse the requests of every connection.
+"""
+
+from exceptions.socketio_exceptions.socketio_exceptions import SocketIOInproperParserBackendError
+
+from interfaces.request_parser_interface.request_parser_interface import RequestParserInterface
+
+from parsers.request_parser.streaming_request_parser import StreamingRequestParser
+
+
+PARSER_BACKENDS: dict[str, type[RequestParserInterface]] = {
+    'python': StreamingRequestParser,
+}
+"""
+The request parser backends by name, in the order 'auto' tries them.
+"""
+
+
+def get_parser_backend (
+    name: str = 'python',
+) -> type[RequestParserInterface]:
+
+    """
+    Returns the request parser backend with the given name.
+
+    With 'auto', the first available backend of `PARSER_BACKENDS` is returned.
+
+    Args:
+        name (str): The name of the backend, or 'auto'. Defaults to 'python'.
+
+    Returns:
+        type[RequestParserInterface]: The class of the backend.
+
+    Raises:
+        SocketIOInproperParserBackendError: If the backend is unknown or not available.
+    """
+
+    if name == 'auto':
+        return next (
+            backend for backend in PARSER_BACKENDS.values()
+            if backend.is_available()
+        )
+
+    backend = PARSER_BACKENDS.get(name)
+    if backend is None or not backend.is_available():
+        raise SocketIOInproperParserBackendError(name)
+    return backend
@@ -0,0 +1,272 @@
+"""
+This module defines the `RequestBody` class, which gives handlers streaming access to the body
+of an HTTP request delimited by `Content-Length` or sent with `Transfer-Encoding: chunked`.
+"""
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+
+BAD_REQUEST = "HTTP/1.1 400 Bad Request\r\n"
+PAYLOAD_TOO_LARGE = "HTTP/1.1 413 Payload Too Large\r\n"
+
+
+class RequestBody:
+
+    """
+    The body of an HTTP request, read from the connection buffer as the handler consumes it.
+
+    Handlers either `await body.read()` to get the whole body, or iterate over it with
+    `async for chunk in body` to process an upload piece by piece without holding it in memory.
+
+    A body that has already been received with its request head is sliced from the connection
+    buffer only when it is read. Otherwise, the body is streamed: bytes are received into the
+    connection buffer on demand and removed from it as soon as they are handed to the handler.
+
+    Attributes:
+        content_length (int | None): The announced length of the body, or None for a chunked body.
+        chunked (bool): True if the body uses `Transfer-Encoding: chunked`.
+        max_size (int | None): The maximum number of body bytes accepted, or None for no limit.
+    """
+
+    MAX_CHUNK_LINE_SIZE = 4096
+    """
+    Maximum size of a chunk size line or trailer line of a chunked body, in bytes.
+    """
+
+    def __init__ (
+        self,
+        buffer: bytearray,
+        start: int = 0,
+        content_length: int | None = 0,
+        chunked: bool = False,
+        receive: Callable[[], Awaitable[bool]] | None = None,
+        max_size: int | None = None,
+    ) -> None:
+
+        """
+        Initializes the body of a request.
+
+        Args:
+            buffer (bytearray): The bytes received on the connection.
+            start (int): The offset of the first byte of the body in the buffer.
+            content_length (int | None): The announced length of the body, or None for a chunked body.
+            chunked (bool): True if the body uses `Transfer-Encoding: chunked`.
+            receive (Callable[[], Awaitable[bool]] | None): A coroutine function receiving more data into
+                the buffer and returning False once the connection is closed. None when the whole body
+                is already in the buffer.
+            max_size (int | None): The maximum number of body bytes accepted.
+        """
+
+        self.content_length = content_length
+        self.chunked = chunked
+        self.max_size = max_size
+        self._buffer = buffer
+        self._position = start
+        self._receive = receive
+        self._received = 0
+        self._content = None
+        self._complete = not chunked and not content_length
+
+    @property
+    def is_complete (
+        self,
+    ) -> bool:
+
+        """
+        True once the whole body has been taken from the connection, or if it never needs to be.
+
+        A body already in the buffer along with its head is always complete, since it does not
+        need to be received before the next request of the connection.
+        """
+
+        return self._complete or self._receive is None
+
+    async def read (
+        self,
+    ) -> bytes:
+
+        """
+        Reads the whole body.
+
+        Returns:
+            bytes: The body of the request.
+
+        Raises:
+            SocketIOMalformedRequestError: If the body is malformed, incomplete, or larger than `max_size`.
+        """
+
+        if self._content is None:
+            self._content = b''.join([chunk async for chunk in self._chunks()])
+        return self._content
+
+    async def drain (
+        self,
+    ) -> None:
+
+        """
+        Reads and discards the rest of the body.
+
+        Raises:
+            SocketIOMalformedRequestError: If the body is malformed, incomplete, or larger than `max_size`.
+        """
+
+        async for _ in self._chunks():
+            pass
+
+    def __aiter__ (
+        self,
+    ) -> AsyncIterator[bytes]:
+
+        if self._content is not None:
+            return self._replay()
+        return self._chunks()
+
+    async def _replay (
+        self,
+    ) -> AsyncIterator[bytes]:
+
+        """
+        Yields the body that was already read with `read`.
+
+        Yields:
+            bytes: The whole body, as a single chunk.
+        """
+
+        yield self._content
+
+    async def _chunks (
+        self,
+    ) -> AsyncIterator[bytes]:
+
+        """
+        Yields the unread bytes of the body as they become available.
+
+        Yields:
+            bytes: The next piece of the body.
+
+        Raises:
+            SocketIOMalformedRequestError: If the body is malformed, incomplete, or larger than `max_size`.
+        """
+
+        if self._complete:
+            return
+
+        if self.chunked:
+            while True:
+                size_line = await self._read_line()
+                try:
+                    size = int(size_line.split(b';', 1)[0].strip(), 16)
+                except ValueError:
+                    raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid chunk size")
+
+                if size == 0:
+                    while await self._read_line():
+                        pass
+                    break
+
+                async for piece in self._read_exactly(size):
+                    yield piece
+
+                if await self._read_line():
+                    raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid chunk terminator")
+        else:
+            async for piece in self._read_exactly(self.content_length):
+                yield piece
+
+        self._complete = True
+
+    async def _read_exactly (
+        self,
+        size: int,
+    ) -> AsyncIterator[bytes]:
+
+        """
+        Yields exactly `size` bytes of body data, as they become available.
+
+        Args:
+            size (int): The number of bytes to read.
+
+        Yields:
+            bytes: The next piece of the body.
+
+        Raises:
+            SocketIOMalformedRequestError: If the connection is closed early, or the body grows larger than `max_size`.
+        """
+
+        self._received += size
+        if self.max_size is not None and self._received > self.max_size:
+            raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "body too large")
+
+        while size:
+            available = len(self._buffer) - self._position
+            if not available:
+                await self._fill()
+                continue
+
+            piece = min(size, available)
+            yield bytes(self._buffer[self._position:self._position + piece])
+            self._consume(piece)
+            size -= piece
+
+    async def _read_line (
+        self,
+    ) -> bytes:
+
+        """
+        Reads a CRLF terminated line of a chunked body.
+
+        Returns:
+            bytes: The line, without its terminator.
+
+        Raises:
+            SocketIOMalformedRequestError: If the connection is closed early, or the line is too long.
+        """
+
+        while True:
+            line_end = self._buffer.find(b'\r\n', self._position)
+            if line_end != -1:
+                break
+            if len(self._buffer) - self._position > self.MAX_CHUNK_LINE_SIZE:
+                raise SocketIOMalformedRequestError(BAD_REQUEST, "chunk line too long")
+            await self._fill()
+
+        line = bytes(self._buffer[self._position:line_end])
+        self._consume(line_end + 2 - self._position)
+        return line
+
+    async def _fill (
+        self,
+    ) -> None:
+
+        """
+        Receives more data of the body into the connection buffer.
+
+        Raises:
+            SocketIOMalformedRequestError: If the connection is closed before the end of the body.
+        """
+
+        if self._receive is None or not await self._receive():
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "incomplete body")
+
+    def _consume (
+        self,
+        size: int,
+    ) -> None:
+
+        """
+        Marks `size` bytes of the buffer as read.
+
+        A streamed body removes the bytes from the connection buffer right away, so an upload
+        never accumulates in memory. A body received along with its head only moves its read
+        position, since the buffer is trimmed once the whole batch of requests has been served.
+
+        Args:
+            size (int): The number of bytes read.
+        """
+
+        if self._receive is None:
+            self._position += size
+        else:
+            del self._buffer[self._position:self._position + size]
@@ -0,0 +1,36 @@
+"""
+This module defines the `RequestHead` class, the request line, headers and body boundaries
+of a request, as produced by every request parser backend.
+"""
+
+from dataclasses import dataclass
+
+from parsers.request_parser.header_view import HeaderView
+
+
+@dataclass
+class RequestHead:
+
+    """
+    The request line, headers and body boundaries of a parsed HTTP request.
+
+    Offsets are absolute positions in the connection buffer the request was parsed from,
+    so the body can be sliced out of that buffer without being copied.
+
+    Attributes:
+        method (str): The request method (e.g., 'GET').
+        target (str): The request target, including the query string.
+        version (str): The HTTP version of the request (e.g., 'HTTP/1.1').
+        headers (HeaderView): The lazy, case-insensitive view of the request headers.
+        body_start (int): The offset of the first byte of the body.
+        body_end (int): The offset right after the last byte of the body, or None for a chunked body.
+        chunked (bool): True if the body uses `Transfer-Encoding: chunked`.
+    """
+
+    method: str
+    target: str
+    version: str
+    headers: HeaderView
+    body_start: int
+    body_end: int | None
+    chunked: bool
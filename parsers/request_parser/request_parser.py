@@ -2,56 +2,76 @@
 This module defines the `RequestParser` class for parsing HTTP request data, including request lines and headers.
 """
 
-from typing import Any
+from parsers.request_parser.header_view import HeaderView
 
 
 class RequestParser:
-    
+
     """
     A class that provides methods for parsing HTTP request data, including request lines and headers.
+
+    Headers are returned as a lazy, case-insensitive `HeaderView`, so only the headers that are
+    looked up get decoded.
     """
-    
+
     @staticmethod
     def parse_request (
-        request_data: str,
-    ) -> tuple[str, dict]:
-        
+        request_data: str | bytes,
+    ) -> tuple[str, HeaderView]:
+
         """
         Parses the HTTP request data into a tuple containing the request line and headers.
 
         Args:
-            request_data (str): The raw HTTP request data as a string.
+            request_data (str | bytes): The raw HTTP request data.
 
         Returns:
-            tuple[str, dict]: A tuple where the first element is the request line 
-                               (e.g., 'GET / HTTP/1.1') and the second is a dictionary 
-                               containing the request headers.
+            tuple[str, HeaderView]: A tuple where the first element is the request line
+                                    (e.g., 'GET / HTTP/1.1') and the second is a view
+                                    of the request headers.
         """
 
-        lines = request_data.splitlines()
-        request_line = lines[0] if lines else ""
-        headers = RequestParser.parse_headers(request_data)
-        return request_line, headers
+        raw = RequestParser._head(request_data)
+        line_end = raw.find(b'\r\n')
+        if line_end == -1:
+            return raw.decode('latin-1'), HeaderView(raw, [])
+
+        return raw[:line_end].decode('latin-1'), HeaderView.parse(raw, line_end + 2)
 
     @staticmethod
     def parse_headers (
-        request: str,
-    ) -> dict[str, Any]:
-        
+        request: str | bytes,
+    ) -> HeaderView:
+
         """
         Extracts the headers from the given HTTP request data.
 
         Args:
-            request (str): The raw HTTP request data as a string.
+            request (str | bytes): The raw HTTP request data.
 
         Returns:
-            dict: A dictionary where keys are header names and values are the corresponding header values.
+            HeaderView: A case-insensitive view mapping header names to their values.
         """
 
-        headers = {}
-        lines = request.split("\r\n")
-        for line in lines[1:]:
-            parts = line.split(": ", 1)
-            if len(parts) == 2:
-                headers[parts[0].strip()] = parts[1].strip()
-        return headers
+        return RequestParser.parse_request(request)[1]
+
+    @staticmethod
+    def _head (
+        request_data: str | bytes,
+    ) -> bytes:
+
+        """
+        Returns the request line and headers of the request data, without the body.
+
+        Args:
+            request_data (str | bytes): The raw HTTP request data.
+
+        Returns:
+            bytes: The raw request head.
+        """
+
+        if isinstance(request_data, str):
+            request_data = request_data.encode()
+
+        head_end = request_data.find(b'\r\n\r\n')
+        return bytes(request_data[:head_end] if head_end != -1 else request_data.rstrip(b'\r\n'))
@@ -0,0 +1,245 @@
+"""
+This module defines the `StreamingRequestParser` class, an incremental HTTP/1.x request parser
+working directly on the growing bytes buffer of a connection.
+"""
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+from interfaces.request_parser_interface.request_parser_interface import RequestParserInterface
+
+from parsers.request_parser.header_view import HeaderView
+from parsers.request_parser.request_head import RequestHead
+
+
+BAD_REQUEST = "HTTP/1.1 400 Bad Request\r\n"
+PAYLOAD_TOO_LARGE = "HTTP/1.1 413 Payload Too Large\r\n"
+URI_TOO_LONG = "HTTP/1.1 414 URI Too Long\r\n"
+HEADERS_TOO_LARGE = "HTTP/1.1 431 Request Header Fields Too Large\r\n"
+NOT_IMPLEMENTED = "HTTP/1.1 501 Not Implemented\r\n"
+
+
+class StreamingRequestParser(RequestParserInterface):
+
+    """
+    An incremental HTTP/1.x request parser for the buffer of a single connection.
+
+    The parser is fed the same `bytearray` every time new data is received. It remembers how many
+    bytes of the pending request have been scanned, so the end of the request head is searched only
+    in the new bytes, and it enforces the configured size limits as soon as they are exceeded instead
+    of waiting for the whole request. Only the request line is decoded when the head is complete,
+    and headers are exposed through a lazy `HeaderView`. The head is copied once out of the buffer,
+    as the buffer is reused for the following requests of the connection, while the body is never
+    copied: only its boundaries are returned.
+    """
+
+    def __init__ (
+        self,
+        max_request_line_size: int = 8190,
+        max_header_size: int = 65536,
+        max_headers: int = 100,
+        max_body_size: int | None = None,
+    ) -> None:
+
+        """
+        Initializes the parser with the size limits of a request.
+
+        Args:
+            max_request_line_size (int): Maximum size of the request line, in bytes.
+            max_header_size (int): Maximum size of the request line and headers, in bytes.
+            max_headers (int): Maximum number of headers.
+            max_body_size (int | None): Maximum size of a body announced with `Content-Length`, in bytes,
+                                        or None to leave the limit to the route serving the request.
+        """
+
+        self.max_request_line_size = max_request_line_size
+        self.max_header_size = max_header_size
+        self.max_headers = max_headers
+        self.max_body_size = max_body_size
+        self._scanned = 0
+
+    @classmethod
+    def is_available (
+        cls,
+    ) -> bool:
+
+        """
+        The pure-Python parser has no dependency and is always available.
+        """
+
+        return True
+
+    def parse_head (
+        self,
+        buffer: bytearray,
+        start: int = 0,
+    ) -> RequestHead | None:
+
+        """
+        Parses the head of the request starting at `start` in the connection buffer.
+
+        Args:
+            buffer (bytearray): The bytes received on the connection.
+            start (int): The offset of the request in the buffer.
+
+        Returns:
+            RequestHead | None: The parsed head, or None if the head is not complete yet.
+
+        Raises:
+            SocketIOMalformedRequestError: If the request is malformed or exceeds a size limit.
+        """
+
+        head_end = buffer.find(b'\r\n\r\n', start + max(0, self._scanned - 3))
+        if head_end == -1:
+            self._scanned = len(buffer) - start
+            self._check_incomplete_head(buffer, start)
+            return None
+
+        self._scanned = 0
+        if head_end - start > self.max_header_size:
+            raise SocketIOMalformedRequestError(HEADERS_TOO_LARGE, "request head too large")
+
+        raw = bytes(buffer[start:head_end])
+        method, target, version, headers = self._parse_head_block(raw)
+        content_length, chunked = self._parse_framing(headers)
+
+        body_start = head_end + 4
+        return RequestHead (
+            method=method,
+            target=target,
+            version=version,
+            headers=headers,
+            body_start=body_start,
+            body_end=None if chunked else body_start + content_length,
+            chunked=chunked,
+        )
+
+    def _parse_head_block (
+        self,
+        raw: bytes,
+    ) -> tuple[str, str, str, HeaderView]:
+
+        """
+        Parses the request line and headers of a complete request head.
+
+        Backends only differ in this step: finding the end of the head, the size limits
+        and the body framing are shared by every backend.
+
+        Args:
+            raw (bytes): The request head, without the final empty line.
+
+        Returns:
+            tuple[str, str, str, HeaderView]: The method, target, HTTP version and headers of the request.
+
+        Raises:
+            SocketIOMalformedRequestError: If the request line or a header line is malformed.
+        """
+
+        line_end = raw.find(b'\r\n')
+        if line_end == -1:
+            line_end = len(raw)
+
+        method, target, version = self._parse_request_line(raw[:line_end])
+        return method, target, version, HeaderView.parse(raw, line_end + 2)
+
+    def _check_incomplete_head (
+        self,
+        buffer: bytearray,
+        start: int,
+    ) -> None:
+
+        """
+        Enforces the size limits on a request whose head has not been fully received.
+
+        Args:
+            buffer (bytearray): The bytes received on the connection.
+            start (int): The offset of the request in the buffer.
+
+        Raises:
+            SocketIOMalformedRequestError: If the request line or head is already too large.
+        """
+
+        received = len(buffer) - start
+        if received > self.max_header_size:
+            raise SocketIOMalformedRequestError(HEADERS_TOO_LARGE, "request head too large")
+
+        if received > self.max_request_line_size:
+            line_end = buffer.find(b'\r\n', start, start + self.max_request_line_size + 2)
+            if line_end == -1:
+                raise SocketIOMalformedRequestError(URI_TOO_LONG, "request line too long")
+
+    def _parse_request_line (
+        self,
+        line: bytes,
+    ) -> tuple[str, str, str]:
+
+        """
+        Parses and validates the request line.
+
+        Args:
+            line (bytes): The request line, without its line terminator.
+
+        Returns:
+            tuple[str, str, str]: The method, target and HTTP version of the request.
+
+        Raises:
+            SocketIOMalformedRequestError: If the request line is malformed or too long.
+        """
+
+        if len(line) > self.max_request_line_size:
+            raise SocketIOMalformedRequestError(URI_TOO_LONG, "request line too long")
+
+        parts = line.split(b' ')
+        if len(parts) != 3:
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid request line")
+
+        method, target, version = parts
+        if not method.isalpha() or not target or version not in (b'HTTP/1.1', b'HTTP/1.0'):
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid request line")
+
+        return method.decode('ascii'), target.decode('latin-1'), version.decode('ascii')
+
+    def _parse_framing (
+        self,
+        headers: HeaderView,
+    ) -> tuple[int, bool]:
+
+        """
+        Validates the headers and extracts the framing of the body.
+
+        Args:
+            headers (HeaderView): The headers of the request.
+
+        Returns:
+            tuple[int, bool]: The `Content-Length` of the body, and whether the body uses
+                              chunked transfer encoding.
+
+        Raises:
+            SocketIOMalformedRequestError: If the body framing is ambiguous or a limit is exceeded.
+        """
+
+        if len(headers) > self.max_headers:
+            raise SocketIOMalformedRequestError(HEADERS_TOO_LARGE, "too many headers")
+
+        content_lengths = set(headers.get_all('content-length'))
+        transfer_encodings = headers.get_all('transfer-encoding')
+
+        if len(content_lengths) > 1:
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid Content-Length")
+
+        content_length = next(iter(content_lengths), '0')
+        if not (content_length.isascii() and content_length.isdigit()):
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "invalid Content-Length")
+
+        # Repeated headers are one list of codings, of which only a single `chunked` is supported.
+        chunked = bool(transfer_encodings)
+        codings = [coding.strip().lower() for value in transfer_encodings for coding in value.split(',')]
+        if chunked and codings != ['chunked']:
+            raise SocketIOMalformedRequestError(NOT_IMPLEMENTED, "unsupported Transfer-Encoding")
+
+        if chunked and content_lengths:
+            raise SocketIOMalformedRequestError(BAD_REQUEST, "both Content-Length and Transfer-Encoding")
+
+        if self.max_body_size is not None and int(content_length) > self.max_body_size:
+            raise SocketIOMalformedRequestError(PAYLOAD_TOO_LARGE, "body too large")
+
+        return int(content_length), chunked
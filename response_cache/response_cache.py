@@ -0,0 +1,271 @@
+"""
+This module defines the `ResponseCache` class, which keeps the encoded responses of cacheable
+routes in memory, so repeated requests are answered without running their handlers.
+"""
+
+import time
+
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode
+
+from parsers.request_parser.http_request import READ_METHODS, HTTPRequest
+
+from returnables.file_response.file_response import FileResponse
+from returnables.response.response import Response
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+
+CACHEABLE_STATUSES = frozenset((200, 203, 204, 300, 301, 404, 405, 410, 414, 501))
+"""
+The statuses whose responses are cacheable by default, as listed by RFC 9110.
+"""
+
+UNCACHEABLE_DIRECTIVES = frozenset(('no-store', 'no-cache', 'private'))
+
+
+def normalize_query (
+    query: str,
+) -> str:
+
+    """
+    Normalizes a query string, so the same parameters in another order share a cache entry.
+
+    Args:
+        query (str): The query string, without the leading '?'.
+
+    Returns:
+        str: The query string with its parameters sorted and their encoding normalized.
+    """
+
+    if not query:
+        return ''
+    return urlencode(sorted(parse_qsl(query, keep_blank_values=True)))
+
+
+def parse_cache_control (
+    cache_control: str,
+) -> dict[str, str | None]:
+
+    """
+    Parses the directives of a `Cache-Control` header.
+
+    Args:
+        cache_control (str): The value of the header (e.g., "public, max-age=60").
+
+    Returns:
+        dict[str, str | None]: The lowercased directives and their unquoted arguments, or None for directives without one.
+    """
+
+    directives = {}
+    for directive in cache_control.split(','):
+        name, separator, value = directive.partition('=')
+        name = name.strip().lower()
+        if name:
+            directives[name] = value.strip().strip('"') if separator else None
+    return directives
+
+
+class ResponseCache:
+
+    """
+    A cache of encoded responses, keyed by method, path, normalized query and the request
+    headers named by the `Vary` header of the response.
+
+    A response is stored when its route declares a `cache_ttl`, or when its `Cache-Control`
+    header makes it cacheable by a shared cache with `public` and a `max-age` or `s-maxage`.
+    Those directives set the lifetime of the entry, while `no-store`, `no-cache` and `private`
+    prevent it from being stored. The stored response keeps its encoded headers, so a hit only
+    adds the status line, `Date`, `Content-Length` and `Connection` headers, which are already
+    cached, before the response is written. A request with `Cache-Control: no-cache` bypasses
+    the cache and refreshes its entry.
+
+    Entries are evicted in least recently used order once their bodies exceed `max_size` bytes.
+
+    Attributes:
+        max_size (int): The maximum total size of the cached bodies, in bytes.
+    """
+
+    def __init__ (
+        self,
+        max_size: int = 33554432,
+    ) -> None:
+
+        """
+        Initializes the response cache.
+
+        Args:
+            max_size (int, optional): The maximum total size of the cached bodies, in bytes. Defaults to 32 MiB.
+        """
+
+        self.max_size = max_size
+        self._variants: dict[tuple[str, str, str], tuple[tuple[str, ...], int]] = {}
+        self._entries: OrderedDict[tuple, tuple[float, Response]] = OrderedDict()
+        self._size = 0
+
+    def get (
+        self,
+        request: HTTPRequest,
+    ) -> Response | None:
+
+        """
+        Returns the cached response of a request, while it is fresh.
+
+        Args:
+            request (HTTPRequest): The request being served.
+
+        Returns:
+            Response | None: The cached response, or None if the request must be handled.
+        """
+
+        if not self._entries or request.method not in READ_METHODS:
+            return None
+
+        primary = (request.method, request.path, normalize_query(request.query))
+        variants = self._variants.get(primary)
+        if variants is None or self._bypasses_cache(request):
+            return None
+
+        key = (primary, tuple(request.headers.get(name) for name in variants[0]))
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires, response = entry
+        if expires <= time.monotonic():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return response
+
+    def store (
+        self,
+        request: HTTPRequest,
+        response: Response,
+        ttl: float | None = None,
+    ) -> None:
+
+        """
+        Stores the response of a request, when it is cacheable.
+
+        Args:
+            request (HTTPRequest): The request being served.
+            response (Response): The response to the request.
+            ttl (float | None, optional): The lifetime of the entry declared by the route, in seconds,
+                                          used when the response does not set its own. Defaults to None.
+        """
+
+        if (
+            request.method not in READ_METHODS
+            or response.status_code not in CACHEABLE_STATUSES
+            or isinstance(response, (StreamingResponse, FileResponse))
+            or len(response.body) > self.max_size // 4
+        ):
+            return
+
+        headers = {name.lower(): value for name, value in response.headers.items()}
+        for line in response.raw_headers.decode('latin-1').split('\r\n'):
+            name, _, value = line.partition(':')
+            name = name.strip().lower()
+            if name in ('cache-control', 'vary', 'set-cookie'):
+                headers[name] = f"{headers[name]}, {value.strip()}" if name in headers else value.strip()
+
+        if 'set-cookie' in headers:
+            return
+
+        directives = parse_cache_control(headers.get('cache-control', ''))
+        if UNCACHEABLE_DIRECTIVES.intersection(directives):
+            return
+
+        shared = 'public' in directives or 's-maxage' in directives
+        if 'authorization' in request.headers and not shared:
+            return
+
+        lifetime = directives.get('s-maxage') or directives.get('max-age')
+        if lifetime is not None and (shared or ttl is not None):
+            try:
+                ttl = float(lifetime)
+            except ValueError:
+                return
+        if not ttl or ttl <= 0:
+            return
+
+        vary = tuple(sorted({name.strip().lower() for name in headers.get('vary', '').split(',') if name.strip()}))
+        if '*' in vary:
+            return
+
+        primary = (request.method, request.path, normalize_query(request.query))
+        variants = self._variants.get(primary)
+        if variants is not None and variants[0] != vary:
+            for key in [key for key in self._entries if key[0] == primary]:
+                self._remove(key)
+
+        key = (primary, tuple(request.headers.get(name) for name in vary))
+        self._remove(key)
+        response.get_header_block()
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._variants[primary] = (vary, self._variants.get(primary, (vary, 0))[1] + 1)
+        self._size += len(response.body)
+        while self._size > self.max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate (
+        self,
+        method: str | None = None,
+        path: str | None = None,
+    ) -> None:
+
+        """
+        Removes the cached responses of a path, or every cached response.
+
+        Args:
+            method (str | None, optional): The method of the responses to remove. Defaults to every method.
+            path (str | None, optional): The path of the responses to remove. Defaults to every path.
+        """
+
+        for key in [
+            key for key in self._entries
+            if (method is None or key[0][0] == method) and (path is None or key[0][1] == path)
+        ]:
+            self._remove(key)
+
+    def _bypasses_cache (
+        self,
+        request: HTTPRequest,
+    ) -> bool:
+
+        """
+        Checks whether the client asks for a response that is not served from a cache.
+
+        Args:
+            request (HTTPRequest): The request being served.
+
+        Returns:
+            bool: True if the request has `Cache-Control: no-cache` or `Pragma: no-cache`.
+        """
+
+        cache_control = request.headers.get('cache-control')
+        if cache_control is not None and 'no-cache' in parse_cache_control(cache_control):
+            return True
+        return request.headers.get('pragma', '').strip().lower() == 'no-cache'
+
+    def _remove (
+        self,
+        key: tuple,
+    ) -> None:
+
+        """
+        Removes an entry from the cache, forgetting the variants of its path once it has no entry left.
+
+        Args:
+            key (tuple): The key of the entry.
+        """
+
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+
+        self._size -= len(entry[1].body)
+        vary, count = self._variants.pop(key[0])
+        if count > 1:
+            self._variants[key[0]] = (vary, count - 1)
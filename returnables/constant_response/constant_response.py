@@ -0,0 +1,79 @@
+"""
+This module provides the `ConstantResponse` class, the response of a constant route, encoded once
+and written as it is to every request.
+"""
+
+from returnables.response.response import (
+    BODILESS_STATUSES,
+    CONNECTION_HEADERS,
+    Response,
+    get_date_header,
+    get_status_line,
+)
+
+
+class ConstantResponse(Response):
+
+    """
+    A response encoded once, for routes whose handler always returns the same response.
+
+    Everything but the `Date` header is encoded when the response is built: the status line,
+    and for both keep-alive states the headers, `Content-Length` and `Connection` headers joined
+    with the body, or without it for HEAD requests. Rendering only picks the cached `Date` header
+    in between, so the response is written with a single scatter-gather send and no formatting.
+
+    Attributes:
+        status_line (bytes): The encoded status line.
+        tails (dict[tuple[bool, bool], bytes]): The encoded headers, and body if included, following the `Date`
+                                                header, by keep-alive state and whether the body is included.
+    """
+
+    def __init__ (
+        self,
+        response: Response,
+    ) -> None:
+
+        """
+        Encodes a response once for all.
+
+        Args:
+            response (Response): The response returned by the handler of the route.
+        """
+
+        super().__init__ (
+            response.body,
+            response.status_code,
+            response.headers,
+            response.media_type,
+            response.raw_headers,
+        )
+        self.status_line = get_status_line(self.status_code)
+        header_block = self.get_header_block()
+        content_length = b"Content-Length: %d\r\n" % len(self.body) if self.status_code not in BODILESS_STATUSES else b""
+        self.tails = {
+            (keep_alive, include_body): b"".join (
+                (header_block, content_length, connection_header, self.body if include_body else b""),
+            )
+            for keep_alive, connection_header in CONNECTION_HEADERS.items()
+            for include_body in (True, False)
+        }
+
+    def render (
+        self,
+        keep_alive: bool,
+        include_body: bool = True,
+    ) -> list[bytes]:
+
+        """
+        Renders the response from its encoded parts.
+
+        Args:
+            keep_alive (bool): Whether the connection stays open after the response.
+            include_body (bool, optional): Whether to write the body, which is False when answering
+                                           a HEAD request. Defaults to True.
+
+        Returns:
+            list[bytes]: The status line, the `Date` header, and the rest of the response.
+        """
+
+        return [self.status_line, get_date_header(), self.tails[keep_alive, include_body]]
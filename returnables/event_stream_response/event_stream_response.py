@@ -0,0 +1,106 @@
+"""
+This module provides the `EventStreamResponse` class, the long-lived `text/event-stream` response
+of a Server-Sent Events endpoint, which writes the events of its channel as they are published.
+"""
+
+import asyncio
+import socket
+
+from returnables.streaming_response.streaming_response import LAST_CHUNK, StreamingResponse
+
+from server_sent_events.server_sent_events import HEARTBEAT_FRAMES, EventChannel, EventSubscriber
+
+from utils.socket_writer.socket_writer import send_buffers
+
+
+class EventStreamResponse(StreamingResponse):
+
+    """
+    A Server-Sent Events stream, written until the client disconnects or the channel is closed.
+
+    The events queued for the subscriber are already framed by the channel, so they are written
+    without being copied, all pending events in a single scatter-gather send. When no event is
+    published for `heartbeat_interval` seconds, a comment line is sent instead, which keeps
+    proxies from timing the connection out and detects clients that went away.
+
+    The stream only subscribes to the channel once it starts writing, so a response that is
+    never streamed, such as the answer to a HEAD request or one whose head fails to be written,
+    leaves no subscriber behind.
+
+    Attributes:
+        channel (EventChannel): The channel the stream subscribes to.
+        last_event_id (str | None): The `Last-Event-ID` header of a reconnecting client.
+        subscriber (EventSubscriber | None): The subscription of the connection, once the stream has started.
+        heartbeat_interval (float): The number of idle seconds before a heartbeat is sent.
+    """
+
+    media_type = "text/event-stream; charset=utf-8"
+
+    def __init__ (
+        self,
+        channel: EventChannel,
+        last_event_id: str | None = None,
+        heartbeat_interval: float = 15.0,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+
+        """
+        Initializes the event stream.
+
+        Args:
+            channel (EventChannel): The channel to subscribe to when streaming.
+            last_event_id (str | None, optional): The `Last-Event-ID` header of a reconnecting client. Defaults to None.
+            heartbeat_interval (float, optional): The number of idle seconds before a heartbeat is sent. Defaults to 15.0.
+            headers (dict[str, str] | None, optional): The custom headers of the response. Defaults to None.
+        """
+
+        super().__init__ (
+            (),
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no', **(headers or {})},
+        )
+        self.channel = channel
+        self.last_event_id = last_event_id
+        self.subscriber: EventSubscriber | None = None
+        self.heartbeat_interval = heartbeat_interval
+
+    async def stream (
+        self,
+        client_socket: socket.socket,
+        chunked: bool = True,
+    ) -> None:
+
+        """
+        Subscribes to the channel and writes its events to the client until the subscription is closed.
+
+        The subscription is removed from the channel once the stream ends, or when writing fails.
+
+        Args:
+            client_socket (socket.socket): The client socket, once the head has been written.
+            chunked (bool, optional): Whether to write the events as chunks. Defaults to True.
+
+        Raises:
+            OSError: If the connection fails while writing.
+        """
+
+        subscriber = self.subscriber = self.channel.subscribe(self.last_event_id)
+        frame = 1 if chunked else 0
+        try:
+            while True:
+                if subscriber.pending:
+                    pending = subscriber.pending
+                    await send_buffers(client_socket, [pending.popleft()[frame] for _ in range(len(pending))])
+                    continue
+
+                if subscriber.closed:
+                    break
+
+                subscriber.ready.clear()
+                try:
+                    await asyncio.wait_for(subscriber.ready.wait(), self.heartbeat_interval)
+                except asyncio.TimeoutError:
+                    await send_buffers(client_socket, [HEARTBEAT_FRAMES[frame]])
+
+            if chunked:
+                await send_buffers(client_socket, [LAST_CHUNK])
+        finally:
+            self.channel.unsubscribe(subscriber)
@@ -0,0 +1,234 @@
+"""
+This module provides the `FileResponse` class, an HTTP response whose body is a file, or byte
+ranges of a file, sent to the client with `sendfile` without being copied through the process.
+"""
+
+import asyncio
+import os
+import re
+import secrets
+import socket
+
+from returnables.response.response import Response
+
+from utils.socket_writer.socket_writer import send_buffers
+
+
+MAX_RANGES = 16
+"""
+The maximum number of ranges served for a request, once overlapping ranges are merged.
+A request asking for more is answered with the whole file.
+"""
+
+RANGE_SPEC_PATTERN = re.compile(r"([0-9]*)-([0-9]*)")
+"""
+The pattern of a byte range of a `Range` header, capturing its first and last byte positions.
+"""
+
+
+def parse_byte_ranges (
+    header: str,
+    size: int,
+) -> list[tuple[int, int]] | None:
+
+    """
+    Parses the `Range` header of a request for a file.
+
+    The satisfiable ranges are sorted, and overlapping or adjacent ranges are merged,
+    so no byte is sent twice.
+
+    Args:
+        header (str): The value of the `Range` header (e.g., "bytes=0-99,-500").
+        size (int): The size of the file, in bytes.
+
+    Returns:
+        list[tuple[int, int]] | None: The first and last byte of every satisfiable range, an empty
+                                      list if no range is satisfiable, or None if the header is
+                                      malformed or asks for too many ranges and must be ignored.
+    """
+
+    unit, _, specs = header.partition('=')
+    if unit.strip().lower() != 'bytes' or not specs.strip():
+        return None
+
+    ranges = []
+    for spec in specs.split(','):
+        match = RANGE_SPEC_PATTERN.fullmatch(spec.strip())
+        if match is None or match.group(0) == '-':
+            return None
+
+        first, last = match.groups()
+
+        if not first:
+            length = int(last)
+            if length and size:
+                ranges.append((max(size - length, 0), size - 1))
+            continue
+
+        start = int(first)
+        end = int(last) if last else size - 1
+        if last and end < start:
+            return None
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+
+    merged = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged if len(merged) <= MAX_RANGES else None
+
+
+class FileResponse(Response):
+
+    """
+    An HTTP response sending the content of a file.
+
+    The head announces the size of the file, and the body is written by `send_file` with the
+    event loop's `sock_sendfile`, which hands the transfer to `os.sendfile` so the bytes go from
+    the page cache to the socket without being read into Python. Where `sendfile` is not
+    available, the file is read and written in blocks instead.
+
+    When byte ranges are given, as parsed by `parse_byte_ranges`, the response is a 206 Partial
+    Content: a single range is sent with its `Content-Range` header, and several ranges as a
+    `multipart/byteranges` body whose parts are each sent with `sendfile` from their offset.
+
+    Attributes:
+        path (str): The path of the file.
+        size (int): The size of the file, in bytes.
+        ranges (list[tuple[int, int]] | None): The first and last byte of every range sent, or None for the whole file.
+        include_body (bool): Whether the body is sent, which is False when answering a HEAD request.
+    """
+
+    def __init__ (
+        self,
+        path: str,
+        size: int | None = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+        raw_headers: bytes = b"",
+        include_body: bool = True,
+        ranges: list[tuple[int, int]] | None = None,
+    ) -> None:
+
+        """
+        Initializes the file response.
+
+        Args:
+            path (str): The path of the file.
+            size (int | None, optional): The size of the file, in bytes. Defaults to the size given by `os.stat`.
+            status_code (int, optional): The HTTP status code. Defaults to 200.
+            headers (dict[str, str] | None, optional): The custom headers of the response. Defaults to None.
+            media_type (str | None, optional): The media type of the file. Defaults to the media type of the class.
+            raw_headers (bytes, optional): Pre-encoded header lines, each ending with CRLF. Defaults to none.
+            include_body (bool, optional): Whether to send the content of the file. Defaults to True.
+            ranges (list[tuple[int, int]] | None, optional): The first and last byte of every range
+                                                             to send. Defaults to the whole file.
+        """
+
+        super().__init__(b"", status_code, headers, media_type, raw_headers)
+        self.path = path
+        self.size = os.stat(path).st_size if size is None else size
+        self.include_body = include_body
+        self.ranges = ranges
+        self._parts = []
+        if ranges:
+            self._set_ranges(ranges)
+
+    def _set_ranges (
+        self,
+        ranges: list[tuple[int, int]],
+    ) -> None:
+
+        """
+        Turns the response into a 206 Partial Content response sending the ranges.
+
+        Args:
+            ranges (list[tuple[int, int]]): The first and last byte of every range.
+        """
+
+        self.status_code = 206
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            self.raw_headers += f"Content-Range: bytes {start}-{end}/{self.size}\r\n".encode()
+            self._parts = [(b"", start, end - start + 1)]
+            return
+
+        boundary = secrets.token_hex(16)
+        part_type = self.media_type
+        self._parts = [
+            (
+                (
+                    f"\r\n--{boundary}\r\n"
+                    f"Content-Type: {part_type}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{self.size}\r\n\r\n"
+                ).encode('latin-1'),
+                start,
+                end - start + 1,
+            )
+            for start, end in ranges
+        ]
+        self._parts.append((f"\r\n--{boundary}--\r\n".encode(), 0, 0))
+        self.media_type = f"multipart/byteranges; boundary={boundary}"
+
+    @property
+    def content_length (
+        self,
+    ) -> int:
+
+        """
+        The number of bytes announced in the `Content-Length` header.
+        """
+
+        if self._parts:
+            return sum(len(head) + count for head, _, count in self._parts)
+        return self.size
+
+    def render (
+        self,
+        keep_alive: bool,
+        include_body: bool = True,
+    ) -> list[bytes]:
+
+        """
+        Renders the head of the response, as the body is written by `send_file`.
+
+        Args:
+            keep_alive (bool): Whether the connection stays open after the response.
+            include_body (bool, optional): Whether the body is written, which does not change the head. Defaults to True.
+
+        Returns:
+            list[bytes]: The head of the response.
+        """
+
+        return [self.render_head(keep_alive)]
+
+    async def send_file (
+        self,
+        client_socket: socket.socket,
+    ) -> None:
+
+        """
+        Writes the content of the file, or the parts of its ranges, to the client.
+
+        Args:
+            client_socket (socket.socket): The client socket, once the head has been written.
+
+        Raises:
+            OSError: If the file cannot be read or the connection fails while writing.
+        """
+
+        if not self.include_body:
+            return
+
+        loop = asyncio.get_running_loop()
+        with open(self.path, 'rb') as file:
+            for head, offset, count in self._parts or [(b"", 0, self.size)]:
+                if head:
+                    await send_buffers(client_socket, [head])
+                if count:
+                    await loop.sock_sendfile(client_socket, file, offset, count)
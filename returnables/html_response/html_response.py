@@ -2,19 +2,25 @@
 This module provides a simple HTTP HTML response wrapper for returning well-formed HTTP responses.
 """
 
-class HTMLResponse:
+from returnables.response.response import Response
+
+
+class HTMLResponse(Response):
     
     """
-    A basic representation of an HTTP HTML response.
+    An HTTP response with an HTML body.
 
-    This class is designed to build raw HTTP response strings with customizable content and status code,
-    suitable for use in simple HTTP servers or educational contexts.
+    The content is encoded once when the response is created, and sent with a
+    `text/html` content type when a handler returns the response.
     """
 
+    media_type = "text/html; charset=utf-8"
+
     def __init__ (
         self, 
         content: str, 
         status_code: int = 200,
+        headers: dict[str, str] | None = None,
     ) -> None:
         
         """
@@ -23,23 +29,21 @@ class HTMLResponse:
         Args:
             content (str): The HTML content to be included in the HTTP response body.
             status_code (int, optional): The HTTP status code to use. Defaults to 200.
+            headers (dict[str, str] | None, optional): The custom headers of the response. Defaults to None.
         """
         
+        super().__init__(content, status_code, headers)
         self.content = content
-        self.status_code = status_code
 
     def to_http_response (
         self,
     ) -> str:
         
         """
-        Converts the response content and status code into a full HTTP response string.
+        Converts the response into a full HTTP response string.
 
         Returns:
             str: A raw HTTP response string including the status line, headers, and body content.
         """
         
-        status_text = "OK" if self.status_code == 200 else "Error"
-        status_line = f"HTTP/1.1 {self.status_code} {status_text}\r\n"
-        headers = "Content-Type: text/html\r\n\r\n"
-        return status_line + headers + self.content
+        return b"".join(self.render(False)).decode()
@@ -0,0 +1,155 @@
+"""
+This module selects the JSON serialization backend used by `JsonResponse`, which serializes
+data straight to bytes with `orjson` when it is installed.
+"""
+
+import dataclasses
+import datetime
+import enum
+import json
+import uuid
+
+from typing import Any, Callable
+
+from exceptions.socketio_exceptions.socketio_exceptions import SocketIOInproperJsonBackendError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def encode_default (
+    value: Any,
+) -> Any:
+
+    """
+    Converts the values the standard JSON types do not cover into serializable values.
+
+    Dataclasses become objects, dates and times ISO 8601 strings, UUIDs their canonical
+    string and enumerations their value, as `orjson` serializes them natively.
+
+    Args:
+        value (Any): The value to convert.
+
+    Returns:
+        Any: The serializable value.
+
+    Raises:
+        TypeError: If the value is not serializable.
+    """
+
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def orjson_dumps (
+    data: Any,
+) -> bytes:
+
+    """
+    Serializes data with `orjson`, which writes the bytes directly without an intermediate string.
+
+    Args:
+        data (Any): The data to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+
+    return orjson.dumps(data, default=encode_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def ujson_dumps (
+    data: Any,
+) -> bytes:
+
+    """
+    Serializes data with `ujson`.
+
+    Args:
+        data (Any): The data to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+
+    return ujson.dumps (
+        data,
+        ensure_ascii=False,
+        escape_forward_slashes=False,
+        default=encode_default,
+    ).encode()
+
+
+def json_dumps (
+    data: Any,
+) -> bytes:
+
+    """
+    Serializes data with the standard `json` module.
+
+    Args:
+        data (Any): The data to serialize.
+
+    Returns:
+        bytes: The UTF-8 encoded JSON document.
+    """
+
+    return json.dumps (
+        data,
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=encode_default,
+    ).encode()
+
+
+JSON_BACKENDS: dict[str, Callable[[Any], bytes] | None] = {
+    'orjson': orjson_dumps if orjson is not None else None,
+    'ujson': ujson_dumps if ujson is not None else None,
+    'json': json_dumps,
+}
+"""
+The JSON serialization backends by name, in order of preference, or None when not installed.
+"""
+
+
+def get_json_backend (
+    name: str = 'auto',
+) -> Callable[[Any], bytes]:
+
+    """
+    Returns the JSON serialization backend with the given name.
+
+    With 'auto', the first available backend of `JSON_BACKENDS` is returned, which is
+    `orjson` when it is installed, then `ujson`, and the standard `json` module otherwise.
+
+    Args:
+        name (str): The name of the backend, or 'auto'.
+
+    Returns:
+        Callable[[Any], bytes]: The function serializing data into a UTF-8 encoded JSON document.
+
+    Raises:
+        SocketIOInproperJsonBackendError: If the backend is unknown or not available.
+    """
+
+    if name == 'auto':
+        return next(backend for backend in JSON_BACKENDS.values() if backend is not None)
+
+    backend = JSON_BACKENDS.get(name)
+    if backend is None:
+        raise SocketIOInproperJsonBackendError(name)
+    return backend
@@ -1,35 +1,84 @@
 """
-This module provides a simple utility class for serializing data into a JSON-formatted string.
+This module provides the `JsonResponse` class, an HTTP response whose body is the JSON serialization of the data.
 """
 
-import json
+from typing import Any, Callable
 
+from returnables.json_backends.json_backends import get_json_backend
+from returnables.response.response import Response
 
-class JsonResponse:
+
+class JsonResponse(Response):
     
     """
-    Utility class for converting Python data structures into JSON strings.
+    An HTTP response with a JSON body.
+
+    The data is serialized once when the response is created, straight to bytes with the
+    fastest available backend (`orjson`, then `ujson`, then `json`), and sent with an
+    `application/json` content type when a handler returns the response. Dataclasses,
+    datetimes, UUIDs and enumerations are serialized by every backend.
 
-    This class overrides the __new__ method to directly return the JSON string,
-    allowing the class to be used as a callable wrapper around `json.dumps`.
+    Attributes:
+        data (Any): The serialized data.
+        serializer (Callable[[Any], bytes]): The serialization backend, shared by all responses.
     """
 
-    def __new__(
-        cls,
-        data,
-    ) -> str:
+    media_type = "application/json"
+    serializer = staticmethod(get_json_backend())
+
+    def __init__ (
+        self,
+        data: Any,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ) -> None:
         
         """
-        Converts the input data to a JSON-formatted string.
+        Serializes the data into the body of the response.
 
         Args:
             data (Any): A serializable Python object (e.g., dict, list).
+            status_code (int, optional): The HTTP status code to use. Defaults to 200.
+            headers (dict[str, str] | None, optional): The custom headers of the response. Defaults to None.
 
-        Returns:
-            str: A JSON string representation of the input data.
+        Raises:
+            TypeError: If the data is not serializable.
+        """
+        
+        self.data = data
+        super().__init__(data, status_code, headers)
+
+    @classmethod
+    def use_backend (
+        cls,
+        name: str,
+    ) -> None:
+        
+        """
+        Selects the serialization backend of every JSON response.
+
+        Args:
+            name (str): The name of the backend ('auto', 'orjson', 'ujson' or 'json').
 
         Raises:
-            TypeError: If the data is not serializable by `json.dumps`.
+            SocketIOInproperJsonBackendError: If the backend is unknown or not available.
+        """
+        
+        cls.serializer = staticmethod(get_json_backend(name))
+
+    def render_body (
+        self,
+        content: Any,
+    ) -> bytes:
+        
+        """
+        Serializes the data into the JSON body.
+
+        Args:
+            content (Any): The data given to the response.
+
+        Returns:
+            bytes: The UTF-8 encoded JSON document.
         """
         
-        return json.dumps(data)
+        return self.serializer(content)
@@ -0,0 +1,240 @@
+"""
+This module defines the `Response` class, the bytes-first HTTP response returned by handlers
+and written by the server, along with the caches of the header blocks shared by all responses.
+"""
+
+import time
+
+from email.utils import formatdate
+from http import HTTPStatus
+from typing import Any
+
+
+STATUS_LINES: dict[int, bytes] = {
+    status.value: f"HTTP/1.1 {status.value} {status.phrase}\r\n".encode()
+    for status in HTTPStatus
+}
+"""
+The encoded status lines of the standard status codes.
+"""
+
+CONNECTION_HEADERS: dict[bool, bytes] = {
+    True: b"Connection: keep-alive\r\n\r\n",
+    False: b"Connection: close\r\n\r\n",
+}
+"""
+The encoded `Connection` header closing the head of a response, by keep-alive state.
+"""
+
+BODILESS_STATUSES = frozenset((204, 304))
+"""
+The statuses whose responses never have a body, and no `Content-Length` header.
+"""
+
+_content_type_headers: dict[str, bytes] = {}
+_date_header = [0, b""]
+
+
+def get_status_line (
+    status_code: int,
+) -> bytes:
+
+    """
+    Returns the encoded status line of a status code, encoding it once for non-standard codes.
+
+    Args:
+        status_code (int): The HTTP status code.
+
+    Returns:
+        bytes: The status line, ending with CRLF.
+    """
+
+    status_line = STATUS_LINES.get(status_code)
+    if status_line is None:
+        status_line = STATUS_LINES[status_code] = f"HTTP/1.1 {status_code} \r\n".encode()
+    return status_line
+
+
+def get_date_header (
+) -> bytes:
+
+    """
+    Returns the encoded `Date` header of the current second.
+
+    The header is formatted at most once per second and shared by every response in between.
+
+    Returns:
+        bytes: The `Date` header line, ending with CRLF.
+    """
+
+    now = int(time.time())
+    if _date_header[0] != now:
+        _date_header[0] = now
+        _date_header[1] = f"Date: {formatdate(now, usegmt=True)}\r\n".encode()
+    return _date_header[1]
+
+
+def get_content_type_header (
+    media_type: str,
+) -> bytes:
+
+    """
+    Returns the encoded `Content-Type` header of a media type, encoding it once.
+
+    Args:
+        media_type (str): The media type of the body (e.g., "application/json").
+
+    Returns:
+        bytes: The `Content-Type` header line, ending with CRLF.
+    """
+
+    header = _content_type_headers.get(media_type)
+    if header is None:
+        header = _content_type_headers[media_type] = f"Content-Type: {media_type}\r\n".encode('latin-1')
+    return header
+
+
+class Response:
+
+    """
+    An HTTP response whose body is held as bytes.
+
+    The head is assembled from cached blocks: the status line, the `Date` header refreshed once
+    per second and the `Content-Type` header are encoded once and shared across responses, and
+    the custom headers of a response are encoded once however many times it is rendered.
+    Rendering returns the head and the body as separate buffers, which the server writes
+    with a single scatter-gather send instead of concatenating them.
+
+    Attributes:
+        body (bytes): The body of the response.
+        status_code (int): The HTTP status code.
+        headers (dict[str, str]): The custom headers of the response.
+        media_type (str): The media type of the body, sent as `Content-Type`.
+        raw_headers (bytes): Pre-encoded header lines sent after the custom headers, each ending with CRLF.
+    """
+
+    media_type = "text/plain; charset=utf-8"
+
+    def __init__ (
+        self,
+        content: Any = b"",
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+        raw_headers: bytes = b"",
+    ) -> None:
+
+        """
+        Initializes the response.
+
+        Args:
+            content (Any, optional): The body of the response. Bytes are sent as they are, and any other
+                                     value is converted to a string and encoded as UTF-8. Defaults to no body.
+            status_code (int, optional): The HTTP status code. Defaults to 200.
+            headers (dict[str, str] | None, optional): The custom headers of the response. Defaults to None.
+            media_type (str | None, optional): The media type of the body. Defaults to the media type of the class.
+            raw_headers (bytes, optional): Pre-encoded header lines, each ending with CRLF. Defaults to none.
+        """
+
+        self.body = self.render_body(content)
+        self.status_code = status_code
+        self.headers = headers or {}
+        if media_type is not None:
+            self.media_type = media_type
+        self.raw_headers = raw_headers
+        self._header_block = None
+
+    def render_body (
+        self,
+        content: Any,
+    ) -> bytes:
+
+        """
+        Encodes the content of the response into its body.
+
+        Args:
+            content (Any): The content given to the response.
+
+        Returns:
+            bytes: The body of the response.
+        """
+
+        if isinstance(content, (bytes, bytearray, memoryview)):
+            return content
+        return str(content).encode()
+
+    def render_head (
+        self,
+        keep_alive: bool,
+    ) -> bytes:
+
+        """
+        Builds the head of the response, delimiting the body with a `Content-Length` header,
+        except for the statuses that never have a body.
+
+        Args:
+            keep_alive (bool): Whether the connection stays open after the response.
+
+        Returns:
+            bytes: The encoded status line and headers, ending with an empty line.
+        """
+
+        return b"".join ((
+            get_status_line(self.status_code),
+            get_date_header(),
+            self.get_header_block(),
+            b"Content-Length: %d\r\n" % self.content_length if self.status_code not in BODILESS_STATUSES else b"",
+            CONNECTION_HEADERS[keep_alive],
+        ))
+
+    def get_header_block (
+        self,
+    ) -> bytes:
+
+        """
+        Returns the encoded `Content-Type`, custom and raw headers of the response, encoding them once.
+
+        Returns:
+            bytes: The header lines, each ending with CRLF.
+        """
+
+        if self._header_block is None:
+            self._header_block = get_content_type_header(self.media_type) + "".join (
+                f"{name}: {value}\r\n" for name, value in self.headers.items()
+            ).encode('latin-1') + self.raw_headers
+        return self._header_block
+
+    @property
+    def content_length (
+        self,
+    ) -> int:
+
+        """
+        The number of bytes announced in the `Content-Length` header.
+        """
+
+        return len(self.body)
+
+    def render (
+        self,
+        keep_alive: bool,
+        include_body: bool = True,
+    ) -> list[bytes]:
+
+        """
+        Renders the response into the buffers written to the client.
+
+        The response to a HEAD request keeps the `Content-Length` header of the body it leaves out.
+
+        Args:
+            keep_alive (bool): Whether the connection stays open after the response.
+            include_body (bool, optional): Whether to write the body, which is False when answering
+                                           a HEAD request. Defaults to True.
+
+        Returns:
+            list[bytes]: The head and the body of the response.
+        """
+
+        if not include_body:
+            return [self.render_head(keep_alive)]
+        return [self.render_head(keep_alive), self.body]
@@ -0,0 +1,184 @@
+"""
+This module provides the `StreamingResponse` class, an HTTP response whose body is produced
+by an iterator while it is written to the client.
+"""
+
+import asyncio
+import socket
+
+from typing import Any, AsyncIterable, Iterable
+
+from returnables.response.response import (
+    CONNECTION_HEADERS,
+    Response,
+    get_date_header,
+    get_status_line,
+)
+
+from utils.socket_writer.socket_writer import send_buffers
+
+
+CHUNKED_HEADER = b"Transfer-Encoding: chunked\r\n"
+LAST_CHUNK = b"0\r\n\r\n"
+
+
+class StreamingResponse(Response):
+
+    """
+    An HTTP response streaming the items of a synchronous or asynchronous iterator.
+
+    The body is never held in memory: every item is written as soon as it is produced, with
+    `Transfer-Encoding: chunked`, and the next item is only pulled once the previous one has
+    been accepted by the socket, so a slow client slows the producer down instead of
+    letting the unsent data pile up. Items of a synchronous iterator, which are available
+    right away, are gathered into chunks of up to `chunk_size` bytes to save writes, and
+    the event loop is yielded to between chunks. Items of an asynchronous iterator are
+    written as they arrive.
+
+    For an HTTP/1.0 client, which does not understand chunked bodies, the body is written
+    as it is and delimited by closing the connection.
+
+    Attributes:
+        content (Iterable | AsyncIterable): The iterator producing the body.
+        chunk_size (int): The size synchronous items are gathered into before a write, in bytes.
+    """
+
+    def __init__ (
+        self,
+        content: Iterable[Any] | AsyncIterable[Any],
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+        media_type: str | None = None,
+        chunk_size: int = 65536,
+    ) -> None:
+
+        """
+        Initializes the streaming response.
+
+        Args:
+            content (Iterable[Any] | AsyncIterable[Any]): The iterator producing the body. Bytes items
+                                                          are sent as they are, and any other item
+                                                          is converted to a string and encoded as UTF-8.
+            status_code (int, optional): The HTTP status code. Defaults to 200.
+            headers (dict[str, str] | None, optional): The custom headers of the response. Defaults to None.
+            media_type (str | None, optional): The media type of the body. Defaults to the media type of the class.
+            chunk_size (int, optional): The size synchronous items are gathered into before a write,
+                                        in bytes. Defaults to 64 KiB.
+        """
+
+        super().__init__(b"", status_code, headers, media_type)
+        self.content = content
+        self.chunk_size = chunk_size
+
+    def render_head (
+        self,
+        keep_alive: bool,
+        chunked: bool = True,
+    ) -> bytes:
+
+        """
+        Builds the head of the response, announcing a chunked body.
+
+        Args:
+            keep_alive (bool): Whether the connection stays open after the response.
+            chunked (bool, optional): Whether the body is chunked. Defaults to True.
+
+        Returns:
+            bytes: The encoded status line and headers, ending with an empty line.
+        """
+
+        return b"".join ((
+            get_status_line(self.status_code),
+            get_date_header(),
+            self.get_header_block(),
+            CHUNKED_HEADER if chunked else b"",
+            CONNECTION_HEADERS[keep_alive],
+        ))
+
+    def render (
+        self,
+        keep_alive: bool,
+        include_body: bool = True,
+    ) -> list[bytes]:
+
+        """
+        Renders the head of the response, as the body is written by `stream`.
+
+        Args:
+            keep_alive (bool): Whether the connection stays open after the response.
+            include_body (bool, optional): Whether the body is written, which does not change the head. Defaults to True.
+
+        Returns:
+            list[bytes]: The head of the response.
+        """
+
+        return [self.render_head(keep_alive)]
+
+    async def stream (
+        self,
+        client_socket: socket.socket,
+        chunked: bool = True,
+    ) -> None:
+
+        """
+        Writes the body to the client as the iterator produces it.
+
+        The iterator is closed once the body is written, or when writing fails.
+
+        Args:
+            client_socket (socket.socket): The client socket, once the head has been written.
+            chunked (bool, optional): Whether to write the body with chunked encoding. Defaults to True.
+
+        Raises:
+            OSError: If the connection fails while writing.
+        """
+
+        content = self.content
+        try:
+            if hasattr(content, '__aiter__'):
+                async for item in content:
+                    await self._write_chunk(client_socket, [self.render_body(item)], chunked)
+            else:
+                parts, size = [], 0
+                for item in content:
+                    part = self.render_body(item)
+                    parts.append(part)
+                    size += len(part)
+                    if size >= self.chunk_size:
+                        await self._write_chunk(client_socket, parts, chunked)
+                        await asyncio.sleep(0)
+                        parts, size = [], 0
+                await self._write_chunk(client_socket, parts, chunked)
+
+            if chunked:
+                await send_buffers(client_socket, [LAST_CHUNK])
+        finally:
+            if hasattr(content, 'aclose'):
+                await content.aclose()
+            elif hasattr(content, 'close'):
+                content.close()
+
+    async def _write_chunk (
+        self,
+        client_socket: socket.socket,
+        parts: list[bytes],
+        chunked: bool,
+    ) -> None:
+
+        """
+        Writes parts of the body as a single chunk, without joining them.
+
+        Args:
+            client_socket (socket.socket): The client socket.
+            parts (list[bytes]): The parts of the chunk.
+            chunked (bool): Whether to frame the parts as a chunk.
+        """
+
+        size = sum(len(part) for part in parts)
+        if not size:
+            return
+
+        if chunked:
+            await send_buffers(client_socket, [b"%x\r\n" % size, *parts, b"\r\n"])
+        else:
+            await send_buffers(client_socket, parts)
@@ -0,0 +1,58 @@
+"""
+This module defines the path converters of typed route placeholders such as `<int:id>`,
+which validate a path segment and convert it before the handler is called.
+"""
+
+import re
+import uuid
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class PathConverter:
+
+    """
+    A typed path placeholder.
+
+    Attributes:
+        name (str): The name of the converter used in placeholders (e.g., 'int').
+        pattern (str): The regular expression a matching value fully matches.
+        convert (Callable[[str], Any]): The function converting a matching value.
+        priority (int): The order the converter is tried in among the placeholders of a segment,
+                        lowest first, so the most specific converter wins.
+        match (Callable[[str], Any]): The precompiled full match of `pattern`.
+    """
+
+    name: str
+    pattern: str
+    convert: Callable[[str], Any]
+    priority: int
+
+    def __post_init__ (
+        self,
+    ) -> None:
+
+        object.__setattr__(self, 'match', re.compile(self.pattern).fullmatch)
+
+
+PATH_CONVERTERS: dict[str, PathConverter] = {
+    converter.name: converter
+    for converter in (
+        PathConverter('int', r'[0-9]+', int, 0),
+        PathConverter('uuid', r'[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}', uuid.UUID, 1),
+        PathConverter('slug', r'[-a-zA-Z0-9_]+', str, 2),
+        PathConverter('str', r'[^/]+', str, 3),
+        PathConverter('path', r'.+', str, 4),
+    )
+}
+"""
+The available path converters by name. A placeholder without a converter uses 'str',
+and 'path' matches the rest of the path, slashes included.
+"""
+
+PLACEHOLDER_PATTERN = re.compile(r"<(?:(\w+):)?(\w+)>")
+"""
+The pattern of a placeholder, capturing its optional converter name and its parameter name.
+"""
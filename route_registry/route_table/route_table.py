@@ -0,0 +1,117 @@
+"""
+This module defines the `RouteTable` class, the read-only routing table compiled from the
+registered routes when the server starts.
+"""
+
+from types import MappingProxyType
+from typing import Any, Callable
+
+from route_registry.route_tree.route_tree import RouteTree
+
+
+class RouteTable:
+
+    """
+    An immutable routing table indexed by method and path.
+
+    A static route is found with a single dictionary access keyed by `(method, path)`.
+    Other paths are matched against the frozen tree of dynamic routes. The `Allow` header
+    of every route path is computed once when the table is built, so a request with
+    a method the path does not serve is answered with a 405 at no extra cost. When several
+    route paths match the path of a request, their `Allow` headers are merged.
+    """
+
+    __slots__ = ('_routes', '_methods', '_allow', '_tree', '_websockets')
+
+    def __init__ (
+        self,
+        routes: dict[tuple[str, str], dict[str, Any]],
+        tree: RouteTree,
+        websockets: dict[str, Callable[..., None]],
+    ) -> None:
+
+        """
+        Builds the table from the static routes, the tree of dynamic routes and the WebSocket routes.
+
+        Args:
+            routes (dict[tuple[str, str], dict[str, Any]]): The static routes, by method and path.
+            tree (RouteTree): The tree of dynamic routes, frozen by the table.
+            websockets (dict[str, Callable[..., None]]): The handlers of the WebSocket routes, by path.
+        """
+
+        methods = {}
+        for method, path in routes:
+            methods.setdefault(path, []).append(method)
+
+        self._routes = dict(routes)
+        self._methods = {path: tuple(path_methods) for path, path_methods in methods.items()}
+        self._allow = {
+            path: f"Allow: {', '.join(path_methods)}\r\n".encode()
+            for path, path_methods in methods.items()
+        }
+        self._tree = tree
+        self._tree.freeze()
+        self._websockets = dict(websockets)
+
+    @property
+    def routes (
+        self,
+    ) -> MappingProxyType:
+
+        """
+        A read-only view of the static routes, by method and path.
+        """
+
+        return MappingProxyType(self._routes)
+
+    @property
+    def websockets (
+        self,
+    ) -> MappingProxyType:
+
+        """
+        A read-only view of the handlers of the WebSocket routes, by path.
+        """
+
+        return MappingProxyType(self._websockets)
+
+    def lookup (
+        self,
+        method: str,
+        path: str,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any], bytes | None]:
+
+        """
+        Finds the route serving a request.
+
+        A static route is tried first, then the dynamic routes serving the method, so a route path
+        only serving other methods does not hide a route of the tree serving the method.
+
+        Args:
+            method (str): The HTTP method of the request.
+            path (str): The path of the request.
+
+        Returns:
+            tuple[dict[str, Any] | None, dict[str, Any], bytes | None]: The matched route, or None, the
+                converted parameters captured from the path, and, when the path exists but does not
+                serve the method, the precomputed and encoded `Allow` header line of the path.
+        """
+
+        route = self._routes.get((method, path))
+        if route is not None:
+            return route, {}, None
+
+        node, params, skipped = self._tree.match(path, method)
+        if node is not None:
+            return node.routes[method], params, None
+
+        allow = self._allow.get(path)
+        if len(skipped) == 1 and allow is None:
+            allow = skipped[0].allow
+        elif skipped:
+            methods = dict.fromkeys(self._methods.get(path, ()))
+            for node in skipped:
+                methods.update(dict.fromkeys(node.routes))
+            allow = f"Allow: {', '.join(methods)}\r\n".encode()
+
+        return None, {}, allow
@@ -0,0 +1,272 @@
+"""
+This module defines the `RouteTree` class, a prefix tree of path segments used to match
+dynamic routes such as `/users/<int:id>` without scanning every registered route.
+"""
+
+from types import MappingProxyType
+from typing import Any
+
+from exceptions.handler_exceptions.invalid_route_path import InvalidRoutePath
+
+from route_registry.path_converters.path_converters import (
+    PATH_CONVERTERS,
+    PLACEHOLDER_PATTERN,
+    PathConverter,
+)
+
+
+class RouteNode:
+
+    """
+    A node of the route tree, standing for one path segment.
+
+    Attributes:
+        static (dict[str, RouteNode]): The children matching a literal segment, by segment.
+        params (list[tuple[str, PathConverter, RouteNode]]): The children matching a placeholder, with the
+                                                             name and converter of the parameter, in the
+                                                             order their converters are tried.
+        routes (dict[str, dict]): The routes registered for the path ending at this node, by method.
+        allow (bytes | None): The encoded `Allow` header listing the methods of `routes`, set once the tree is frozen.
+    """
+
+    __slots__ = ('static', 'params', 'routes', 'allow')
+
+    def __init__ (
+        self,
+    ) -> None:
+
+        self.static = {}
+        self.params = []
+        self.routes = {}
+        self.allow = None
+
+
+class RouteTree:
+
+    """
+    A prefix tree of path segments matching static and `<param>` segments.
+
+    A path is matched segment by segment from the root, so the cost of a match depends on
+    the length of the path and not on the number of registered routes. At every node,
+    literal segments are tried before parameters, so `/users/me` wins over `/users/<id>`.
+
+    Parameters only match whole, non-empty segments. A typed placeholder such as `<int:id>`
+    only matches segments its precompiled converter accepts, and captures the converted
+    value, so a request with a malformed parameter is rejected while routing. Placeholders
+    of the same segment are tried from the most specific converter to the least specific,
+    and a `<path:name>` placeholder, which must end the route, captures the rest of the path.
+    """
+
+    def __init__ (
+        self,
+    ) -> None:
+
+        """
+        Initializes an empty tree.
+        """
+
+        self.root = RouteNode()
+
+    @staticmethod
+    def parse_path (
+        path: str,
+    ) -> list[str | tuple[str, PathConverter]]:
+
+        """
+        Splits a route path into literal segments and placeholders.
+
+        Args:
+            path (str): The route path, where `<name>` or `<converter:name>` segments capture a parameter.
+
+        Returns:
+            list[str | tuple[str, PathConverter]]: The literal segments, and the name and converter
+                                                   of every placeholder.
+
+        Raises:
+            InvalidRoutePath: If a placeholder is malformed or uses an unknown converter.
+        """
+
+        parsed = []
+        segments = RouteTree.split_path(path)
+        for index, segment in enumerate(segments):
+            placeholder = PLACEHOLDER_PATTERN.fullmatch(segment)
+            if placeholder:
+                converter = PATH_CONVERTERS.get(placeholder.group(1) or 'str')
+                if converter is None:
+                    raise InvalidRoutePath(path, f"unknown path converter '{placeholder.group(1)}'")
+                if converter.name == 'path' and index != len(segments) - 1:
+                    raise InvalidRoutePath(path, "a path parameter must be the last segment")
+                parsed.append((placeholder.group(2), converter))
+            elif '<' in segment or '>' in segment:
+                raise InvalidRoutePath(path, "placeholders must span a whole segment")
+            else:
+                parsed.append(segment)
+
+        return parsed
+
+    def insert (
+        self,
+        path: str,
+        method: str,
+        route: dict[str, Any],
+    ) -> None:
+
+        """
+        Registers the route of a method in the tree.
+
+        Args:
+            path (str): The route path, where `<name>` or `<converter:name>` segments capture a parameter.
+            method (str): The HTTP method served by the route.
+            route (dict[str, Any]): The route definition returned when the path and method match.
+
+        Raises:
+            InvalidRoutePath: If a placeholder is malformed or uses an unknown converter.
+        """
+
+        node = self.root
+        for segment in self.parse_path(path):
+            if isinstance(segment, str):
+                node = node.static.setdefault(segment, RouteNode())
+                continue
+
+            name, converter = segment
+            child = next ((
+                child for param, param_converter, child in node.params
+                if param == name and param_converter is converter
+            ), None)
+            if child is None:
+                child = RouteNode()
+                node.params.append((name, converter, child))
+                node.params.sort(key=lambda param: param[1].priority)
+            node = child
+
+        node.routes[method] = route
+
+    def freeze (
+        self,
+    ) -> None:
+
+        """
+        Makes the tree read-only and precomputes the `Allow` header of every route path.
+        """
+
+        nodes = [self.root]
+        while nodes:
+            node = nodes.pop()
+            if node.routes:
+                node.allow = f"Allow: {', '.join(node.routes)}\r\n".encode()
+            node.routes = MappingProxyType(node.routes)
+            node.static = MappingProxyType(node.static)
+            node.params = tuple(node.params)
+            nodes.extend(node.static.values())
+            nodes.extend(child for _, _, child in node.params)
+
+    def match (
+        self,
+        path: str,
+        method: str,
+    ) -> tuple[RouteNode | None, dict[str, Any], list[RouteNode]]:
+
+        """
+        Finds the node of the route path matching a request path and serving its method.
+
+        A route path matching the request path without serving the method does not stop the
+        search, so a literal branch does not shadow a parameter serving the method.
+
+        Args:
+            path (str): The path of the request.
+            method (str): The HTTP method of the request.
+
+        Returns:
+            tuple[RouteNode | None, dict[str, Any], list[RouteNode]]: The matched node, or None, the converted
+                                                                      parameters captured from the path, and the
+                                                                      nodes of the route paths matching the path
+                                                                      without serving the method.
+        """
+
+        params = {}
+        skipped = []
+        node = self._match(self.root, self.split_path(path), 0, params, method, skipped)
+        return node, params, skipped
+
+    @staticmethod
+    def split_path (
+        path: str,
+    ) -> list[str]:
+
+        """
+        Splits a path into its segments, keeping empty segments so a trailing slash is significant.
+
+        Args:
+            path (str): The path, starting with '/'.
+
+        Returns:
+            list[str]: The segments of the path.
+        """
+
+        return path[1:].split('/') if path.startswith('/') else path.split('/')
+
+    def _match (
+        self,
+        node: RouteNode,
+        segments: list[str],
+        index: int,
+        params: dict[str, Any],
+        method: str,
+        skipped: list[RouteNode],
+    ) -> RouteNode | None:
+
+        """
+        Matches the segments of a path from `index` against the subtree of `node`.
+
+        Literal children are tried first. When a branch does not lead to a route serving the method,
+        the next candidate is tried and the parameters captured along the failed branch are dropped.
+
+        Args:
+            node (RouteNode): The node the remaining segments are matched from.
+            segments (list[str]): The segments of the path.
+            index (int): The index of the next segment to match.
+            params (dict[str, Any]): The converted parameters captured so far, filled in place.
+            method (str): The HTTP method of the request.
+            skipped (list[RouteNode]): The nodes of the route paths matched without serving the method, filled in place.
+
+        Returns:
+            RouteNode | None: The node of the matched route path, or None.
+        """
+
+        if index == len(segments):
+            if method in node.routes:
+                return node
+            if node.routes:
+                skipped.append(node)
+            return None
+
+        segment = segments[index]
+        child = node.static.get(segment)
+        if child is not None:
+            matched = self._match(child, segments, index + 1, params, method, skipped)
+            if matched is not None:
+                return matched
+
+        if segment:
+            for name, converter, child in node.params:
+                if converter.name == 'path':
+                    value = '/'.join(segments[index:])
+                    if not child.routes or converter.match(value) is None:
+                        continue
+                    if method in child.routes:
+                        params[name] = value
+                        return child
+                    skipped.append(child)
+                    continue
+
+                if converter.match(segment) is None:
+                    continue
+
+                params[name] = converter.convert(segment)
+                matched = self._match(child, segments, index + 1, params, method, skipped)
+                if matched is not None:
+                    return matched
+                del params[name]
+
+        return None
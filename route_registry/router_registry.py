@@ -3,9 +3,18 @@ This module defines the `RouteRegistry` class for managing and registering both
 It includes functionality for converting path patterns to regular expressions and registering both dynamic and static routes.
 """
 
+import inspect
 import re
 
-from typing import Callable, List
+from typing import Any, Callable, Iterator, List
+
+from exceptions.handler_exceptions.invalid_route_path import InvalidRoutePath
+
+from parsers.request_parser.http_request import READ_METHODS
+
+from route_registry.path_converters.path_converters import PATH_CONVERTERS, PLACEHOLDER_PATTERN
+from route_registry.route_table.route_table import RouteTable
+from route_registry.route_tree.route_tree import RouteTree
 
 
 class RouteRegistry:
@@ -13,8 +22,20 @@ class RouteRegistry:
     """
     A class responsible for registering and managing API and WebSocket routes.
 
+    Routes are compiled into an immutable `RouteTable` when the server starts, where
+    static routes are found with a single dictionary access keyed by method and path,
+    and dynamic routes by walking a frozen `RouteTree` of path segments.
+
+    Registries included under a prefix are merged into the same table when it is compiled,
+    so routes of mounted sub-routers cost no more to look up than routes of the application.
+    Every compilation builds a new table, but a mounted route keeps the same merged definition
+    from one table to the next, so the state built on it, such as its constant response, survives
+    the routes being compiled again.
+
     Attributes:
-        routes (dict): A dictionary to store static and dynamic API routes with their corresponding handlers.
+        routes (dict): A dictionary to store static and dynamic API routes by method and path.
+        mounts (list[tuple[str, RouteRegistry]]): The included registries with their path prefix.
+        table (RouteTable | None): The compiled routing table, or None until the routes are compiled.
         websockets (dict): A dictionary to store WebSocket routes with their corresponding handlers.
     """
     
@@ -27,7 +48,10 @@ class RouteRegistry:
         """
         
         self.routes = {}
+        self.mounts = []
+        self.table = None
         self.websockets = {}
+        self._mounted = {}
         
     def convert_path_to_regex (
         self, 
@@ -35,16 +59,31 @@ class RouteRegistry:
     ) -> str:
         
         """
-        Converts a dynamic path pattern (e.g., "/api/v1/<id>") to a regular expression pattern.
+        Converts a dynamic path pattern (e.g., "/api/v1/<int:id>") to a regular expression pattern.
+
+        Typed placeholders are replaced with the pattern of their path converter, and untyped
+        placeholders match any single segment.
 
         Args:
             path (str): The dynamic route path that may contain placeholders enclosed in "<>".
         
         Returns:
             str: A regular expression pattern representing the dynamic path.
+
+        Raises:
+            InvalidRoutePath: If a placeholder uses an unknown converter.
         """
         
-        return "^" + re.sub(r"<(\w+)>", r"(?P<\1>[^/]+)", path) + "$"
+        def replace (
+            placeholder: re.Match,
+        ) -> str:
+            
+            converter = PATH_CONVERTERS.get(placeholder.group(1) or 'str')
+            if converter is None:
+                raise InvalidRoutePath(path, f"unknown path converter '{placeholder.group(1)}'")
+            return f"(?P<{placeholder.group(2)}>{converter.pattern})"
+        
+        return "^" + PLACEHOLDER_PATTERN.sub(replace, path) + "$"
     
     def add_route (
         self,
@@ -52,34 +91,245 @@ class RouteRegistry:
         handler: Callable[..., None],
         methods: List[str],
         protected: bool,
+        max_body_size: int | None = None,
+        cache_ttl: float | None = None,
+        etag: bool | Callable[..., Any] = False,
+        constant: bool | int = False,
     ) -> None:
         
         """
         Registers a new API route with the given path, handler, allowed methods, and protection status.
 
+        The route is registered once for each of its methods. The signature of the handler is
+        inspected once here, so serving a request only needs a lookup to know whether the handler
+        takes the request object.
+
         Args:
-            path (str): The route path, which may be static or dynamic (containing placeholders).
+            path (str): The route path, which may be static or dynamic (containing placeholders
+                        such as `<id>` or `<int:id>`).
             handler (Callable[..., None]): The handler function to be called when the route is matched.
             methods (List[str]): A list of HTTP methods (e.g., "GET", "POST") allowed for this route.
             protected (bool): A flag indicating whether the route requires protection (e.g., authentication).
+            max_body_size (int | None): The maximum size of a request body accepted by this route, in bytes,
+                                        or None to use the server default.
+            cache_ttl (float | None): The number of seconds the responses of this route are served from
+                                      the response cache, or None to only cache the responses whose
+                                      `Cache-Control` header allows it.
+            etag (bool | Callable[..., Any]): Whether the responses of this route get an `ETag` and
+                                              conditional requests are answered with a 304: True to
+                                              hash the body, or a function returning the version of
+                                              the resource, called with the arguments of the handler.
+            constant (bool | int): Whether the handler always returns the same response, which is then
+                                   encoded once and written to every request without running the handler:
+                                   True to build it when the server starts, or the number of identical
+                                   responses in a row after which it is frozen. Only GET and HEAD routes
+                                   can be constant, as other methods are expected to have effects.
+
+        Raises:
+            InvalidRoutePath: If a placeholder of the path is malformed or uses an unknown converter,
+                              or if a constant route has a dynamic path, takes the request, or serves
+                              a method other than GET and HEAD.
         """
         
-        if "<" in path and ">" in path:
-            regex = self.convert_path_to_regex(path)
-            self.routes[regex] = {
-                'handler': handler,
-                'methods': methods,
-                'dynamic': True,
-                'original': path,
-                'protected': protected
-            }
-        else:
-            self.routes[path] = {
-                'handler': handler,
-                'methods': methods,
-                'dynamic': False,
-                'protected': protected
-            }
+        dynamic = "<" in path and ">" in path
+        if dynamic:
+            RouteTree.parse_path(path)
+        
+        wants_request = 'request' in inspect.signature(handler).parameters
+        if constant and (dynamic or wants_request):
+            raise InvalidRoutePath(path, "a constant route cannot depend on the request")
+        
+        methods = [method.upper() for method in methods]
+        if constant and not READ_METHODS.issuperset(methods):
+            raise InvalidRoutePath(path, "a constant route can only serve GET and HEAD")
+        
+        route = {
+            'path': path,
+            'handler': handler,
+            'methods': methods,
+            'dynamic': dynamic,
+            'protected': protected,
+            'max_body_size': max_body_size,
+            'cache_ttl': cache_ttl,
+            'etag': etag,
+            'etag_wants_request': callable(etag) and 'request' in inspect.signature(etag).parameters,
+            'constant': constant,
+            'wants_request': wants_request,
+        }
+        for method in route['methods']:
+            self.routes[(method, path)] = route
+        self.table = None
+    
+    def include (
+        self,
+        registry: 'RouteRegistry',
+        prefix: str = "",
+    ) -> None:
+        
+        """
+        Mounts the routes of another registry under a path prefix.
+
+        The routes are not copied here but merged when the routing table is compiled,
+        so routes added to the included registry afterwards are mounted as well.
+
+        Args:
+            registry (RouteRegistry): The registry to include.
+            prefix (str): The prefix of the mounted paths (e.g., "/api/v1"), which may contain
+                          placeholders, or an empty string to mount the routes as they are.
+
+        Raises:
+            InvalidRoutePath: If the prefix does not start with '/', ends with '/',
+                              or the registry already includes this one.
+        """
+        
+        if prefix and (not prefix.startswith('/') or prefix.endswith('/')):
+            raise InvalidRoutePath(prefix, "a prefix must start with '/' and not end with '/'")
+        if "<" in prefix and ">" in prefix:
+            RouteTree.parse_path(prefix)
+        if registry is self or self in registry._registries():
+            raise InvalidRoutePath(prefix or '/', "a router cannot include itself")
+        
+        self.mounts.append((prefix, registry))
+        self.table = None
+    
+    def compile (
+        self,
+    ) -> RouteTable:
+        
+        """
+        Compiles the registered and included routes into an immutable routing table.
+
+        Routes registered afterwards invalidate the table, which is then compiled again
+        on the next lookup. The WebSocket routes of included registries are merged into
+        the `websockets` of the table under their prefix.
+
+        Returns:
+            RouteTable: The compiled routing table.
+
+        Raises:
+            InvalidRoutePath: If an included route is already registered for the same method and path.
+        """
+        
+        static = {}
+        dynamic = set()
+        tree = RouteTree()
+        mounted = {}
+        for method, path, route in self._collect_routes("", self._mounted, mounted):
+            if (method, path) in static or (method, path) in dynamic:
+                raise InvalidRoutePath(path, f"{method} is already routed")
+            if route['dynamic']:
+                dynamic.add((method, path))
+                tree.insert(path, method, route)
+            else:
+                static[(method, path)] = route
+        
+        websockets = {}
+        for path, handler in self._collect_websockets(""):
+            websockets.setdefault(path, handler)
+        
+        self._mounted = mounted
+        self.table = RouteTable(static, tree, websockets)
+        return self.table
+    
+    def lookup (
+        self,
+        method: str,
+        path: str,
+    ) -> tuple[dict[str, Any] | None, dict[str, Any], bytes | None]:
+        
+        """
+        Finds the API route serving a request in the compiled routing table.
+
+        Args:
+            method (str): The HTTP method of the request.
+            path (str): The path of the request.
+
+        Returns:
+            tuple[dict[str, Any] | None, dict[str, Any], bytes | None]: The matched route, or None, the
+                converted parameters captured from the path, and the encoded `Allow` header line of the path
+                when it exists but does not serve the method.
+        """
+        
+        return (self.table or self.compile()).lookup(method, path)
+            
+    def _collect_routes (
+        self,
+        prefix: str,
+        previous: dict[tuple[str, int], tuple[dict[str, Any], dict[str, Any]]],
+        mounted: dict[tuple[str, int], tuple[dict[str, Any], dict[str, Any]]],
+    ) -> Iterator[tuple[str, str, dict[str, Any]]]:
+        
+        """
+        Yields the routes of this registry and of the included registries, recursively.
+
+        Mounted routes are copies holding their full path. The copy made by the previous compilation
+        is reused while it still mounts the same route under the same prefix.
+
+        Args:
+            prefix (str): The prefix this registry is mounted under.
+            previous (dict[tuple[str, int], tuple[dict[str, Any], dict[str, Any]]]): The mounted routes
+                of the previous compilation, by prefix and route identity, with the route they copy.
+            mounted (dict[tuple[str, int], tuple[dict[str, Any], dict[str, Any]]]): The mounted routes
+                collected so far, by prefix and route identity, with the route they copy.
+
+        Returns:
+            Iterator[tuple[str, str, dict[str, Any]]]: The method, full path and definition of every route.
+        """
+        
+        for (method, path), route in self.routes.items():
+            if prefix:
+                key = (prefix, id(route))
+                if key not in mounted:
+                    copy = previous.get(key)
+                    if copy is None or copy[0] is not route:
+                        full_path = prefix + path
+                        copy = (route, {
+                            **route,
+                            'path': full_path,
+                            'dynamic': "<" in full_path and ">" in full_path,
+                        })
+                    mounted[key] = copy
+                route = mounted[key][1]
+            yield method, prefix + path, route
+        
+        for mount_prefix, registry in self.mounts:
+            yield from registry._collect_routes(prefix + mount_prefix, previous, mounted)
+    
+    def _collect_websockets (
+        self,
+        prefix: str,
+    ) -> Iterator[tuple[str, Callable[..., None]]]:
+        
+        """
+        Yields the WebSocket routes of this registry and of the included registries, recursively.
+
+        Args:
+            prefix (str): The prefix this registry is mounted under.
+
+        Returns:
+            Iterator[tuple[str, Callable[..., None]]]: The full path and handler of every WebSocket route.
+        """
+        
+        for path, handler in self.websockets.items():
+            yield prefix + path, handler
+        
+        for mount_prefix, registry in self.mounts:
+            yield from registry._collect_websockets(prefix + mount_prefix)
+    
+    def _registries (
+        self,
+    ) -> Iterator['RouteRegistry']:
+        
+        """
+        Yields the registries included by this one, recursively.
+
+        Returns:
+            Iterator[RouteRegistry]: The included registries.
+        """
+        
+        for _, registry in self.mounts:
+            yield registry
+            yield from registry._registries()
             
     def add_websocket_route (
         self,
@@ -90,9 +340,13 @@ class RouteRegistry:
         """
         Registers a new WebSocket route with the given path and handler.
 
+        The routing table is compiled again on the next lookup, so the route is served
+        by the `websockets` of the table.
+
         Args:
             path (str): The WebSocket route path.
             handler (Callable[..., None]): The handler function to be called when the WebSocket route is matched.
         """
         
         self.websockets[path] = handler
+        self.table = None
@@ -0,0 +1,298 @@
+"""
+This module defines the `EventChannel` class, which fans the events published on a Server-Sent
+Events endpoint out to its subscribers, and keeps the recent events to resume interrupted streams.
+"""
+
+import asyncio
+import itertools
+
+from collections import deque
+from typing import Any
+
+from returnables.json_backends.json_backends import get_json_backend
+
+
+HEARTBEAT = b": heartbeat\n\n"
+"""
+The comment line sent to idle subscribers, which keeps proxies from closing the connection
+and detects clients that went away.
+"""
+
+_json_dumps = get_json_backend()
+
+
+def _encode_field (
+    name: str,
+    value: str,
+) -> bytes:
+
+    """
+    Encodes the value of a single-line field of an event.
+
+    Args:
+        name (str): The name of the field.
+        value (str): The value of the field.
+
+    Returns:
+        bytes: The encoded value.
+
+    Raises:
+        ValueError: If the value contains a line break, which would end the field early
+                    and let the rest of the value inject fields of its own.
+    """
+
+    if '\r' in value or '\n' in value:
+        raise ValueError(f"The {name} of an event cannot contain line breaks: {value!r}")
+    return value.encode()
+
+
+def encode_event (
+    data: Any,
+    event: str | None = None,
+    event_id: str | None = None,
+    retry: int | None = None,
+) -> bytes:
+
+    """
+    Encodes an event in the `text/event-stream` format.
+
+    Args:
+        data (Any): The data of the event. Strings and bytes are sent as they are, split into one
+                    `data` field per line, and any other value is serialized as JSON.
+        event (str | None, optional): The type of the event. Defaults to the `message` type.
+        event_id (str | None, optional): The identifier of the event, sent back by a reconnecting
+                                         client in its `Last-Event-ID` header. Defaults to None.
+        retry (int | None, optional): The reconnection delay the client should use, in milliseconds.
+                                      Defaults to None.
+
+    Returns:
+        bytes: The encoded event, ending with an empty line.
+
+    Raises:
+        ValueError: If the type or the identifier of the event contains a line break.
+    """
+
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data)
+    elif isinstance(data, str):
+        data = data.encode()
+    else:
+        data = _json_dumps(data)
+
+    fields = []
+    if event_id is not None:
+        fields.append(b"id: %s\n" % _encode_field('id', event_id))
+    if event is not None:
+        fields.append(b"event: %s\n" % _encode_field('event', event))
+    if retry is not None:
+        fields.append(b"retry: %d\n" % retry)
+    fields.extend(b"data: %s\n" % line for line in data.splitlines() or [b""])
+    fields.append(b"\n")
+    return b"".join(fields)
+
+
+def frame_event (
+    event: bytes,
+) -> tuple[bytes, bytes]:
+
+    """
+    Frames an encoded event for both kinds of connections, once for all subscribers.
+
+    Args:
+        event (bytes): The encoded event.
+
+    Returns:
+        tuple[bytes, bytes]: The event as written on a connection delimited by closing it,
+                             and as a chunk of a chunked body.
+    """
+
+    return event, b"%x\r\n%s\r\n" % (len(event), event)
+
+
+HEARTBEAT_FRAMES = frame_event(HEARTBEAT)
+
+
+class EventSubscriber:
+
+    """
+    A connection subscribed to an `EventChannel`.
+
+    Attributes:
+        pending (deque[tuple[bytes, bytes]]): The framed events waiting to be written to the client.
+        ready (asyncio.Event): Set when events are pending or the subscription is closed.
+        closed (bool): Whether the subscription is closed, ending the stream once the pending events are written.
+    """
+
+    __slots__ = ('pending', 'ready', 'closed')
+
+    def __init__ (
+        self,
+    ) -> None:
+
+        """
+        Initializes the subscriber.
+        """
+
+        self.pending: deque[tuple[bytes, bytes]] = deque()
+        self.ready = asyncio.Event()
+        self.closed = False
+
+    def close (
+        self,
+    ) -> None:
+
+        """
+        Closes the subscription, waking the stream up so it ends.
+        """
+
+        self.closed = True
+        self.ready.set()
+
+
+class EventChannel:
+
+    """
+    The events of a Server-Sent Events endpoint.
+
+    A published event is encoded and framed once, and the same bytes objects are queued for
+    every subscriber, so publishing costs the same whatever the number of subscribers. The
+    last `history_size` events are kept in a ring buffer: a client reconnecting with the
+    `Last-Event-ID` header first receives the events it missed, when they are still buffered.
+
+    A subscriber that falls more than `max_pending` events behind is disconnected instead of
+    buffering without bound, and catches up from the ring buffer when it reconnects.
+
+    Attributes:
+        history_size (int): The number of recent events kept to resume streams.
+        max_pending (int): The number of events a subscriber may fall behind before it is disconnected.
+        subscribers (set[EventSubscriber]): The connected subscribers.
+    """
+
+    def __init__ (
+        self,
+        history_size: int = 1000,
+        max_pending: int = 1000,
+    ) -> None:
+
+        """
+        Initializes the channel.
+
+        Args:
+            history_size (int, optional): The number of recent events kept to resume streams. Defaults to 1000.
+            max_pending (int, optional): The number of events a subscriber may fall behind
+                                         before it is disconnected. Defaults to 1000.
+        """
+
+        self.history_size = history_size
+        self.max_pending = max_pending
+        self.subscribers: set[EventSubscriber] = set()
+        self._history: deque[tuple[str, tuple[bytes, bytes]]] = deque()
+        self._positions: dict[str, int] = {}
+        self._published = 0
+        self._next_id = 0
+
+    def publish (
+        self,
+        data: Any,
+        event: str | None = None,
+        event_id: str | None = None,
+        retry: int | None = None,
+    ) -> str:
+
+        """
+        Publishes an event to every subscriber.
+
+        Must be called from the event loop of the server.
+
+        Args:
+            data (Any): The data of the event, as accepted by `encode_event`.
+            event (str | None, optional): The type of the event. Defaults to the `message` type.
+            event_id (str | None, optional): The identifier of the event. Defaults to a sequence number.
+            retry (int | None, optional): The reconnection delay the clients should use, in milliseconds.
+                                          Defaults to None.
+
+        Returns:
+            str: The identifier of the event.
+
+        Raises:
+            ValueError: If the type or the identifier of the event contains a line break.
+        """
+
+        next_id = self._next_id
+        if event_id is None:
+            next_id += 1
+            event_id = str(next_id)
+
+        frames = frame_event(encode_event(data, event, event_id, retry))
+        self._next_id = next_id
+
+        self._history.append((event_id, frames))
+        self._positions[event_id] = self._published
+        self._published += 1
+        if len(self._history) > self.history_size:
+            expired_id, _ = self._history.popleft()
+            if self._positions.get(expired_id) == self._published - len(self._history) - 1:
+                del self._positions[expired_id]
+
+        for subscriber in tuple(self.subscribers):
+            if len(subscriber.pending) >= self.max_pending:
+                self.unsubscribe(subscriber)
+                subscriber.close()
+                continue
+            subscriber.pending.append(frames)
+            subscriber.ready.set()
+
+        return event_id
+
+    def subscribe (
+        self,
+        last_event_id: str | None = None,
+    ) -> EventSubscriber:
+
+        """
+        Subscribes a connection to the channel.
+
+        Args:
+            last_event_id (str | None, optional): The `Last-Event-ID` header of a reconnecting client.
+                                                  The buffered events published after it are queued
+                                                  first. Defaults to None.
+
+        Returns:
+            EventSubscriber: The subscriber of the connection.
+        """
+
+        subscriber = EventSubscriber()
+        position = self._positions.get(last_event_id) if last_event_id is not None else None
+        if position is not None:
+            start = position + 1 - (self._published - len(self._history))
+            subscriber.pending.extend(frames for _, frames in itertools.islice(self._history, start, None))
+            subscriber.ready.set()
+
+        self.subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe (
+        self,
+        subscriber: EventSubscriber,
+    ) -> None:
+
+        """
+        Removes a subscriber from the channel.
+
+        Args:
+            subscriber (EventSubscriber): The subscriber to remove.
+        """
+
+        self.subscribers.discard(subscriber)
+
+    def close (
+        self,
+    ) -> None:
+
+        """
+        Ends the streams of every subscriber.
+        """
+
+        for subscriber in self.subscribers:
+            subscriber.close()
+        self.subscribers.clear()
@@ -11,10 +11,11 @@ decorator-based asynchronous server built on top of low-level sockets. It incorp
 - Middleware injection
 - Task delegation (IO/CPU-bound separation)
 - gRPC server integration (optional)
+- Pre-forked multi-process workers sharing the listening port
 - Dynamic restart and graceful shutdown mechanisms
 
-Designed for extensibility and testability, this server architecture does not rely on asyncio as the
-core of its I/O processing but wraps asynchronous logic where necessary.
+Designed for extensibility and testability, this server accepts and serves every connection as a
+coroutine on a single long-lived asyncio event loop, using the loop's non-blocking socket primitives.
 """
 
 from utils import RootConfigurer
@@ -22,6 +23,8 @@ RootConfigurer().config()
 
 import asyncio
 import os
+import signal
+import socket
 import sys
 import psutil
 
@@ -34,20 +37,28 @@ from decorators import (
     BoundHandlers,
     RedisConfig,
 )
+from configs.http_config.http_config import HTTPConfig
+
 from handlers import (
     PreparationHandler,
     RequestConsumerHandler,
     GRPCHandler,
+    WorkerPoolHandler,
 )
 
 from commands.command_controller.command_controller.command_controller import CommandController
 
-from utils import SocketIOPortValidator
+from utils import (
+    SocketIOMaxConnectionsValidator,
+    SocketIOPortValidator,
+    SocketIOWorkersValidator,
+)
 
 
 class SocketIO (
     PreparationHandler,
     RequestConsumerHandler,
+    WorkerPoolHandler,
 ):
     
     """
@@ -58,12 +69,13 @@ class SocketIO (
 
     Features:
         - Lifecycle hooks for startup and shutdown
-        - Decorator-based routing for WebSocket and regular HTTP endpoints
+        - Decorator-based routing for WebSocket, Server-Sent Events and regular HTTP endpoints
         - Middleware support
         - Rate limiting
         - CPU/IO-bound task separation
         - Optional Redis or in-memory caching
         - Optional gRPC server integration
+        - Optional pre-forked worker processes
         - Graceful shutdown and restart capabilities
 
     Args:
@@ -71,8 +83,12 @@ class SocketIO (
         port (int): Port number to listen on. Defaults to 4000.
         redis_config (RedisConfig, optional): Redis cache configuration.
         public_endpoints (bool): If True, enables public access. Defaults to False.
-        grpc_port (int, optional): Port for the gRPC server, if used.
+        grpc_port (int, optional): Port for the gRPC server, if used. Only served by a single process.
         backlog (int): Max number of queued socket connections. Defaults to 5.
+        workers (int): Number of worker processes serving requests. Defaults to 1.
+        max_connections (int, optional): Max number of connections served at once per process.
+        reject_overload (bool): If True, reply 503 instead of pausing accepts at the cap. Defaults to False.
+        http_config (HTTPConfig, optional): Settings for serving HTTP connections, such as keep-alive.
     """
     
     def __init__ (
@@ -82,7 +98,11 @@ class SocketIO (
         redis_config: RedisConfig = None,
         public_endpoints=False,
         grpc_port=None,
-        backlog=5
+        backlog=5,
+        workers=1,
+        max_connections=None,
+        reject_overload=False,
+        http_config: HTTPConfig = None,
     ) -> None:
         
         """
@@ -93,7 +113,19 @@ class SocketIO (
             port (int, optional): The port on which the server listens. Defaults to 4000.
             redis_config (RedisConfig, optional): Configuration for Redis caching. Defaults to None.
             public_endpoints (bool, optional): Flag to enable public endpoints. Defaults to False.
+            grpc_port (int, optional): The port of the gRPC server, which cannot be combined with
+                more than one worker. Defaults to None, which disables the gRPC service.
             backlog (int, optional): The maximum number of queued connections. Defaults to 5.
+            workers (int, optional): The number of worker processes to fork. With more than one
+                worker, a master process supervises and respawns them, and the server neither
+                runs a gRPC server nor restarts on file changes. Defaults to 1.
+            max_connections (int, optional): The maximum number of connections served at once by
+                each process, a positive integer. Defaults to None, which means no limit.
+            reject_overload (bool, optional): If True, clients arriving while `max_connections` are
+                being served get a 503 reply. Otherwise accepting pauses and the kernel backlog
+                absorbs the burst. Defaults to False.
+            http_config (HTTPConfig, optional): Settings controlling how HTTP connections are served,
+                such as keep-alive limits and timeouts. Defaults to `HTTPConfig()`.
         """
         
         self.entrypoint_path = os.path.abspath(sys.argv[0])
@@ -103,20 +135,27 @@ class SocketIO (
         self.port = SocketIOPortValidator.verify_port_validity(port)
         self.server_socket = None
         self.backlog = backlog
-        self.threads = []
+        self.connections = set()
+        self.max_connections = SocketIOMaxConnectionsValidator.verify_max_connections_validity(max_connections)
+        self.reject_overload = reject_overload
+        
+        self.workers = SocketIOWorkersValidator.verify_workers_validity(workers, grpc_port)
+        self.worker_pids = {}
+        self.reuse_port = self.workers > 1 and hasattr(socket, 'SO_REUSEPORT')
         
         self.allowed_hosts = ['127.0.0.1']
         self.grpc_port = grpc_port
         self.grpc_server = None
         
         self.redis_config = redis_config
+        self.http_config = http_config or HTTPConfig()
         
         # Decorators
         self.life_cycle_hooks_handler = LifecycleHooks()
         self.rate_limitation_handler = RateLimitation()
         self.bound_handler = BoundHandlers()
         self.cache_handler = CacheDecorator()
-        self.IORouter = IORouter()
+        self.IORouter = IORouter(self.http_config)
         self.IOMiddleware = IOMiddleware()
         
         self.openapi_paths = {}
@@ -142,6 +181,9 @@ class SocketIO (
 
     route = _create_property('IORouter.route')
     websocket = _create_property('IORouter.websocket')
+    sse = _create_property('IORouter.sse')
+    include_router = _create_property('IORouter.include_router')
+    static = _create_property('IORouter.static')
     IOBound = _create_property('bound_handler.IOBound')
     CPUBound = _create_property('bound_handler.CPUBound')
     rate_limit = _create_property('rate_limitation_handler.rate_limit')
@@ -151,17 +193,40 @@ class SocketIO (
     memoize_cache = _create_property('cache_handler.memoize_cache')
     lru_cache = _create_property('cache_handler.lru_cache')
     
-    async def start (
+    def start (
         self,
     ) -> None:
         
         """
-        Prepare and initiate the asynchronous request consumption process.
+        Run the server until it shuts down.
 
-        This method performs all necessary preparations before entering the main loop
-        to consume incoming requests.
+        The routes are compiled first, so every worker inherits the same immutable routing table.
+        With a single worker, the requests are then served on a new event loop. With more than
+        one worker, the current process becomes the master: it forks the workers from the main
+        thread before any event loop or thread is started, and supervises them. A worker pool
+        never serves gRPC, which the validation of the workers already enforces.
         """
         
+        self.IORouter.compile_routes()
+        if self.workers > 1:
+            os.environ['GRPC_SERVICE_ENABLED'] = '0'
+            self.supervise_workers()
+        else:
+            asyncio.run(self.serve())
+        
+    async def serve (
+        self,
+    ) -> None:
+        
+        """
+        Prepare the server and consume requests on the running event loop of a single process.
+
+        The responses of the constant routes are built first, then the server is prepared,
+        the gRPC server is started when a gRPC port is configured, and requests are consumed
+        until the server shuts down.
+        """
+        
+        await self.IORouter.build_constant_responses()
         await self.prepare()
         if self.grpc_port:
             await self.start_grpc_server()
@@ -169,6 +234,21 @@ class SocketIO (
             os.environ['GRPC_SERVICE_ENABLED'] = '0'
         await self.consume_requests()
         
+    async def serve_worker (
+        self,
+    ) -> None:
+        
+        """
+        Prepare a forked worker process and consume requests until it shuts down.
+
+        Every worker builds the responses of the constant routes on its own event loop,
+        as the master runs none.
+        """
+        
+        await self.IORouter.build_constant_responses()
+        await self.prepare_worker()
+        await self.consume_requests()
+        
     async def start_grpc_server (
         self,
     ) -> None:
@@ -189,10 +269,11 @@ class SocketIO (
         """
         Restart the current process.
 
-        This method cancels all running asyncio tasks and restarts the Python process,
-        effectively performing a full application restart.
+        This method stops the worker processes, cancels all running asyncio tasks and
+        restarts the Python process, effectively performing a full application restart.
         """
         
+        self.stop_workers()
         for task in asyncio.all_tasks():
             task.cancel()
 
@@ -206,17 +287,23 @@ class SocketIO (
         """
         Shutdown the server gracefully.
 
-        This method stops the server from running, closes the server socket if it exists,
-        waits for all threads to finish, and finally terminates the current process.
+        This method stops the server from running, asks the worker processes to shut down,
+        closes the server socket if it exists, cancels the connections still being served,
+        and finally terminates the current process.
         """
         
         self.running = False
+        self.stop_workers()
 
         if self.server_socket:
             self.server_socket.close()
 
-        for thread in self.threads:
-            thread.join()
+        for connection in self.connections:
+            connection.cancel()
+
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
 
         current_process = psutil.Process(os.getpid())
         current_process.terminate()
@@ -15,12 +15,18 @@ class SocketIORouter:
     Attributes:
         router_registry (RouteRegistry): An instance of `RouteRegistry` to manage registered routes.
 
+    A router is mounted on an application, or on another router, with `include_router`.
+    Its routes are merged into the routing table of the application when the server starts.
+
     Methods:
         add_api_route(config: RouteConfig):
             Registers an API route based on the given `RouteConfig`.
         
         add_websocket_router(config: RouteConfig):
             Registers a WebSocket route based on the given `RouteConfig`.
+
+        include_router(router: SocketIORouter, prefix: str):
+            Mounts the routes of another router under a path prefix.
     """
     
     def __init__ (
@@ -46,7 +52,10 @@ class SocketIORouter:
         """
         
         self.router_registry.add_route (
-            **config.__dict__,
+            config.path,
+            config.handler,
+            config.methods,
+            config.protected,
         )
         
     async def add_websocket_router (
@@ -62,5 +71,25 @@ class SocketIORouter:
         """
         
         self.router_registry.add_websocket_route (
-            **config.__dict__,
-        )
\ No newline at end of file
+            config.path,
+            config.handler,
+        )
+        
+    def include_router (
+        self,
+        router: 'SocketIORouter',
+        prefix: str = "",
+    ) -> None:
+        
+        """
+        Mounts the routes of another router under a path prefix of this router.
+
+        Args:
+            router (SocketIORouter): The router to include.
+            prefix (str, optional): The prefix of the mounted paths (e.g., "/users"). Defaults to no prefix.
+
+        Raises:
+            InvalidRoutePath: If the prefix is malformed or the router already includes this one.
+        """
+        
+        self.router_registry.include(router.router_registry, prefix)
\ No newline at end of file
@@ -0,0 +1,303 @@
+"""
+This module defines the `StaticFiles` class, which serves the files of a directory under
+a route prefix, with cached metadata, conditional requests answered with 304 and range requests.
+"""
+
+import dataclasses
+import mimetypes
+import os
+import stat
+import time
+
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import unquote
+
+from entity_tags.entity_tags import matches_if_none_match
+
+from parsers.request_parser.http_request import HTTPRequest
+
+from returnables.file_response.file_response import FileResponse, parse_byte_ranges
+from returnables.response.response import Response
+
+
+@dataclasses.dataclass(frozen=True)
+class StaticFile:
+
+    """
+    The cached metadata of a static file.
+
+    Attributes:
+        path (str): The resolved path of the file.
+        size (int): The size of the file, in bytes.
+        mtime (int): The modification time of the file, in whole seconds.
+        etag (str): The strong entity tag of the file, derived from its modification time and size.
+        media_type (str): The media type of the file.
+        raw_headers (bytes): The encoded `Accept-Ranges`, `ETag` and `Last-Modified` headers of the file.
+        checked_at (float): The monotonic time the file was last checked with `os.stat`.
+    """
+
+    path: str
+    size: int
+    mtime: int
+    etag: str
+    media_type: str
+    raw_headers: bytes
+    checked_at: float
+
+
+class StaticFiles:
+
+    """
+    Serves the files of a directory.
+
+    A request path is resolved inside the directory, and any path escaping it, through `..`
+    segments or symbolic links, is answered with a 404. The `os.stat` result, entity tag and
+    headers of a file are cached and only checked again once `stat_ttl` seconds have passed,
+    and content types are guessed once per file extension. A request whose `If-None-Match`
+    or `If-Modified-Since` header matches the file is answered with a bodiless 304, and
+    any other request is answered with a `FileResponse` sending the file with `sendfile`,
+    or only the byte ranges asked for by its `Range` header, so downloads can be resumed.
+
+    Attributes:
+        directory (str): The resolved path of the served directory.
+        stat_ttl (float): The number of seconds the metadata of a file is trusted without checking it.
+    """
+
+    def __init__ (
+        self,
+        directory: str,
+        stat_ttl: float = 1.0,
+    ) -> None:
+
+        """
+        Initializes the static file server.
+
+        Args:
+            directory (str): The directory to serve.
+            stat_ttl (float, optional): The number of seconds the metadata of a file is trusted
+                                        without checking it. Defaults to 1.0.
+
+        Raises:
+            NotADirectoryError: If the directory does not exist.
+        """
+
+        self.directory = os.path.realpath(directory)
+        if not os.path.isdir(self.directory):
+            raise NotADirectoryError(directory)
+        self.stat_ttl = stat_ttl
+        self._files: dict[str, StaticFile] = {}
+        self._media_types: dict[str, str] = {}
+
+    async def serve (
+        self,
+        file: str,
+        request: HTTPRequest,
+    ) -> Response:
+
+        """
+        Answers a request for a file of the directory.
+
+        Args:
+            file (str): The percent-encoded path of the file, relative to the directory.
+            request (HTTPRequest): The request being served.
+
+        Returns:
+            Response: The file response, a bodiless 304 response, a 404 response, or a 416 response
+                      when none of the requested ranges is satisfiable.
+        """
+
+        static_file = self.get_file(os.path.normpath(unquote(file)))
+        if static_file is None:
+            return Response("404 Not Found", 404)
+
+        if self.is_not_modified(static_file, request):
+            return Response(b"", 304, media_type=static_file.media_type, raw_headers=static_file.raw_headers)
+
+        ranges = self.get_ranges(static_file, request)
+        if ranges == []:
+            return Response (
+                "416 Range Not Satisfiable",
+                416,
+                raw_headers=f"Content-Range: bytes */{static_file.size}\r\n".encode(),
+            )
+
+        return FileResponse (
+            static_file.path,
+            static_file.size,
+            media_type=static_file.media_type,
+            raw_headers=static_file.raw_headers,
+            include_body=request.method != 'HEAD',
+            ranges=ranges,
+        )
+
+    def get_file (
+        self,
+        file: str,
+    ) -> StaticFile | None:
+
+        """
+        Returns the metadata of a file of the directory, from the cache while it is fresh.
+
+        Args:
+            file (str): The normalized path of the file, relative to the directory.
+
+        Returns:
+            StaticFile | None: The metadata of the file, or None if it is not a regular file of the directory.
+        """
+
+        now = time.monotonic()
+        static_file = self._files.get(file)
+        if static_file is not None and now - static_file.checked_at < self.stat_ttl:
+            return static_file
+
+        try:
+            path = self._resolve(file)
+            file_stat = os.stat(path) if path is not None else None
+        except (OSError, ValueError):
+            file_stat = None
+
+        if file_stat is None or not stat.S_ISREG(file_stat.st_mode):
+            self._files.pop(file, None)
+            return None
+
+        mtime = int(file_stat.st_mtime)
+        etag = f'"{file_stat.st_mtime_ns:x}-{file_stat.st_size:x}"'
+        if static_file is not None and static_file.etag == etag:
+            static_file = dataclasses.replace(static_file, checked_at=now)
+        else:
+            static_file = StaticFile (
+                path,
+                file_stat.st_size,
+                mtime,
+                etag,
+                self._get_media_type(path),
+                (
+                    f"Accept-Ranges: bytes\r\n"
+                    f"ETag: {etag}\r\n"
+                    f"Last-Modified: {formatdate(mtime, usegmt=True)}\r\n"
+                ).encode(),
+                now,
+            )
+
+        self._files[file] = static_file
+        return static_file
+
+    def is_not_modified (
+        self,
+        static_file: StaticFile,
+        request: HTTPRequest,
+    ) -> bool:
+
+        """
+        Checks whether the client already holds the current version of a file.
+
+        `If-None-Match` takes precedence over `If-Modified-Since`, as required by RFC 9110.
+
+        Args:
+            static_file (StaticFile): The metadata of the file.
+            request (HTTPRequest): The request being served.
+
+        Returns:
+            bool: True if the request can be answered with a 304.
+        """
+
+        if_none_match = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            return matches_if_none_match(if_none_match, static_file.etag)
+
+        if_modified_since = request.headers.get('if-modified-since')
+        if if_modified_since is not None:
+            try:
+                return static_file.mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+
+        return False
+
+    def get_ranges (
+        self,
+        static_file: StaticFile,
+        request: HTTPRequest,
+    ) -> list[tuple[int, int]] | None:
+
+        """
+        Selects the byte ranges of a file requested by a GET request.
+
+        The `Range` header is ignored when its `If-Range` condition does not match the current
+        version of the file, which then has to be sent whole: an entity tag must strongly match
+        the `ETag`, and a date must equal the `Last-Modified` date.
+
+        Args:
+            static_file (StaticFile): The metadata of the file.
+            request (HTTPRequest): The request being served.
+
+        Returns:
+            list[tuple[int, int]] | None: The first and last byte of every range to send, an empty list
+                                          if no range is satisfiable, or None to send the whole file.
+        """
+
+        range_header = request.headers.get('range')
+        if range_header is None or request.method != 'GET':
+            return None
+
+        if_range = request.headers.get('if-range')
+        if if_range is not None:
+            if_range = if_range.strip()
+            if if_range.startswith(('"', 'W/')):
+                if if_range != static_file.etag:
+                    return None
+            else:
+                try:
+                    if parsedate_to_datetime(if_range).timestamp() != static_file.mtime:
+                        return None
+                except (TypeError, ValueError):
+                    return None
+
+        return parse_byte_ranges(range_header, static_file.size)
+
+    def _resolve (
+        self,
+        file: str,
+    ) -> str | None:
+
+        """
+        Resolves the path of a file inside the directory.
+
+        Args:
+            file (str): The path of the file, relative to the directory.
+
+        Returns:
+            str | None: The resolved path, or None if it escapes the directory.
+
+        Raises:
+            ValueError: If the path contains a null byte.
+        """
+
+        path = os.path.realpath(os.path.join(self.directory, file))
+        if os.path.commonpath((self.directory, path)) != self.directory:
+            return None
+        return path
+
+    def _get_media_type (
+        self,
+        path: str,
+    ) -> str:
+
+        """
+        Guesses the media type of a file from its extension, once per extension.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            str: The media type, or `application/octet-stream` if it is unknown.
+        """
+
+        extension = os.path.splitext(path)[1].lower()
+        media_type = self._media_types.get(extension)
+        if media_type is None:
+            media_type = mimetypes.guess_type(f"file{extension}")[0] or "application/octet-stream"
+            if media_type.startswith('text/') or media_type in ('application/javascript', 'application/json'):
+                media_type += "; charset=utf-8"
+            self._media_types[extension] = media_type
+        return media_type
@@ -0,0 +1,22 @@
+from parsers.request_parser.header_view import HeaderView
+from parsers.request_parser.http_request import HTTPRequest
+from parsers.request_parser.request_body import RequestBody
+
+
+def make_request (
+    method: str = 'GET',
+    path: str = '/',
+    query: str = '',
+    headers: bytes = b'',
+) -> HTTPRequest:
+
+    raw = b'GET / HTTP/1.1\r\n' + headers.removesuffix(b'\r\n')
+    return HTTPRequest (
+        method,
+        f'{path}?{query}' if query else path,
+        path,
+        query,
+        'HTTP/1.1',
+        HeaderView.parse(raw, raw.index(b'\r\n') + 2),
+        RequestBody(bytearray()),
+    )
@@ -0,0 +1,52 @@
+import unittest
+
+from returnables.constant_response.constant_response import ConstantResponse
+from returnables.json_response.json_response import JsonResponse
+from returnables.response.response import Response
+
+
+class TestConstantResponse(unittest.TestCase):
+
+    def test_render_like_response (
+        self,
+    ) -> None:
+
+        tagged = JsonResponse({'status': 'up'})
+        tagged.raw_headers = b'ETag: "a"\r\n'
+
+        for response in (
+            Response('ok'),
+            Response(b'', 204, headers={'X-Id': '1'}),
+            tagged,
+        ):
+            for keep_alive in (True, False):
+                with self.subTest(response=response, keep_alive=keep_alive):
+                    self.assertEqual (
+                        b''.join(ConstantResponse(response).render(keep_alive)),
+                        b''.join(response.render(keep_alive)),
+                    )
+
+    def test_render_without_body (
+        self,
+    ) -> None:
+
+        response = ConstantResponse(Response('up'))
+        head = b''.join(response.render(True, include_body=False))
+
+        self.assertEqual(head, b''.join(Response('up').render(True, include_body=False)))
+        self.assertTrue(head.endswith(b'Content-Length: 2\r\nConnection: keep-alive\r\n\r\n'))
+
+    def test_encode_once (
+        self,
+    ) -> None:
+
+        response = ConstantResponse(Response('User-agent: *\nDisallow:\n'))
+        first, second = response.render(True), response.render(True)
+
+        self.assertEqual(len(first), 3)
+        self.assertIs(first[2], second[2])
+        self.assertTrue(first[2].endswith(b'Connection: keep-alive\r\n\r\nUser-agent: *\nDisallow:\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
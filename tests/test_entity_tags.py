@@ -0,0 +1,77 @@
+import unittest
+
+from entity_tags.entity_tags import (
+    get_entity_tag,
+    hash_entity_tag,
+    make_entity_tag,
+    matches_if_none_match,
+    not_modified,
+)
+
+from returnables.response.response import Response
+
+
+class TestEntityTags(unittest.TestCase):
+
+    def test_hash_entity_tag (
+        self,
+    ) -> None:
+
+        self.assertRegex(hash_entity_tag(b'body'), r'^"[0-9a-f]{32}"$')
+        self.assertEqual(hash_entity_tag(b'body'), hash_entity_tag(b'body'))
+        self.assertNotEqual(hash_entity_tag(b'body'), hash_entity_tag(b'bodies'))
+
+    def test_make_entity_tag (
+        self,
+    ) -> None:
+
+        self.assertEqual(make_entity_tag(42), '"42"')
+        self.assertEqual(make_entity_tag('v1.2-abc'), '"v1.2-abc"')
+        self.assertEqual(make_entity_tag('with "quotes"'), hash_entity_tag(b'with "quotes"'))
+        self.assertEqual(make_entity_tag('2024-01-01 00:00'), hash_entity_tag(b'2024-01-01 00:00'))
+
+    def test_matches_if_none_match (
+        self,
+    ) -> None:
+
+        for header, etag, matches in (
+            (None, '"a"', False),
+            ('"a"', '"a"', True),
+            ('"b", "a"', '"a"', True),
+            ('W/"a"', '"a"', True),
+            ('"a"', 'W/"a"', True),
+            ('*', '"a"', True),
+            ('"b"', '"a"', False),
+            ('a', '"a"', False),
+        ):
+            with self.subTest(header=header, etag=etag):
+                self.assertEqual(matches_if_none_match(header, etag), matches)
+
+    def test_get_entity_tag (
+        self,
+    ) -> None:
+
+        self.assertIsNone(get_entity_tag(Response('body')))
+        self.assertEqual(get_entity_tag(Response('body', headers={'etag': '"a"'})), '"a"')
+        self.assertEqual(get_entity_tag(Response('body', raw_headers=b'Vary: Accept\r\nETag: W/"b"\r\n')), 'W/"b"')
+
+    def test_not_modified (
+        self,
+    ) -> None:
+
+        response = Response (
+            'body',
+            headers={'Cache-Control': 'max-age=60', 'X-Id': '1'},
+            raw_headers=b'Vary: Accept-Encoding\r\nContent-Encoding: gzip\r\nETag: W/"a"\r\n',
+        )
+        head = not_modified('W/"a"', response).render_head(True)
+
+        self.assertTrue(head.startswith(b'HTTP/1.1 304 Not Modified\r\n'))
+        self.assertIn(b'Cache-Control: max-age=60\r\nVary: Accept-Encoding\r\nETag: W/"a"\r\n', head)
+        self.assertNotIn(b'X-Id', head)
+        self.assertNotIn(b'Content-Encoding', head)
+        self.assertNotIn(b'Content-Length', head)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from parsers.request_parser.header_view import HeaderView
+from parsers.request_parser.request_parser import RequestParser
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+
+class TestHeaderView(unittest.TestCase):
+    
+    def setUp (
+        self,
+    ) -> None:
+        
+        raw = (
+            b'GET / HTTP/1.1\r\n'
+            b'Host: localhost\r\n'
+            b'Accept-Encoding:  gzip, br \r\n'
+            b'X-Tag: a\r\n'
+            b'x-tag: b'
+        )
+        self.headers = HeaderView.parse(raw, raw.find(b'\r\n') + 2)
+        
+    def test_case_insensitive_lookup (
+        self,
+    ) -> None:
+        
+        self.assertEqual(self.headers['host'], 'localhost')
+        self.assertEqual(self.headers.get('ACCEPT-ENCODING'), 'gzip, br')
+        self.assertIn('Accept-encoding', self.headers)
+        self.assertNotIn('Connection', self.headers)
+        self.assertIsNone(self.headers.get('connection'))
+        self.assertEqual(self.headers.get('connection', ''), '')
+        
+        with self.assertRaises(KeyError):
+            self.headers['connection']
+        
+    def test_miss_names_outside_latin_1 (
+        self,
+    ) -> None:
+        
+        self.assertIsNone(self.headers.get('x-tag-\u2603'))
+        self.assertNotIn('\u2603', self.headers)
+        self.assertEqual(self.headers.get_all('\u2603'), [])
+        
+    def test_repeated_headers (
+        self,
+    ) -> None:
+        
+        self.assertEqual(self.headers.get('x-tag'), 'a')
+        self.assertEqual(self.headers.get_all('X-TAG'), ['a', 'b'])
+        self.assertEqual(len(self.headers), 4)
+        self.assertEqual(list(self.headers), ['Host', 'Accept-Encoding', 'X-Tag', 'x-tag'])
+        
+    def test_malformed_header_lines (
+        self,
+    ) -> None:
+        
+        for line in (b'NoColon', b': empty-name', b'Host : x', b' Host: x'):
+            with self.subTest(line=line):
+                with self.assertRaises(SocketIOMalformedRequestError):
+                    HeaderView.parse(line)
+                    
+    def test_request_parser (
+        self,
+    ) -> None:
+        
+        request_line, headers = RequestParser.parse_request (
+            'POST /items HTTP/1.1\r\nContent-Type: text/plain\r\n\r\nbody: not a header'
+        )
+        
+        self.assertEqual(request_line, 'POST /items HTTP/1.1')
+        self.assertEqual(dict(headers), {'Content-Type': 'text/plain'})
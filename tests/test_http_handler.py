@@ -0,0 +1,72 @@
+import asyncio
+import unittest
+
+from typing import Iterator
+
+from entity_tags.entity_tags import get_entity_tag, hash_entity_tag
+
+from handlers.http_handler.http_handler import HTTPHandler
+
+from returnables.response.response import Response
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+from route_registry.router_registry import RouteRegistry
+
+from tests.helpers import make_request
+
+
+def stream (
+) -> Iterator[bytes]:
+
+    yield b'chunk'
+
+
+class TestHTTPHandler(unittest.TestCase):
+
+    def setUp (
+        self,
+    ) -> None:
+
+        self.handler = HTTPHandler()
+        self.registry = RouteRegistry()
+
+    def handle (
+        self,
+        path: str,
+        headers: bytes = b'',
+    ) -> Response:
+
+        return asyncio.run(self.handler.handle_http_request(make_request(path=path, headers=headers), self.registry))
+
+    def test_never_tag_streamed_responses (
+        self,
+    ) -> None:
+
+        self.registry.add_route('/generated', stream, ['GET'], False, etag=True)
+        self.registry.add_route('/streamed', lambda: StreamingResponse(stream()), ['GET'], False, etag=True)
+        if_none_match = b'If-None-Match: %s\r\n' % hash_entity_tag(b'').encode()
+
+        for path in ('/generated', '/streamed'):
+            for headers in (b'', if_none_match):
+                with self.subTest(path=path, headers=headers):
+                    response = self.handle(path, headers)
+                    self.assertIsInstance(response, StreamingResponse)
+                    self.assertEqual(response.status_code, 200)
+                    self.assertIsNone(get_entity_tag(response))
+
+    def test_build_constant_responses (
+        self,
+    ) -> None:
+
+        calls = []
+        self.registry.add_route('/health', lambda: calls.append('health') or 'up', ['GET', 'HEAD'], False, constant=True)
+        self.registry.add_route('/reset', lambda: calls.append('reset') or 'done', ['POST'], False)
+        asyncio.run(self.handler.build_constant_responses(self.registry))
+
+        self.assertEqual(calls, ['health'])
+        self.assertIs(self.handle('/health'), self.registry.lookup('GET', '/health')[0]['constant_response'])
+        self.assertEqual(calls, ['health'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import dataclasses
+import datetime
+import enum
+import json
+import unittest
+import uuid
+
+from exceptions.socketio_exceptions.socketio_exceptions import SocketIOInproperJsonBackendError
+
+from returnables.json_backends.json_backends import JSON_BACKENDS, get_json_backend, json_dumps
+from returnables.json_response.json_response import JsonResponse
+
+
+class Color(enum.Enum):
+
+    RED = 'red'
+
+
+@dataclasses.dataclass
+class Item:
+
+    id: int
+    created: datetime.datetime
+    token: uuid.UUID
+    color: Color
+
+
+DATA = {
+    'items': [Item(1, datetime.datetime(2024, 5, 1, 12, 30, 0, 250), uuid.UUID(int=7), Color.RED)],
+    'day': datetime.date(2024, 5, 1),
+    'name': 'café/menu',
+    2: None,
+}
+
+EXPECTED = {
+    'items': [{
+        'id': 1,
+        'created': '2024-05-01T12:30:00.000250',
+        'token': '00000000-0000-0000-0000-000000000007',
+        'color': 'red',
+    }],
+    'day': '2024-05-01',
+    'name': 'café/menu',
+    '2': None,
+}
+
+
+class TestJsonBackends(unittest.TestCase):
+
+    def test_backends_serialize_alike (
+        self,
+    ) -> None:
+
+        for name, backend in JSON_BACKENDS.items():
+            if backend is None:
+                continue
+            with self.subTest(backend=name):
+                body = backend(DATA)
+                self.assertIsInstance(body, bytes)
+                self.assertEqual(json.loads(body), EXPECTED)
+                self.assertEqual(body, json_dumps(DATA))
+
+    def test_reject_unserializable_data (
+        self,
+    ) -> None:
+
+        for name, backend in JSON_BACKENDS.items():
+            if backend is None:
+                continue
+            with self.subTest(backend=name):
+                with self.assertRaises(TypeError):
+                    backend({'value': object()})
+
+    def test_get_json_backend (
+        self,
+    ) -> None:
+
+        preferred = next(backend for backend in JSON_BACKENDS.values() if backend is not None)
+
+        self.assertIs(get_json_backend(), preferred)
+        self.assertIs(get_json_backend('json'), json_dumps)
+        with self.assertRaises(SocketIOInproperJsonBackendError):
+            get_json_backend('simplejson')
+
+    def test_json_response_body (
+        self,
+    ) -> None:
+
+        response = JsonResponse(DATA, 201)
+
+        self.assertEqual(json.loads(response.body), EXPECTED)
+        self.assertIn(b'Content-Type: application/json\r\n', response.render_head(True))
+        self.assertIs(response.data, DATA)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import unittest
+
+from utils.socketio_validators.socketio_max_connections_validator.socketio_max_connections_validator import SocketIOMaxConnectionsValidator
+
+from exceptions.socketio_exceptions.socketio_exceptions import SocketIOInproperMaxConnectionsError
+
+
+class TestMaxConnectionsValidator(unittest.TestCase):
+
+    def test_valid_max_connections (
+        self,
+    ) -> None:
+
+        for max_connections in (None, 1, 1000):
+            with self.subTest(max_connections=max_connections):
+                self.assertEqual (
+                    SocketIOMaxConnectionsValidator.verify_max_connections_validity(max_connections),
+                    max_connections,
+                )
+
+    def test_inproper_max_connections (
+        self,
+    ) -> None:
+
+        for max_connections in (0, -1, 2.5, '10', True):
+            with self.subTest(max_connections=max_connections):
+                with self.assertRaises(SocketIOInproperMaxConnectionsError):
+                    SocketIOMaxConnectionsValidator.verify_max_connections_validity(max_connections)
+
+    def test_raise_value_error (
+        self,
+    ) -> None:
+
+        with self.assertRaises(ValueError) as cm:
+            SocketIOMaxConnectionsValidator.verify_max_connections_validity(0)
+
+        self.assertIn("Invalid maximum number of connections '0'", str(cm.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import asyncio
+import unittest
+
+from parsers.multipart_parser.multipart_parser import MultipartParser
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+
+CONTENT_TYPE = 'multipart/form-data; boundary="xyz"'
+
+BODY = (
+    b'preamble\r\n'
+    b'--xyz\r\n'
+    b'Content-Disposition: form-data; name="title"\r\n\r\n'
+    b'hello\r\n'
+    b'--xyz\r\n'
+    b'Content-Disposition: form-data; name="file"; filename="a.bin"\r\n'
+    b'Content-Type: application/octet-stream\r\n\r\n'
+    b'\r\n--xy\r\n' + bytes(range(256)) + b'\r\n'
+    b'--xyz--\r\n'
+    b'epilogue'
+)
+
+
+async def stream (
+    body: bytes,
+    size: int,
+):
+
+    for start in range(0, len(body), size):
+        yield body[start:start + size]
+
+
+class TestMultipartParser(unittest.TestCase):
+
+    def parse (
+        self,
+        body: bytes,
+        size: int = 1024,
+        parser: MultipartParser | None = None,
+    ):
+
+        return asyncio.run (
+            (parser or MultipartParser()).parse(stream(body, size), CONTENT_TYPE)
+        )
+
+    def test_parse_fields_and_files (
+        self,
+    ) -> None:
+
+        for size in (1, 3, 7, len(BODY)):
+            with self.subTest(size=size):
+                form = self.parse(BODY, size)
+
+                self.assertEqual(form.fields, {'title': 'hello'})
+                upload = form.files['file']
+                self.assertEqual(upload.filename, 'a.bin')
+                self.assertEqual(upload.content_type, 'application/octet-stream')
+                self.assertEqual(upload.read(), b'\r\n--xy\r\n' + bytes(range(256)))
+                self.assertEqual(upload.size, 264)
+                form.close()
+
+    def test_spool_large_files_to_disk (
+        self,
+    ) -> None:
+
+        for size in (7, len(BODY)):
+            with self.subTest(size=size):
+                form = self.parse(BODY, size, MultipartParser(spool_threshold=100))
+
+                self.assertTrue(form.files['file'].file._rolled)
+                self.assertEqual(form.files['file'].read(), b'\r\n--xy\r\n' + bytes(range(256)))
+                form.close()
+
+    def test_reject_too_many_parts (
+        self,
+    ) -> None:
+
+        with self.assertRaises(SocketIOMalformedRequestError) as context:
+            self.parse(BODY, parser=MultipartParser(max_parts=1))
+        self.assertIn('413', context.exception.status_line)
+
+    def test_reject_large_fields (
+        self,
+    ) -> None:
+
+        with self.assertRaises(SocketIOMalformedRequestError) as context:
+            self.parse(BODY, parser=MultipartParser(max_field_size=4))
+        self.assertIn('413', context.exception.status_line)
+
+    def test_reject_large_files (
+        self,
+    ) -> None:
+
+        with self.assertRaises(SocketIOMalformedRequestError) as context:
+            self.parse(BODY, parser=MultipartParser(max_file_size=263))
+        self.assertIn('413', context.exception.status_line)
+
+        form = self.parse(BODY, parser=MultipartParser(max_file_size=264))
+        self.assertEqual(form.files['file'].size, 264)
+        form.close()
+
+    def test_reject_incomplete_body (
+        self,
+    ) -> None:
+
+        with self.assertRaises(SocketIOMalformedRequestError) as context:
+            self.parse(BODY[:120])
+        self.assertIn('400', context.exception.status_line)
+
+    def test_reject_other_content_types (
+        self,
+    ) -> None:
+
+        with self.assertRaises(SocketIOMalformedRequestError) as context:
+            asyncio.run(MultipartParser().parse(stream(b'a=1', 1), 'application/x-www-form-urlencoded'))
+        self.assertIn('415', context.exception.status_line)
+
+
+if __name__ == '__main__':
+    unittest.main()
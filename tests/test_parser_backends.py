@@ -0,0 +1,30 @@
+import unittest
+
+from parsers.request_parser.parser_backends import get_parser_backend
+from parsers.request_parser.streaming_request_parser import StreamingRequestParser
+
+from exceptions.socketio_exceptions.socketio_exceptions import SocketIOInproperParserBackendError
+
+
+class TestParserBackends(unittest.TestCase):
+
+    def test_select_backend (
+        self,
+    ) -> None:
+
+        self.assertIs(get_parser_backend(), StreamingRequestParser)
+        self.assertIs(get_parser_backend('python'), StreamingRequestParser)
+        self.assertIs(get_parser_backend('auto'), StreamingRequestParser)
+
+    def test_reject_unknown_backend (
+        self,
+    ) -> None:
+
+        for name in ('httptools', 'picohttpparser'):
+            with self.subTest(name=name):
+                with self.assertRaises(SocketIOInproperParserBackendError):
+                    get_parser_backend(name)
+
+
+if __name__ == '__main__':
+    unittest.main()
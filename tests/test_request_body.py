@@ -0,0 +1,109 @@
+import asyncio
+import unittest
+
+from parsers.request_parser.request_body import RequestBody
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+
+class TestRequestBody(unittest.TestCase):
+
+    def stream (
+        self,
+        first: bytes,
+        chunks: list[bytes],
+        **kwargs,
+    ) -> tuple[RequestBody, bytearray]:
+
+        buffer = bytearray(first)
+        pending = list(chunks)
+
+        async def receive (
+        ) -> bool:
+
+            if not pending:
+                return False
+            buffer.extend(pending.pop(0))
+            return True
+
+        return RequestBody(buffer, receive=receive, **kwargs), buffer
+
+    def test_read_buffered_body (
+        self,
+    ) -> None:
+
+        buffer = bytearray(b'HEADhello world')
+        body = RequestBody(buffer, 4, 5)
+
+        self.assertEqual(asyncio.run(body.read()), b'hello')
+        self.assertTrue(body.is_complete)
+        self.assertEqual(buffer, b'HEADhello world')
+
+    def test_stream_content_length_body (
+        self,
+    ) -> None:
+
+        body, buffer = self.stream(b'ab', [b'cd', b'efGET'], content_length=6)
+
+        async def collect (
+        ) -> list[bytes]:
+
+            return [chunk async for chunk in body]
+
+        self.assertEqual(asyncio.run(collect()), [b'ab', b'cd', b'ef'])
+        self.assertTrue(body.is_complete)
+        self.assertEqual(buffer, b'GET')
+
+    def test_decode_chunked_body (
+        self,
+    ) -> None:
+
+        body, buffer = self.stream (
+            b'5\r\nhel',
+            [b'lo\r\n3;name=value\r\n wo\r\n', b'0\r\nX-Trailer: 1\r\n\r\nGET'],
+            content_length=None,
+            chunked=True,
+        )
+
+        self.assertEqual(asyncio.run(body.read()), b'hello wo')
+        self.assertEqual(buffer, b'GET')
+
+    def test_reject_invalid_chunk_size (
+        self,
+    ) -> None:
+
+        body, _ = self.stream(b'zz\r\n', [], content_length=None, chunked=True)
+
+        with self.assertRaises(SocketIOMalformedRequestError) as context:
+            asyncio.run(body.read())
+        self.assertIn('400', context.exception.status_line)
+
+    def test_reject_body_over_max_size (
+        self,
+    ) -> None:
+
+        body, _ = self.stream (
+            b'4\r\nabcd\r\n4\r\nefgh\r\n0\r\n\r\n',
+            [],
+            content_length=None,
+            chunked=True,
+            max_size=6,
+        )
+
+        with self.assertRaises(SocketIOMalformedRequestError) as context:
+            asyncio.run(body.read())
+        self.assertIn('413', context.exception.status_line)
+
+    def test_reject_incomplete_body (
+        self,
+    ) -> None:
+
+        body, _ = self.stream(b'abc', [], content_length=10)
+
+        with self.assertRaises(SocketIOMalformedRequestError):
+            asyncio.run(body.read())
+        self.assertFalse(body.is_complete)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+import asyncio
+import socket
+import unittest
+
+from typing import Awaitable, Callable
+
+from handlers.request_consumer_handler.request_consumer_handler import (
+    SERVICE_UNAVAILABLE_RESPONSE,
+    RequestConsumerHandler,
+)
+
+
+class Router:
+
+    def __init__ (
+        self,
+    ) -> None:
+
+        self.clients = []
+        self.release = asyncio.Event()
+
+    async def handle_request (
+        self,
+        client_socket: socket.socket,
+        allowed_hosts: list[str],
+    ) -> None:
+
+        self.clients.append(client_socket)
+        await self.release.wait()
+        client_socket.close()
+
+
+class Server(RequestConsumerHandler):
+
+    def __init__ (
+        self,
+        max_connections: int | None,
+        reject_overload: bool,
+    ) -> None:
+
+        self.running = True
+        self.server_socket = socket.create_server(('127.0.0.1', 0))
+        self.connections = set()
+        self.max_connections = max_connections
+        self.reject_overload = reject_overload
+        self.allowed_hosts = ['127.0.0.1']
+        self.IORouter = Router()
+
+    async def shutdown (
+        self,
+    ) -> None:
+
+        self.server_socket.close()
+
+
+class TestRequestConsumerHandler(unittest.TestCase):
+
+    def serve (
+        self,
+        max_connections: int | None,
+        reject_overload: bool,
+        scenario: Callable[[Server, tuple[str, int]], Awaitable[None]],
+    ) -> None:
+
+        async def run (
+        ) -> None:
+
+            server = Server(max_connections, reject_overload)
+            consumer = asyncio.create_task(server.consume_requests())
+            try:
+                await scenario(server, server.server_socket.getsockname())
+            finally:
+                server.IORouter.release.set()
+                consumer.cancel()
+                await asyncio.gather(consumer, return_exceptions=True)
+
+        asyncio.run(asyncio.wait_for(run(), 5))
+
+    async def connect (
+        self,
+        address: tuple[str, int],
+    ) -> socket.socket:
+
+        client = socket.socket()
+        client.setblocking(False)
+        await asyncio.get_running_loop().sock_connect(client, address)
+        return client
+
+    def test_pause_accepting_at_the_cap (
+        self,
+    ) -> None:
+
+        async def scenario (
+            server: Server,
+            address: tuple[str, int],
+        ) -> None:
+
+            first = await self.connect(address)
+            second = await self.connect(address)
+            await asyncio.sleep(0.05)
+            self.assertEqual(len(server.IORouter.clients), 1)
+
+            server.IORouter.release.set()
+            await asyncio.sleep(0.05)
+            self.assertEqual(len(server.IORouter.clients), 2)
+            first.close()
+            second.close()
+
+        self.serve(1, False, scenario)
+
+    def test_reject_overload_at_the_cap (
+        self,
+    ) -> None:
+
+        async def scenario (
+            server: Server,
+            address: tuple[str, int],
+        ) -> None:
+
+            first = await self.connect(address)
+            await asyncio.sleep(0.05)
+            second = await self.connect(address)
+
+            loop = asyncio.get_running_loop()
+            response = b''
+            while chunk := await loop.sock_recv(second, 1024):
+                response += chunk
+
+            self.assertEqual(response, SERVICE_UNAVAILABLE_RESPONSE)
+            self.assertEqual(len(server.IORouter.clients), 1)
+            first.close()
+            second.close()
+
+        self.serve(1, True, scenario)
+
+    def test_serve_without_cap (
+        self,
+    ) -> None:
+
+        async def scenario (
+            server: Server,
+            address: tuple[str, int],
+        ) -> None:
+
+            clients = [await self.connect(address) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            self.assertEqual(len(server.IORouter.clients), 3)
+            for client in clients:
+                client.close()
+
+        self.serve(None, True, scenario)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,263 @@
+import asyncio
+import socket
+import unittest
+
+from typing import Awaitable, Callable, Iterator
+
+from configs.http_config.http_config import HTTPConfig
+
+from handlers.request_handler.request_handler import CONTINUE_RESPONSE, RequestHandler
+
+from route_registry.router_registry import RouteRegistry
+
+
+class TestRequestHandler(unittest.TestCase):
+
+    def setUp (
+        self,
+    ) -> None:
+
+        self.registry = RouteRegistry()
+        self.finished = []
+
+        async def slow (
+        ) -> str:
+
+            await asyncio.sleep(0.05)
+            self.finished.append('slow')
+            return 'slow'
+
+        async def fast (
+        ) -> str:
+
+            self.finished.append('fast')
+            return 'fast'
+
+        async def echo (
+            request,
+        ) -> bytes:
+
+            return b''.join([chunk async for chunk in request.body])
+
+        self.registry.add_route('/slow', slow, ['GET'], False)
+        self.registry.add_route('/fast', fast, ['GET'], False)
+        self.registry.add_route('/echo', echo, ['POST'], False)
+
+    def serve (
+        self,
+        scenario: Callable[[socket.socket], Awaitable[None]],
+        **settings,
+    ) -> None:
+
+        async def run (
+        ) -> None:
+
+            loop = asyncio.get_running_loop()
+            with socket.create_server(('127.0.0.1', 0)) as listener:
+                client = socket.create_connection(listener.getsockname())
+                server, _ = listener.accept()
+            client.setblocking(False)
+            server.setblocking(False)
+
+            handler = RequestHandler(HTTPConfig(**settings))
+            serving = loop.create_task(handler.handle_request(server, self.registry, {}, ['127.0.0.1']))
+            try:
+                await scenario(client)
+                await asyncio.wait_for(serving, 1)
+            finally:
+                serving.cancel()
+                client.close()
+
+        asyncio.run(asyncio.wait_for(run(), 5))
+
+    async def send (
+        self,
+        client: socket.socket,
+        data: bytes,
+    ) -> None:
+
+        await asyncio.get_running_loop().sock_sendall(client, data)
+
+    async def receive (
+        self,
+        client: socket.socket,
+    ) -> bytes:
+
+        return await asyncio.get_running_loop().sock_recv(client, 65536)
+
+    async def receive_all (
+        self,
+        client: socket.socket,
+    ) -> bytes:
+
+        received = b''
+        while data := await self.receive(client):
+            received += data
+        return received
+
+    def test_close_after_max_keep_alive_requests (
+        self,
+    ) -> None:
+
+        async def scenario (
+            client: socket.socket,
+        ) -> None:
+
+            await self.send(client, b'GET /fast HTTP/1.1\r\n\r\n' * 3)
+            received = await self.receive_all(client)
+
+            self.assertEqual(received.count(b'HTTP/1.1 200 OK\r\n'), 2)
+            self.assertEqual(received.count(b'Connection: keep-alive\r\n'), 1)
+            self.assertEqual(received.count(b'Connection: close\r\n'), 1)
+
+        self.serve(scenario, max_keep_alive_requests=2)
+
+    def test_close_idle_connection (
+        self,
+    ) -> None:
+
+        async def scenario (
+            client: socket.socket,
+        ) -> None:
+
+            await self.send(client, b'GET /fast HTTP/1.1\r\n\r\n')
+            self.assertTrue((await self.receive(client)).endswith(b'Connection: keep-alive\r\n\r\nfast'))
+
+            started = asyncio.get_running_loop().time()
+            self.assertEqual(await self.receive(client), b'')
+            self.assertGreaterEqual(asyncio.get_running_loop().time() - started, 0.05)
+
+        self.serve(scenario, keep_alive_timeout=0.1)
+
+    def test_write_pipelined_responses_in_order (
+        self,
+    ) -> None:
+
+        async def scenario (
+            client: socket.socket,
+        ) -> None:
+
+            await self.send(client, b'GET /slow HTTP/1.1\r\n\r\nGET /fast HTTP/1.1\r\nConnection: close\r\n\r\n')
+            received = await self.receive_all(client)
+
+            self.assertEqual(received.count(b'HTTP/1.1 200 OK\r\n'), 2)
+            self.assertLess(received.index(b'\r\n\r\nslow'), received.index(b'\r\n\r\nfast'))
+
+        for pipeline_concurrency, finished in ((False, ['slow', 'fast']), (True, ['fast', 'slow'])):
+            with self.subTest(pipeline_concurrency=pipeline_concurrency):
+                self.finished.clear()
+                self.serve(scenario, pipeline_concurrency=pipeline_concurrency)
+                self.assertEqual(self.finished, finished)
+
+    def test_answer_head_requests_without_body (
+        self,
+    ) -> None:
+
+        def stream (
+        ) -> Iterator[bytes]:
+
+            yield b'streamed'
+
+        self.registry.add_route('/stream', stream, ['GET', 'HEAD'], False)
+        self.registry.add_route('/fast', lambda: 'fast', ['HEAD'], False)
+
+        async def scenario (
+            client: socket.socket,
+        ) -> None:
+
+            await self.send(client, b'HEAD /fast HTTP/1.1\r\n\r\nHEAD /stream HTTP/1.1\r\n\r\nGET /fast HTTP/1.1\r\nConnection: close\r\n\r\n')
+            received = await self.receive_all(client)
+
+            self.assertEqual(received.count(b'HTTP/1.1 200 OK\r\n'), 3)
+            self.assertIn(b'Content-Length: 4\r\nConnection: keep-alive\r\n\r\nHTTP/1.1 200 OK\r\n', received)
+            self.assertIn(b'Transfer-Encoding: chunked\r\nConnection: keep-alive\r\n\r\nHTTP/1.1 200 OK\r\n', received)
+            self.assertTrue(received.endswith(b'Connection: close\r\n\r\nfast'))
+            self.assertNotIn(b'streamed', received)
+
+        self.serve(scenario)
+
+    def test_answer_head_requests_to_constant_routes (
+        self,
+    ) -> None:
+
+        self.registry.add_route('/health', lambda: 'up', ['GET', 'HEAD'], False, constant=True)
+
+        async def scenario (
+            client: socket.socket,
+        ) -> None:
+
+            await self.send(client, b'HEAD /health HTTP/1.1\r\n\r\n')
+            head = await self.receive(client)
+            await self.send(client, b'GET /health HTTP/1.1\r\nConnection: close\r\n\r\n')
+            received = await self.receive_all(client)
+
+            self.assertTrue(head.endswith(b'Content-Length: 2\r\nConnection: keep-alive\r\n\r\n'))
+            self.assertTrue(received.startswith(b'HTTP/1.1 200 OK\r\n'))
+            self.assertTrue(received.endswith(b'Content-Length: 2\r\nConnection: close\r\n\r\nup'))
+
+        for built in (False, True):
+            with self.subTest(built=built):
+                if built:
+                    asyncio.run(RequestHandler(HTTPConfig()).build_constant_responses(self.registry))
+                self.serve(scenario)
+
+    def test_stream_request_bodies (
+        self,
+    ) -> None:
+
+        for head, parts in (
+            (b'Transfer-Encoding: chunked', (b'5\r\nhello\r\n', b'6\r\n world\r\n', b'0\r\n\r\n')),
+            (b'Content-Length: 11', (b'hello', b' world')),
+        ):
+            async def scenario (
+                client: socket.socket,
+            ) -> None:
+
+                await self.send(client, b'POST /echo HTTP/1.1\r\nConnection: close\r\n' + head + b'\r\n\r\n')
+                for part in parts:
+                    await asyncio.sleep(0.01)
+                    await self.send(client, part)
+
+                self.assertTrue((await self.receive_all(client)).endswith(b'\r\n\r\nhello world'))
+
+            with self.subTest(head=head):
+                self.serve(scenario)
+
+    def test_answer_expect_continue (
+        self,
+    ) -> None:
+
+        async def scenario (
+            client: socket.socket,
+        ) -> None:
+
+            await self.send(client, b'POST /echo HTTP/1.1\r\nConnection: close\r\nExpect: 100-continue\r\nContent-Length: 5\r\n\r\n')
+            self.assertEqual(await self.receive(client), CONTINUE_RESPONSE)
+
+            await self.send(client, b'hello')
+            received = await self.receive_all(client)
+
+            self.assertTrue(received.startswith(b'HTTP/1.1 200 OK\r\n'))
+            self.assertTrue(received.endswith(b'\r\n\r\nhello'))
+
+        self.serve(scenario)
+
+    def test_reject_large_body_without_continue (
+        self,
+    ) -> None:
+
+        async def scenario (
+            client: socket.socket,
+        ) -> None:
+
+            await self.send(client, b'POST /echo HTTP/1.1\r\nExpect: 100-continue\r\nContent-Length: 10\r\n\r\n')
+            received = await self.receive_all(client)
+
+            self.assertTrue(received.startswith(b'HTTP/1.1 413 '))
+            self.assertNotIn(b'100 Continue', received)
+
+        self.serve(scenario, max_body_size=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
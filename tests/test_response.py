@@ -0,0 +1,184 @@
+import asyncio
+import json
+import socket
+import unittest
+
+from returnables.html_response.html_response import HTMLResponse
+from returnables.json_response.json_response import JsonResponse
+from returnables.response.response import Response, get_date_header, get_status_line
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+from utils.socket_writer.socket_writer import send_buffers
+
+
+class TestResponse(unittest.TestCase):
+
+    def test_render_head_and_body (
+        self,
+    ) -> None:
+
+        head, body = Response('héllo', 201, {'X-Trace': 'abc'}).render(True)
+
+        self.assertTrue(head.startswith(b'HTTP/1.1 201 Created\r\nDate: '))
+        self.assertIn(b'Content-Type: text/plain; charset=utf-8\r\nX-Trace: abc\r\n', head)
+        self.assertTrue(head.endswith(b'Content-Length: 6\r\nConnection: keep-alive\r\n\r\n'))
+        self.assertEqual(body, 'héllo'.encode())
+
+    def test_render_head_without_body (
+        self,
+    ) -> None:
+
+        response = Response('hello world')
+
+        self.assertEqual(response.render(True, include_body=False), response.render(True)[:1])
+        self.assertIn(b'Content-Length: 11\r\n', response.render(True, include_body=False)[0])
+
+    def test_keep_bytes_body (
+        self,
+    ) -> None:
+
+        body = b'\x00raw'
+        head, rendered = Response(body, raw_headers=b'Allow: GET\r\n').render(False)
+
+        self.assertIs(rendered, body)
+        self.assertIn(b'Allow: GET\r\nContent-Length: 4\r\nConnection: close\r\n\r\n', head)
+
+    def test_cache_header_blocks (
+        self,
+    ) -> None:
+
+        self.assertIs(get_status_line(404), get_status_line(404))
+        self.assertEqual(get_status_line(599), b'HTTP/1.1 599 \r\n')
+        self.assertIs(get_date_header(), get_date_header())
+        self.assertRegex(get_date_header(), rb'^Date: \w{3}, \d{2} \w{3} \d{4} \d{2}:\d{2}:\d{2} GMT\r\n$')
+
+    def test_typed_responses (
+        self,
+    ) -> None:
+
+        html = HTMLResponse('<p>hi</p>', 404)
+        data = JsonResponse({'id': 1})
+
+        self.assertIn(b'Content-Type: text/html; charset=utf-8\r\n', html.render_head(True))
+        self.assertTrue(html.to_http_response().startswith('HTTP/1.1 404 Not Found\r\n'))
+        self.assertIn(b'Content-Type: application/json\r\n', data.render_head(True))
+        self.assertEqual(json.loads(data.body), {'id': 1})
+
+
+class TestSendBuffers(unittest.TestCase):
+
+    def test_send_buffers_in_order (
+        self,
+    ) -> None:
+
+        server, client = socket.socketpair()
+        server.setblocking(False)
+        client.setblocking(False)
+        buffers = [b'head\r\n\r\n', b'', bytes(range(256)) * 8192, b'tail']
+        expected = b''.join(buffers)
+
+        async def exchange (
+        ) -> bytes:
+
+            loop = asyncio.get_running_loop()
+            sending = asyncio.ensure_future(send_buffers(server, buffers))
+            received = bytearray()
+            while len(received) < len(expected):
+                received += await loop.sock_recv(client, 65536)
+            await sending
+            return bytes(received)
+
+        try:
+            self.assertEqual(asyncio.run(exchange()), expected)
+        finally:
+            server.close()
+            client.close()
+
+
+class TestStreamingResponse(unittest.TestCase):
+
+    def stream (
+        self,
+        response: StreamingResponse,
+        chunked: bool = True,
+    ) -> bytes:
+
+        server, client = socket.socketpair()
+        server.setblocking(False)
+
+        async def write (
+        ) -> None:
+
+            try:
+                await response.stream(server, chunked)
+            finally:
+                server.close()
+
+        try:
+            asyncio.run(write())
+            received = bytearray()
+            while data := client.recv(65536):
+                received += data
+            return bytes(received)
+        finally:
+            client.close()
+
+    def test_render_chunked_head (
+        self,
+    ) -> None:
+
+        head = StreamingResponse(iter(()), media_type='text/csv').render_head(True)
+
+        self.assertIn(b'Content-Type: text/csv\r\nTransfer-Encoding: chunked\r\n', head)
+        self.assertNotIn(b'Content-Length', head)
+
+    def test_gather_synchronous_items (
+        self,
+    ) -> None:
+
+        def rows (
+        ):
+
+            yield 'id,name\n'
+            for index in range(3):
+                yield f'{index},item\n'.encode()
+
+        body = self.stream(StreamingResponse(rows(), chunk_size=16))
+
+        self.assertEqual(body, b'16\r\nid,name\n0,item\n1,item\n\r\n7\r\n2,item\n\r\n0\r\n\r\n')
+
+    def test_write_asynchronous_items (
+        self,
+    ) -> None:
+
+        async def events (
+        ):
+
+            for index in range(2):
+                yield f'event {index}'
+
+        self.assertEqual(self.stream(StreamingResponse(events())), b'7\r\nevent 0\r\n7\r\nevent 1\r\n0\r\n\r\n')
+        self.assertEqual(self.stream(StreamingResponse(events()), chunked=False), b'event 0event 1')
+
+    def test_close_iterator_on_failure (
+        self,
+    ) -> None:
+
+        closed = []
+
+        def rows (
+        ):
+
+            try:
+                yield 'first'
+                raise ValueError('export failed')
+            finally:
+                closed.append(True)
+
+        with self.assertRaises(ValueError):
+            self.stream(StreamingResponse(rows()))
+        self.assertEqual(closed, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
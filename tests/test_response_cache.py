@@ -0,0 +1,127 @@
+import unittest
+
+from unittest import mock
+
+from response_cache.response_cache import ResponseCache, normalize_query, parse_cache_control
+from returnables.response.response import Response
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+from tests.helpers import make_request
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def setUp (
+        self,
+    ) -> None:
+
+        self.cache = ResponseCache()
+
+    def test_normalize_query (
+        self,
+    ) -> None:
+
+        self.assertEqual(normalize_query(''), '')
+        self.assertEqual(normalize_query('b=2&a=1&a=0'), 'a=0&a=1&b=2')
+        self.assertEqual(normalize_query('q=a%20b&empty='), normalize_query('empty=&q=a+b'))
+
+    def test_parse_cache_control (
+        self,
+    ) -> None:
+
+        self.assertEqual (
+            parse_cache_control('Public, max-age="60", no-transform'),
+            {'public': None, 'max-age': '60', 'no-transform': None},
+        )
+
+    def test_serve_route_ttl (
+        self,
+    ) -> None:
+
+        response = Response('items')
+        self.cache.store(make_request(query='b=2&a=1'), response, ttl=5)
+
+        self.assertIs(self.cache.get(make_request(query='a=1&b=2')), response)
+        self.assertIsNone(self.cache.get(make_request(query='a=1')))
+        self.assertIsNone(self.cache.get(make_request(method='HEAD')))
+        self.assertIsNone(self.cache.get(make_request(query='a=1&b=2', headers=b'Cache-Control: no-cache\r\n')))
+
+        with mock.patch('time.monotonic', return_value=10 ** 9):
+            self.assertIsNone(self.cache.get(make_request(query='a=1&b=2')))
+        self.assertEqual(self.cache._size, 0)
+        self.assertEqual(self.cache._variants, {})
+
+    def test_honor_cache_control (
+        self,
+    ) -> None:
+
+        for headers, ttl, cached in (
+            ({'Cache-Control': 'public, max-age=60'}, None, True),
+            ({'Cache-Control': 'max-age=60'}, None, False),
+            ({'Cache-Control': 'max-age=60'}, 5, True),
+            ({'Cache-Control': 'public, max-age=0'}, 5, False),
+            ({'Cache-Control': 'no-store'}, 5, False),
+            ({'Cache-Control': 'private, max-age=60'}, 5, False),
+            ({'Set-Cookie': 'session=1'}, 5, False),
+            ({'Vary': '*'}, 5, False),
+            ({}, None, False),
+        ):
+            with self.subTest(headers=headers, ttl=ttl):
+                cache = ResponseCache()
+                cache.store(make_request(), Response('items', headers=headers), ttl)
+                self.assertEqual(cache.get(make_request()) is not None, cached)
+
+        cache = ResponseCache()
+        cache.store(make_request(), Response('items', 500), 5)
+        cache.store(make_request(path='/stream'), StreamingResponse(iter(())), 5)
+        cache.store(make_request(path='/user', headers=b'Authorization: Bearer x\r\n'), Response('me'), 5)
+        self.assertEqual(len(cache._entries), 0)
+
+    def test_vary_headers (
+        self,
+    ) -> None:
+
+        english = Response('hello', headers={'Vary': 'Accept-Language'}, raw_headers=b'Vary: Accept-Encoding\r\n')
+        french = Response('bonjour', headers={'Vary': 'Accept-Language'}, raw_headers=b'Vary: Accept-Encoding\r\n')
+        self.cache.store(make_request(headers=b'Accept-Language: en\r\n'), english, 5)
+        self.cache.store(make_request(headers=b'Accept-Language: fr\r\n'), french, 5)
+
+        self.assertIs(self.cache.get(make_request(headers=b'Accept-Language: en\r\n')), english)
+        self.assertIs(self.cache.get(make_request(headers=b'accept-language: fr\r\n')), french)
+        self.assertIsNone(self.cache.get(make_request(headers=b'Accept-Language: fr\r\nAccept-Encoding: gzip\r\n')))
+        self.assertEqual(self.cache._variants[('GET', '/', '')], (('accept-encoding', 'accept-language'), 2))
+
+    def test_replace_variants_of_one_query (
+        self,
+    ) -> None:
+
+        other = Response('page 2')
+        self.cache.store(make_request(query='page=2'), other, 5)
+        self.cache.store(make_request(headers=b'Accept-Language: en\r\n'), Response('en', headers={'Vary': 'Accept-Language'}), 5)
+        self.cache.store(make_request(headers=b'Accept-Language: fr\r\n'), Response('fr', headers={'Vary': 'Accept-Language'}), 5)
+        self.cache.store(make_request(), Response('any'), 5)
+
+        self.assertIs(self.cache.get(make_request(query='page=2')), other)
+        self.assertEqual(self.cache.get(make_request(headers=b'Accept-Language: fr\r\n')).body, b'any')
+        self.assertEqual(len(self.cache._entries), 2)
+        self.assertEqual(self.cache._variants[('GET', '/', '')], ((), 1))
+
+    def test_bound_size (
+        self,
+    ) -> None:
+
+        cache = ResponseCache(max_size=1000)
+        for index in range(10):
+            cache.store(make_request(path=f'/items/{index}'), Response(bytes(200)), 5)
+
+        self.assertEqual(cache._size, 1000)
+        self.assertEqual([key[0][1] for key in cache._entries], [f'/items/{index}' for index in range(5, 10)])
+
+        cache.invalidate(path='/items/7')
+        self.assertIsNone(cache.get(make_request(path='/items/7')))
+        cache.invalidate()
+        self.assertEqual((cache._size, cache._variants), (0, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
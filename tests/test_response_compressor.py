@@ -0,0 +1,158 @@
+import asyncio
+import gzip
+import os
+import tempfile
+import unittest
+
+from compression.response_compressor.response_compressor import ResponseCompressor
+
+from configs.compression_config.compression_config import CompressionConfig
+
+from parsers.request_parser.http_request import HTTPRequest
+
+from returnables.json_response.json_response import JsonResponse
+from returnables.response.response import Response
+from returnables.streaming_response.streaming_response import StreamingResponse
+
+from static_files.static_files import StaticFiles
+
+from tests.helpers import make_request
+
+
+BODY = b'hello compression ' * 200
+GZIP = b'Accept-Encoding: gzip\r\n'
+
+
+class TestResponseCompressor(unittest.TestCase):
+
+    def setUp (
+        self,
+    ) -> None:
+
+        self.compressor = ResponseCompressor(CompressionConfig())
+
+    def compress (
+        self,
+        response: Response,
+        request: HTTPRequest | None = None,
+    ) -> Response:
+
+        return asyncio.run(self.compressor.compress(request or make_request(headers=GZIP), response))
+
+    def test_select_encoding (
+        self,
+    ) -> None:
+
+        self.compressor._compressors.setdefault('br', gzip.compress)
+        for header, encoding in (
+            (None, None),
+            ('identity', None),
+            ('gzip', 'gzip'),
+            ('gzip, deflate, br', 'br'),
+            ('br;q=0.5, gzip', 'gzip'),
+            ('gzip;q=0, br;q=0', None),
+            ('*', 'br'),
+            ('*;q=0.5, br;q=0', 'gzip'),
+            ('GZIP;q=bad', None),
+        ):
+            with self.subTest(header=header):
+                self.assertEqual(self.compressor.select_encoding(header), encoding)
+
+    def test_compress_body (
+        self,
+    ) -> None:
+
+        response = self.compress(Response(BODY, headers={'X-Id': '1'}))
+        head = response.render_head(True)
+
+        self.assertEqual(gzip.decompress(response.body), BODY)
+        self.assertIn(b'X-Id: 1\r\nContent-Encoding: gzip\r\nVary: Accept-Encoding\r\n', head)
+        self.assertIn(b'Content-Length: %d\r\n' % len(response.body), head)
+
+    def test_weaken_entity_tags (
+        self,
+    ) -> None:
+
+        raw = self.compress(Response(BODY, raw_headers=b'ETag: "abc"\r\n'))
+        custom = self.compress(Response(BODY, headers={'ETag': '"abc"'}))
+
+        self.assertIn(b'ETag: W/"abc"\r\n', raw.render_head(True))
+        self.assertEqual(custom.headers, {'ETag': 'W/"abc"'})
+
+    def test_skip_ineligible_responses (
+        self,
+    ) -> None:
+
+        for response in (
+            Response(BODY[:100]),
+            Response(BODY, media_type='image/png'),
+            Response(BODY, 404),
+            Response(BODY, headers={'Content-Encoding': 'br'}),
+            Response(BODY, raw_headers=b'Content-Encoding: br\r\n'),
+            StreamingResponse(iter([BODY])),
+        ):
+            with self.subTest(response=response):
+                self.assertIs(self.compress(response), response)
+
+        response = Response(BODY)
+        varied = self.compress(response, make_request())
+        self.assertEqual(varied.raw_headers, b'Vary: Accept-Encoding\r\n')
+        self.assertIs(self.compress(varied, make_request()), varied)
+        self.assertEqual(response.raw_headers, b'')
+        self.assertEqual(self.compress(response, make_request()).raw_headers, b'Vary: Accept-Encoding\r\n')
+
+    def test_cache_cacheable_bodies (
+        self,
+    ) -> None:
+
+        cacheable = self.compress(JsonResponse({'items': list(range(500))}, headers={'Cache-Control': 'public, max-age=60'}))
+        again = self.compress(JsonResponse({'items': list(range(500))}, headers={'Cache-Control': 'public, max-age=60'}))
+        private = self.compress(JsonResponse({'items': list(range(500))}, headers={'Cache-Control': 'private, max-age=60'}))
+
+        self.assertIs(again.body, cacheable.body)
+        self.assertIsNot(private.body, cacheable.body)
+        self.assertEqual(len(self.compressor._cache), 1)
+
+    def test_bound_cache_size (
+        self,
+    ) -> None:
+
+        self.compressor.config.cache_size = 1000
+        for index in range(20):
+            self.compressor._cache_put(('gzip', index), bytes(200))
+
+        self.assertEqual(list(self.compressor._cache), [('gzip', index) for index in range(15, 20)])
+        self.assertEqual(self.compressor._cache_bytes, 1000)
+
+    def test_compress_in_executor (
+        self,
+    ) -> None:
+
+        self.compressor.config.executor_threshold = 1024
+        response = self.compress(Response(BODY))
+
+        self.assertEqual(gzip.decompress(response.body), BODY)
+
+    def test_compress_static_files (
+        self,
+    ) -> None:
+
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, 'app.js'), 'wb') as file:
+                file.write(BODY)
+            static_files = StaticFiles(directory)
+
+            response = self.compress(asyncio.run(static_files.serve('app.js', make_request(headers=GZIP))))
+            head = response.render_head(True)
+            cached = self.compress(asyncio.run(static_files.serve('app.js', make_request(headers=GZIP))))
+            ranged = asyncio.run(static_files.serve('app.js', make_request(headers=GZIP + b'Range: bytes=0-9\r\n')))
+
+        self.assertEqual(gzip.decompress(response.body), BODY)
+        self.assertIs(cached.body, response.body)
+        self.assertRegex(head, rb'ETag: W/"[0-9a-f]+-[0-9a-f]+"\r\n')
+        self.assertNotIn(b'Accept-Ranges', head)
+        self.assertIs(self.compress(ranged), ranged)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,277 @@
+import re
+import unittest
+import uuid
+
+from exceptions.handler_exceptions.invalid_route_path import InvalidRoutePath
+
+from route_registry.router_registry import RouteRegistry
+
+
+def handler (
+) -> str:
+
+    return 'ok'
+
+
+class TestRouteRegistry(unittest.TestCase):
+
+    def setUp (
+        self,
+    ) -> None:
+
+        self.registry = RouteRegistry()
+        for path in ('/', '/users', '/users/me', '/users/<id>', '/users/<id>/posts/<post>', '/files/<name>/raw'):
+            self.registry.add_route(path, handler, ['GET'], False)
+
+    def match (
+        self,
+        path: str,
+        method: str = 'GET',
+    ) -> tuple[str | None, dict[str, str]]:
+
+        route, params, _ = self.registry.lookup(method, path)
+        return (route and route['path'], params)
+
+    def test_match_static_routes (
+        self,
+    ) -> None:
+
+        self.assertEqual(self.match('/'), ('/', {}))
+        self.assertEqual(self.match('/users'), ('/users', {}))
+
+    def test_prefer_static_segments (
+        self,
+    ) -> None:
+
+        self.assertEqual(self.match('/users/me'), ('/users/me', {}))
+        self.assertEqual(self.match('/users/42'), ('/users/<id>', {'id': '42'}))
+
+    def test_capture_parameters (
+        self,
+    ) -> None:
+
+        self.assertEqual (
+            self.match('/users/7/posts/9'),
+            ('/users/<id>/posts/<post>', {'id': '7', 'post': '9'}),
+        )
+        self.assertEqual(self.match('/files/a.txt/raw'), ('/files/<name>/raw', {'name': 'a.txt'}))
+
+    def test_backtrack_from_static_segments (
+        self,
+    ) -> None:
+
+        self.registry.add_route('/users/me/settings', handler, ['GET'], False)
+        self.registry.add_route('/users/<id>/profile', handler, ['GET'], False)
+
+        self.assertEqual(self.match('/users/me/profile'), ('/users/<id>/profile', {'id': 'me'}))
+
+    def test_reject_unknown_paths (
+        self,
+    ) -> None:
+
+        for path in ('/users/', '/users/7/posts', '/users/7/posts/9/x', '/other'):
+            with self.subTest(path=path):
+                self.assertEqual(self.match(path), (None, {}))
+                self.assertIsNone(self.registry.lookup('GET', path)[2])
+
+    def test_index_routes_by_method (
+        self,
+    ) -> None:
+
+        def create (
+        ) -> str:
+
+            return 'created'
+
+        self.registry.add_route('/users', create, ['post'], False)
+        self.registry.add_route('/users/<id>', create, ['DELETE'], False)
+
+        self.assertIs(self.registry.lookup('GET', '/users')[0]['handler'], handler)
+        self.assertIs(self.registry.lookup('POST', '/users')[0]['handler'], create)
+        self.assertIs(self.registry.lookup('DELETE', '/users/7')[0]['handler'], create)
+
+    def test_allow_header_for_unsupported_methods (
+        self,
+    ) -> None:
+
+        self.registry.add_route('/users', handler, ['POST'], False)
+
+        self.assertEqual(self.registry.lookup('PUT', '/users'), (None, {}, b'Allow: GET, POST\r\n'))
+        self.assertEqual(self.registry.lookup('PUT', '/users/7'), (None, {}, b'Allow: GET\r\n'))
+
+    def test_compile_immutable_table (
+        self,
+    ) -> None:
+
+        table = self.registry.compile()
+
+        with self.assertRaises(TypeError):
+            table.routes[('PUT', '/users')] = {}
+        self.assertIs(self.registry.lookup('GET', '/users')[0], table.routes[('GET', '/users')])
+
+        self.registry.add_route('/late', handler, ['GET'], False)
+        self.assertEqual(self.match('/late'), ('/late', {}))
+        self.assertIsNot(self.registry.table, table)
+
+    def test_convert_typed_parameters (
+        self,
+    ) -> None:
+
+        token = uuid.uuid4()
+        self.registry.add_route('/items/<int:id>', handler, ['GET'], False)
+        self.registry.add_route('/items/<slug:name>', handler, ['GET'], False)
+        self.registry.add_route('/tokens/<uuid:token>', handler, ['GET'], False)
+        self.registry.add_route('/static/<path:file>', handler, ['GET'], False)
+
+        self.assertEqual(self.match('/items/42'), ('/items/<int:id>', {'id': 42}))
+        self.assertEqual(self.match('/items/blue-chair'), ('/items/<slug:name>', {'name': 'blue-chair'}))
+        self.assertEqual(self.match(f'/tokens/{token}'), ('/tokens/<uuid:token>', {'token': token}))
+        self.assertEqual(self.match('/static/css/site.css'), ('/static/<path:file>', {'file': 'css/site.css'}))
+
+    def test_reject_non_matching_typed_parameters (
+        self,
+    ) -> None:
+
+        self.registry.add_route('/orders/<int:id>', handler, ['GET'], False)
+        self.registry.add_route('/tokens/<uuid:token>', handler, ['GET'], False)
+
+        for path in ('/orders/abc', '/orders/-1', '/tokens/not-a-uuid'):
+            with self.subTest(path=path):
+                self.assertEqual(self.match(path), (None, {}))
+
+    def test_reject_invalid_placeholders (
+        self,
+    ) -> None:
+
+        for path in ('/items/<float:id>', '/files/<path:file>/raw', '/files/<name>.txt'):
+            with self.subTest(path=path):
+                with self.assertRaises(InvalidRoutePath):
+                    self.registry.add_route(path, handler, ['GET'], False)
+
+    def test_match_method_across_overlapping_routes (
+        self,
+    ) -> None:
+
+        self.registry.add_route('/users/<id>/settings', handler, ['GET'], False)
+        self.registry.add_route('/users/<id>/<section>', handler, ['POST'], False)
+        self.registry.add_route('/users/<id>', handler, ['PUT'], False)
+
+        self.assertEqual(self.match('/users/1/settings'), ('/users/<id>/settings', {'id': '1'}))
+        self.assertEqual(self.match('/users/1/settings', 'POST'), ('/users/<id>/<section>', {'id': '1', 'section': 'settings'}))
+        self.assertEqual(self.match('/users/me', 'PUT'), ('/users/<id>', {'id': 'me'}))
+        self.assertEqual(self.registry.lookup('DELETE', '/users/1/settings'), (None, {}, b'Allow: GET, POST\r\n'))
+        self.assertEqual(self.registry.lookup('DELETE', '/users/me'), (None, {}, b'Allow: GET, PUT\r\n'))
+        self.assertEqual(self.registry.lookup('DELETE', '/users/1/posts'), (None, {}, b'Allow: POST\r\n'))
+
+    def test_reject_request_dependent_constant_routes (
+        self,
+    ) -> None:
+
+        def with_request (
+            request,
+        ) -> str:
+
+            return 'ok'
+
+        self.registry.add_route('/health', handler, ['GET'], False, constant=True)
+        self.assertIs(self.registry.lookup('GET', '/health')[0]['constant'], True)
+        with self.assertRaises(InvalidRoutePath):
+            self.registry.add_route('/health/<id>', handler, ['GET'], False, constant=True)
+        with self.assertRaises(InvalidRoutePath):
+            self.registry.add_route('/echo', with_request, ['GET'], False, constant=3)
+
+    def test_reject_constant_routes_with_effects (
+        self,
+    ) -> None:
+
+        self.registry.add_route('/robots.txt', handler, ['get', 'head'], False, constant=True)
+        self.assertEqual(self.registry.lookup('HEAD', '/robots.txt')[0]['methods'], ['GET', 'HEAD'])
+        for methods in (['POST'], ['GET', 'DELETE'], ['put']):
+            with self.subTest(methods=methods):
+                with self.assertRaises(InvalidRoutePath):
+                    self.registry.add_route('/reset', handler, methods, False, constant=True)
+        self.assertIsNone(self.registry.lookup('GET', '/reset')[0])
+
+    def test_include_registries_under_prefix (
+        self,
+    ) -> None:
+
+        users = RouteRegistry()
+        users.add_route('/', handler, ['GET'], False)
+        users.add_route('/<int:id>', handler, ['GET', 'PUT'], False)
+        api = RouteRegistry()
+        api.include(users, '/users')
+        self.registry.include(api, '/api/v1')
+        users.add_route('/<int:id>/avatar', handler, ['GET'], False)
+
+        self.assertEqual(self.match('/api/v1/users/'), ('/api/v1/users/', {}))
+        self.assertEqual(self.match('/api/v1/users/7', 'PUT'), ('/api/v1/users/<int:id>', {'id': 7}))
+        self.assertEqual(self.match('/api/v1/users/7/avatar'), ('/api/v1/users/<int:id>/avatar', {'id': 7}))
+        self.assertEqual(self.match('/users/7'), ('/users/<id>', {'id': '7'}))
+        self.assertEqual(users.routes[('GET', '/<int:id>')]['path'], '/<int:id>')
+
+    def test_keep_mounted_routes_across_compilations (
+        self,
+    ) -> None:
+
+        users = RouteRegistry()
+        users.add_route('/me', handler, ['GET'], False)
+        users.add_websocket_route('/live', handler)
+        self.registry.include(users, '/accounts')
+        self.registry.add_websocket_route('/live', handler)
+
+        route = self.registry.compile().routes[('GET', '/accounts/me')]
+        route['constant_response'] = b'built'
+        self.registry.add_route('/late', handler, ['GET'], False)
+        table = self.registry.compile()
+
+        self.assertIs(table.routes[('GET', '/accounts/me')], route)
+        self.assertNotIn('constant_response', users.routes[('GET', '/me')])
+        self.assertEqual(set(table.websockets), {'/live', '/accounts/live'})
+        self.assertEqual(set(self.registry.websockets), {'/live'})
+
+    def test_include_under_dynamic_prefix (
+        self,
+    ) -> None:
+
+        members = RouteRegistry()
+        members.add_route('/members', handler, ['GET'], False)
+        self.registry.include(members, '/orgs/<int:org>')
+
+        self.assertEqual(self.match('/orgs/3/members'), ('/orgs/<int:org>/members', {'org': 3}))
+
+    def test_reject_invalid_includes (
+        self,
+    ) -> None:
+
+        other = RouteRegistry()
+        other.include(self.registry, '/nested')
+
+        for registry, prefix in ((RouteRegistry(), 'api'), (RouteRegistry(), '/api/'), (self.registry, ''), (other, '')):
+            with self.subTest(prefix=prefix):
+                with self.assertRaises(InvalidRoutePath):
+                    self.registry.include(registry, prefix)
+
+    def test_reject_conflicting_includes (
+        self,
+    ) -> None:
+
+        users = RouteRegistry()
+        users.add_route('/me', handler, ['GET'], False)
+        self.registry.include(users, '/users')
+
+        with self.assertRaises(InvalidRoutePath):
+            self.registry.compile()
+
+    def test_convert_path_to_regex (
+        self,
+    ) -> None:
+
+        pattern = re.compile(self.registry.convert_path_to_regex('/items/<int:id>/<name>'))
+
+        self.assertEqual(pattern.match('/items/42/chair').groupdict(), {'id': '42', 'name': 'chair'})
+        self.assertIsNone(pattern.match('/items/abc/chair'))
+
+
+if __name__ == '__main__':
+    unittest.main()
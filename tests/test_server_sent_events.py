@@ -0,0 +1,153 @@
+import asyncio
+import socket
+import unittest
+
+from returnables.event_stream_response.event_stream_response import EventStreamResponse
+
+from server_sent_events.server_sent_events import EventChannel, encode_event
+
+
+class TestServerSentEvents(unittest.TestCase):
+
+    def test_encode_event (
+        self,
+    ) -> None:
+
+        self.assertEqual(encode_event('hello'), b'data: hello\n\n')
+        self.assertEqual(encode_event(b'a\nb', 'update', '7', 1000), b'id: 7\nevent: update\nretry: 1000\ndata: a\ndata: b\n\n')
+        self.assertEqual(encode_event({'cpu': 1}), b'data: {"cpu":1}\n\n')
+        self.assertEqual(encode_event(''), b'data: \n\n')
+
+    def test_publish_shared_bytes (
+        self,
+    ) -> None:
+
+        channel = EventChannel()
+        first, second = channel.subscribe(), channel.subscribe()
+
+        self.assertEqual(channel.publish('tick'), '1')
+        self.assertEqual(channel.publish('tock', event_id='custom'), 'custom')
+
+        self.assertIs(first.pending[0], second.pending[0])
+        self.assertEqual(first.pending[0], (b'id: 1\ndata: tick\n\n', b'12\r\nid: 1\ndata: tick\n\n\r\n'))
+        self.assertTrue(first.ready.is_set())
+
+    def test_resume_from_last_event_id (
+        self,
+    ) -> None:
+
+        channel = EventChannel(history_size=3)
+        for index in range(5):
+            channel.publish(f'event {index}')
+
+        for last_event_id, events in (
+            ('3', [b'event 3', b'event 4']),
+            ('5', []),
+            ('1', []),
+            ('unknown', []),
+            (None, []),
+        ):
+            with self.subTest(last_event_id=last_event_id):
+                subscriber = channel.subscribe(last_event_id)
+                self.assertEqual([raw.split(b'data: ')[1][:-2] for raw, _ in subscriber.pending], events)
+
+        self.assertEqual(sorted(channel._positions), ['3', '4', '5'])
+
+    def test_disconnect_slow_subscribers (
+        self,
+    ) -> None:
+
+        channel = EventChannel(max_pending=2)
+        subscriber = channel.subscribe()
+        for index in range(3):
+            channel.publish(index)
+
+        self.assertTrue(subscriber.closed)
+        self.assertEqual(len(subscriber.pending), 2)
+        self.assertEqual(channel.subscribers, set())
+
+    def test_stream_events (
+        self,
+    ) -> None:
+
+        server, client = socket.socketpair()
+        server.setblocking(False)
+        channel = EventChannel()
+
+        async def serve (
+        ) -> None:
+
+            response = EventStreamResponse(channel, heartbeat_interval=0.1)
+            stream = asyncio.ensure_future(response.stream(server))
+            await asyncio.sleep(0)
+            channel.publish('a')
+            channel.publish('b')
+            await asyncio.sleep(0.15)
+            channel.close()
+            await stream
+            server.close()
+
+        try:
+            asyncio.run(serve())
+            received = bytearray()
+            while data := client.recv(65536):
+                received += data
+        finally:
+            client.close()
+
+        self.assertEqual (
+            bytes(received),
+            b'f\r\nid: 1\ndata: a\n\n\r\nf\r\nid: 2\ndata: b\n\n\r\n'
+            b'd\r\n: heartbeat\n\n\r\n0\r\n\r\n',
+        )
+        self.assertEqual(channel.subscribers, set())
+
+    def test_subscribe_when_streaming (
+        self,
+    ) -> None:
+
+        channel = EventChannel()
+        channel.publish('a')
+        channel.publish('b')
+        response = EventStreamResponse(channel, last_event_id='1')
+        self.assertIsNone(response.subscriber)
+        self.assertEqual(channel.subscribers, set())
+
+        server, client = socket.socketpair()
+        server.setblocking(False)
+        client.close()
+
+        with self.assertRaises(OSError):
+            asyncio.run(response.stream(server))
+        server.close()
+
+        self.assertIsNotNone(response.subscriber)
+        self.assertEqual(channel.subscribers, set())
+
+    def test_reject_line_breaks_in_fields (
+        self,
+    ) -> None:
+
+        channel = EventChannel()
+        for fields in ({'event': 'a\ndata: b'}, {'event_id': '1\r'}, {'event_id': '1\r\nevent: b'}):
+            with self.subTest(fields=fields):
+                with self.assertRaises(ValueError):
+                    encode_event('a', **fields)
+                with self.assertRaises(ValueError):
+                    channel.publish('a', **fields)
+
+        self.assertEqual(channel.publish('a'), '1')
+
+    def test_render_head (
+        self,
+    ) -> None:
+
+        head = EventStreamResponse(EventChannel()).render_head(True)
+
+        self.assertIn(b'Content-Type: text/event-stream; charset=utf-8\r\n', head)
+        self.assertIn(b'Cache-Control: no-cache\r\n', head)
+        self.assertIn(b'Transfer-Encoding: chunked\r\n', head)
+
+
+if __name__ == '__main__':
+    unittest.main()
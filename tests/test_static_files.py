@@ -0,0 +1,210 @@
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+
+from email.utils import formatdate
+
+from parsers.request_parser.http_request import HTTPRequest
+
+from returnables.file_response.file_response import FileResponse, parse_byte_ranges
+from returnables.response.response import Response
+
+from static_files.static_files import StaticFiles
+
+from tests.helpers import make_request
+
+
+class TestStaticFiles(unittest.TestCase):
+
+    def setUp (
+        self,
+    ) -> None:
+
+        root = tempfile.TemporaryDirectory()
+        self.addCleanup(root.cleanup)
+        self.directory = os.path.join(root.name, 'public')
+        os.makedirs(os.path.join(self.directory, 'css'))
+        with open(os.path.join(self.directory, 'css', 'site.css'), 'wb') as file:
+            file.write(b'body { margin: 0 }')
+        with open(os.path.join(root.name, 'secret.txt'), 'wb') as file:
+            file.write(b'secret')
+        self.static_files = StaticFiles(self.directory)
+
+    def serve (
+        self,
+        file: str,
+        request: HTTPRequest | None = None,
+    ) -> Response:
+
+        return asyncio.run(self.static_files.serve(file, request or make_request()))
+
+    def test_serve_file (
+        self,
+    ) -> None:
+
+        response = self.serve('css/site.css')
+        head = response.render_head(True)
+
+        self.assertIsInstance(response, FileResponse)
+        self.assertEqual(response.size, 18)
+        self.assertIn(b'Content-Type: text/css; charset=utf-8\r\n', head)
+        self.assertIn(b'Content-Length: 18\r\n', head)
+        self.assertRegex(head, rb'ETag: "[0-9a-f]+-12"\r\nLast-Modified: ')
+
+    def test_reject_missing_and_escaping_paths (
+        self,
+    ) -> None:
+
+        for file in ('css/missing.css', 'css', '../secret.txt', 'css/%2e%2e/%2e%2e/secret.txt', 'a\x00b'):
+            with self.subTest(file=file):
+                self.assertEqual(self.serve(file).status_code, 404)
+
+    def test_answer_conditional_requests (
+        self,
+    ) -> None:
+
+        etag = self.static_files.get_file('css/site.css').etag
+        modified = formatdate(self.static_files.get_file('css/site.css').mtime, usegmt=True)
+
+        for headers, status in (
+            (b'If-None-Match: "other", ' + etag.encode() + b'\r\n', 304),
+            (b'If-None-Match: W/' + etag.encode() + b'\r\n', 304),
+            (b'If-None-Match: "other"\r\nIf-Modified-Since: ' + modified.encode() + b'\r\n', 200),
+            (b'If-Modified-Since: ' + modified.encode() + b'\r\n', 304),
+            (b'If-Modified-Since: Sat, 01 Jan 2000 00:00:00 GMT\r\n', 200),
+        ):
+            with self.subTest(headers=headers):
+                response = self.serve('css/site.css', make_request(headers=headers))
+                self.assertEqual(response.status_code, status)
+
+        head = self.serve('css/site.css', make_request(headers=b'If-None-Match: *\r\n')).render_head(True)
+        self.assertTrue(head.startswith(b'HTTP/1.1 304 Not Modified\r\n'))
+        self.assertNotIn(b'Content-Length', head)
+        self.assertIn(f'ETag: {etag}\r\n'.encode(), head)
+
+    def test_cache_file_metadata (
+        self,
+    ) -> None:
+
+        path = os.path.join(self.directory, 'css', 'site.css')
+        cached = self.static_files.get_file('css/site.css')
+
+        os.utime(path, ns=(0, 10 ** 9))
+        self.assertIs(self.static_files.get_file('css/site.css'), cached)
+
+        self.static_files.stat_ttl = 0
+        self.assertNotEqual(self.static_files.get_file('css/site.css').etag, cached.etag)
+
+    def send_file (
+        self,
+        *responses: FileResponse,
+    ) -> bytes:
+
+        server, client = socket.socketpair()
+        server.setblocking(False)
+
+        async def send (
+        ) -> None:
+
+            for response in responses:
+                await response.send_file(server)
+            server.close()
+
+        try:
+            asyncio.run(send())
+            received = bytearray()
+            while data := client.recv(65536):
+                received += data
+            return bytes(received)
+        finally:
+            client.close()
+
+    def test_send_file (
+        self,
+    ) -> None:
+
+        response = self.serve('css/site.css')
+        head_only = self.serve('css/site.css', make_request('HEAD'))
+
+        self.assertEqual(self.send_file(response, head_only), b'body { margin: 0 }')
+
+    def test_parse_byte_ranges (
+        self,
+    ) -> None:
+
+        for header, ranges in (
+            ('bytes=0-99', [(0, 99)]),
+            ('bytes=-300, 900-', [(700, 999)]),
+            ('bytes=0-10,5-20,22-30', [(0, 20), (22, 30)]),
+            ('bytes=0-0,-1', [(0, 0), (999, 999)]),
+            ('bytes=500-5000', [(500, 999)]),
+            ('bytes=1000-,-0', []),
+            ('bytes=5-1', None),
+            ('bytes=-', None),
+            ('bytes=١-2', None),
+            ('items=0-1', None),
+            (','.join(['bytes=0-0'] + [f'{index * 2}-{index * 2}' for index in range(1, 17)]), None),
+        ):
+            with self.subTest(header=header):
+                self.assertEqual(parse_byte_ranges(header, 1000), ranges)
+
+    def test_serve_single_range (
+        self,
+    ) -> None:
+
+        response = self.serve('css/site.css', make_request(headers=b'Range: bytes=7-\r\n'))
+        head = response.render_head(True)
+
+        self.assertTrue(head.startswith(b'HTTP/1.1 206 Partial Content\r\n'))
+        self.assertIn(b'Accept-Ranges: bytes\r\n', head)
+        self.assertIn(b'Content-Range: bytes 7-17/18\r\nContent-Length: 11\r\n', head)
+        self.assertEqual(self.send_file(response), b'margin: 0 }')
+
+    def test_serve_multiple_ranges (
+        self,
+    ) -> None:
+
+        response = self.serve('css/site.css', make_request(headers=b'Range: bytes=0-3,-3\r\n'))
+        body = self.send_file(response)
+        boundary = response.media_type.split('boundary=')[1]
+
+        self.assertEqual(response.status_code, 206)
+        self.assertTrue(response.media_type.startswith('multipart/byteranges; boundary='))
+        self.assertEqual(len(body), response.content_length)
+        self.assertEqual (
+            body,
+            (
+                f'\r\n--{boundary}\r\nContent-Type: text/css; charset=utf-8\r\nContent-Range: bytes 0-3/18\r\n\r\nbody'
+                f'\r\n--{boundary}\r\nContent-Type: text/css; charset=utf-8\r\nContent-Range: bytes 15-17/18\r\n\r\n0 }}'
+                f'\r\n--{boundary}--\r\n'
+            ).encode(),
+        )
+
+    def test_answer_range_conditions (
+        self,
+    ) -> None:
+
+        static_file = self.static_files.get_file('css/site.css')
+        modified = formatdate(static_file.mtime, usegmt=True).encode()
+
+        for headers, status in (
+            (b'Range: bytes=0-3\r\nIf-Range: ' + static_file.etag.encode() + b'\r\n', 206),
+            (b'Range: bytes=0-3\r\nIf-Range: "stale"\r\n', 200),
+            (b'Range: bytes=0-3\r\nIf-Range: W/' + static_file.etag.encode() + b'\r\n', 200),
+            (b'Range: bytes=0-3\r\nIf-Range: ' + modified + b'\r\n', 206),
+            (b'Range: bytes=0-3\r\nIf-Range: Sat, 01 Jan 2000 00:00:00 GMT\r\n', 200),
+            (b'Range: bytes=100-\r\n', 416),
+            (b'Range: lines=1-2\r\n', 200),
+        ):
+            with self.subTest(headers=headers):
+                self.assertEqual(self.serve('css/site.css', make_request(headers=headers)).status_code, status)
+
+        response = self.serve('css/site.css', make_request(headers=b'Range: bytes=100-\r\n'))
+        self.assertIn(b'Content-Range: bytes */18\r\n', response.render_head(True))
+        self.assertEqual(self.serve('css/site.css', make_request('HEAD', headers=b'Range: bytes=0-3\r\n')).status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+
+from parsers.request_parser.streaming_request_parser import StreamingRequestParser
+
+from exceptions.http_exceptions.http_exceptions import SocketIOMalformedRequestError
+
+
+class TestStreamingRequestParser(unittest.TestCase):
+    
+    def setUp (
+        self,
+    ) -> None:
+        
+        self.parser = StreamingRequestParser (
+            max_request_line_size=64,
+            max_header_size=256,
+            max_headers=4,
+            max_body_size=16,
+        )
+        
+    def test_parse_simple_request (
+        self,
+    ) -> None:
+        
+        buffer = bytearray(b'GET /items?page=2 HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        head = self.parser.parse_head(buffer)
+        
+        self.assertEqual(head.method, 'GET')
+        self.assertEqual(head.target, '/items?page=2')
+        self.assertEqual(head.version, 'HTTP/1.1')
+        self.assertEqual(head.headers, {'Host': 'localhost'})
+        self.assertEqual(head.body_start, len(buffer))
+        self.assertEqual(head.body_end, len(buffer))
+        
+    def test_parse_incrementally (
+        self,
+    ) -> None:
+        
+        buffer = bytearray()
+        for chunk in (b'POST /up', b'load HTTP/1.1\r\nContent-Len', b'gth: 4\r\n\r', b'\nab'):
+            buffer += chunk
+            head = self.parser.parse_head(buffer)
+        
+        self.assertEqual(head.target, '/upload')
+        self.assertEqual(head.body_end - head.body_start, 4)
+        self.assertEqual(bytes(buffer[head.body_start:]), b'ab')
+        
+    def test_parse_pipelined_requests (
+        self,
+    ) -> None:
+        
+        buffer = bytearray (
+            b'POST /a HTTP/1.1\r\nContent-Length: 3\r\n\r\nabc'
+            b'GET /b HTTP/1.1\r\n\r\n'
+        )
+        first = self.parser.parse_head(buffer)
+        second = self.parser.parse_head(buffer, first.body_end)
+        
+        self.assertEqual(bytes(buffer[first.body_start:first.body_end]), b'abc')
+        self.assertEqual(second.target, '/b')
+        self.assertEqual(second.body_end, len(buffer))
+        
+    def test_parse_chunked_request (
+        self,
+    ) -> None:
+        
+        head = self.parser.parse_head(bytearray(b'POST / HTTP/1.1\r\nTransfer-Encoding: chunked\r\n\r\n'))
+        
+        self.assertTrue(head.chunked)
+        self.assertIsNone(head.body_end)
+        
+    def test_invalid_requests (
+        self,
+    ) -> None:
+        
+        invalid_requests = {
+            b'GET /\r\n\r\n': '400',
+            b'GET / HTTP/2.0\r\n\r\n': '400',
+            b'GET / HTTP/1.1\r\nHost : x\r\n\r\n': '400',
+            b'GET / HTTP/1.1\r\nContent-Length: 1\r\nContent-Length: 2\r\n\r\n': '400',
+            b'GET / HTTP/1.1\r\nContent-Length: 1\r\nTransfer-Encoding: chunked\r\n\r\n': '400',
+            b'GET / HTTP/1.1\r\nTransfer-Encoding: gzip\r\n\r\n': '501',
+            b'GET / HTTP/1.1\r\nTransfer-Encoding: chunked\r\nTransfer-Encoding: gzip\r\n\r\n': '501',
+            b'GET / HTTP/1.1\r\nTransfer-Encoding: gzip\r\nTransfer-Encoding: chunked\r\n\r\n': '501',
+            b'GET / HTTP/1.1\r\nTransfer-Encoding: chunked, chunked\r\n\r\n': '501',
+            b'GET / HTTP/1.1\r\nTransfer-Encoding:\r\n\r\n': '501',
+            b'GET / HTTP/1.1\r\nContent-Length: 17\r\n\r\n': '413',
+            b'GET /' + b'a' * 80 + b' HTTP/1.1': '414',
+            b'GET / HTTP/1.1\r\n' + b'A: b\r\n' * 5 + b'\r\n': '431',
+            b'GET / HTTP/1.1\r\nA: ' + b'b' * 300: '431',
+        }
+        
+        for request, status in invalid_requests.items():
+            with self.subTest(request=request):
+                with self.assertRaises(SocketIOMalformedRequestError) as cm:
+                    StreamingRequestParser (
+                        max_request_line_size=64,
+                        max_header_size=256,
+                        max_headers=4,
+                        max_body_size=16,
+                    ).parse_head(bytearray(request))
+                    
+                self.assertIn(status, cm.exception.status_line)
@@ -0,0 +1,85 @@
+import contextlib
+import io
+import os
+import signal
+import time
+import unittest
+
+from handlers.worker_pool_handler.worker_pool_handler import WorkerPoolHandler
+
+
+class Pool(WorkerPoolHandler):
+
+    RESPAWN_DELAY = 0.2
+
+    def __init__ (
+        self,
+        workers: int,
+        output: int,
+    ) -> None:
+
+        self.workers = workers
+        self.worker_pids = {}
+        self.running = False
+        self.connections = set()
+        self.output = output
+        self.prepared = False
+
+    def prepare_master (
+        self,
+    ) -> None:
+
+        self.prepared = True
+
+    async def serve_worker (
+        self,
+    ) -> None:
+
+        os.write(self.output, f"{self.worker_id} {os.getpid()} {time.monotonic()}\n".encode())
+
+
+@unittest.skipUnless(hasattr(os, 'fork'), "workers require os.fork")
+class TestWorkerPoolHandler(unittest.TestCase):
+
+    def test_respawn_exited_workers (
+        self,
+    ) -> None:
+
+        handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGALRM)}
+        read_end, write_end = os.pipe()
+        pool = Pool(2, write_end)
+
+        signal.signal(signal.SIGALRM, lambda *_: os.kill(os.getpid(), signal.SIGTERM))
+        signal.setitimer(signal.ITIMER_REAL, 0.5)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                pool.supervise_workers()
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            for sig, handler in handlers.items():
+                signal.signal(sig, handler)
+            os.close(write_end)
+
+        with os.fdopen(read_end) as lines:
+            started = [line.split() for line in lines]
+
+        self.assertTrue(pool.prepared)
+        self.assertFalse(pool.running)
+        self.assertEqual(pool.worker_pids, {})
+        with self.assertRaises(ChildProcessError):
+            os.waitpid(-1, os.WNOHANG)
+
+        self.assertEqual(sorted(worker_id for worker_id, _, _ in started[:2]), ['0', '1'])
+        self.assertGreater(len(started), 2)
+        self.assertEqual(len({pid for _, pid, _ in started}), len(started))
+        self.assertNotIn(str(os.getpid()), [pid for _, pid, _ in started])
+        self.assertEqual(output.getvalue().count('respawning'), len(started) - 2)
+
+        for worker_id in ('0', '1'):
+            times = [float(at) for started_id, _, at in started if started_id == worker_id]
+            for previous, current in zip(times, times[1:]):
+                self.assertGreaterEqual(current - previous, Pool.RESPAWN_DELAY * 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest 
+from unittest.mock import patch
+
+from utils.socketio_validators.socketio_workers_validator.socketio_workers_validator import SocketIOWorkersValidator
+
+from exceptions.socketio_exceptions.socketio_exceptions import (
+    SocketIOInproperWorkersError,
+    SocketIOWorkersWithGRPCError,
+)
+
+
+class TestWorkersValidator(unittest.TestCase):
+    
+    def test_valid_workers_n1 (
+        self,
+    ) -> None:
+        
+        workers = SocketIOWorkersValidator.verify_workers_validity(1)
+        self.assertEqual(workers, 1)
+        
+    def test_valid_workers_n2 (
+        self,
+    ) -> None:
+        
+        workers = SocketIOWorkersValidator.verify_workers_validity(8)
+        self.assertEqual(workers, 8)
+        
+    def test_inproper_workers_n1 (
+        self,
+    ) -> None:
+        
+        expected_message = (
+            "\n"
+            + "#" * 75 + "\n"
+            + f"#  ERROR: Invalid number of workers '0'.                          #\n"
+            + "#  Workers must be a positive integer. Default SocketIO workers is 1      #\n"
+            + "#  Multiple workers require a platform that supports os.fork.             #\n"
+            + "#" * 75
+        )
+        
+        with self.assertRaises(SocketIOInproperWorkersError) as cm:
+            SocketIOWorkersValidator.verify_workers_validity(0)
+            
+        self.assertEqual (
+            str(cm.exception).strip(),
+            expected_message.strip(),
+        )
+        
+    def test_inproper_workers_n2 (
+        self,
+    ) -> None:
+        
+        with self.assertRaises(SocketIOInproperWorkersError):
+            SocketIOWorkersValidator.verify_workers_validity('4')
+            
+    def test_inproper_workers_n3 (
+        self,
+    ) -> None:
+        
+        with self.assertRaises(SocketIOInproperWorkersError):
+            SocketIOWorkersValidator.verify_workers_validity(True)
+            
+    def test_workers_without_fork (
+        self,
+    ) -> None:
+        
+        with patch('utils.socketio_validators.socketio_workers_validator.socketio_workers_validator.os') as mock_os:
+            del mock_os.fork
+            
+            self.assertEqual(SocketIOWorkersValidator.verify_workers_validity(1), 1)
+            with self.assertRaises(SocketIOInproperWorkersError):
+                SocketIOWorkersValidator.verify_workers_validity(2)
+            
+    def test_workers_with_grpc (
+        self,
+    ) -> None:
+        
+        self.assertEqual(SocketIOWorkersValidator.verify_workers_validity(1, 50051), 1)
+        self.assertEqual(SocketIOWorkersValidator.verify_workers_validity(4, None), 4)
+        with self.assertRaises(SocketIOWorkersWithGRPCError):
+            SocketIOWorkersValidator.verify_workers_validity(4, 50051)
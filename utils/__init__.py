@@ -1,13 +1,19 @@
 from .os_detector.os_detector.os_detector import OSDetector
 from .root_configurer.root_configure import RootConfigurer
+from .socketio_validators.socketio_max_connections_validator.socketio_max_connections_validator import SocketIOMaxConnectionsValidator
 from .socketio_validators.socketio_port_validator.socketio_port_validator import SocketIOPortValidator
+from .socketio_validators.socketio_workers_validator.socketio_workers_validator import SocketIOWorkersValidator
+from .socket_writer.socket_writer import send_buffers
 from .static.privacy.privacy import privatemethod
 from .static.privacy.protected_class import ProtectedClass
 
 __all__ = [
     'OSDetector',
     'RootConfigurer',
+    'SocketIOMaxConnectionsValidator',
     'SocketIOPortValidator',
+    'SocketIOWorkersValidator',
+    'send_buffers',
     'privatemethod',
     'ProtectedClass',
 ]
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+This module provides the helpers writing response buffers to a non-blocking client socket
+from the event loop, with a scatter-gather `sendmsg` where the platform offers it.
+"""
+
+import asyncio
+import os
+import socket
+
+
+IOV_MAX = os.sysconf('SC_IOV_MAX') if hasattr(os, 'sysconf') and 'SC_IOV_MAX' in os.sysconf_names else 1024
+"""
+The maximum number of buffers written by a single `sendmsg` call.
+"""
+
+
+async def wait_writable (
+    client_socket: socket.socket,
+) -> None:
+
+    """
+    Waits until the socket can accept more data without blocking.
+
+    Args:
+        client_socket (socket.socket): The non-blocking client socket.
+    """
+
+    loop = asyncio.get_running_loop()
+    writable = loop.create_future()
+    fd = client_socket.fileno()
+    loop.add_writer(fd, lambda: writable.done() or writable.set_result(None))
+    try:
+        await writable
+    finally:
+        loop.remove_writer(fd)
+
+
+async def send_buffers (
+    client_socket: socket.socket,
+    buffers: list[bytes],
+) -> None:
+
+    """
+    Writes buffers to the socket in order, without joining them.
+
+    The buffers are handed to `sendmsg` together, so the kernel gathers them into the
+    same segments. A partial write resumes from the first unsent byte once the socket
+    is writable again. Without `sendmsg`, the buffers are joined and sent at once.
+
+    Args:
+        client_socket (socket.socket): The non-blocking client socket.
+        buffers (list[bytes]): The buffers to write.
+
+    Raises:
+        OSError: If the connection fails while writing.
+    """
+
+    if not hasattr(client_socket, 'sendmsg'):
+        await asyncio.get_running_loop().sock_sendall(client_socket, b"".join(buffers))
+        return
+
+    views = [memoryview(buffer) for buffer in buffers if len(buffer)]
+    first = 0
+    while first < len(views):
+        try:
+            sent = client_socket.sendmsg(views[first:first + IOV_MAX])
+        except (BlockingIOError, InterruptedError):
+            await wait_writable(client_socket)
+            continue
+
+        while sent:
+            size = len(views[first])
+            if sent < size:
+                views[first] = views[first][sent:]
+                break
+            sent -= size
+            first += 1
@@ -0,0 +1,48 @@
+"""
+Maximum connections validation utility for the SocketIO framework.
+
+Provides logic to validate the cap of connections served at once by each
+process of a SocketIO server.
+"""
+
+from exceptions.socketio_exceptions.socketio_exceptions import SocketIOInproperMaxConnectionsError
+
+
+class SocketIOMaxConnectionsValidator:
+
+    """
+    A static utility class to validate the maximum number of connections served by the SocketIO server.
+
+    It ensures the cap is a positive integer, or None to leave the connections unbounded,
+    so a misconfigured cap fails when the server is configured rather than when it starts.
+    """
+
+    @staticmethod
+    def verify_max_connections_validity (
+        max_connections: int | None,
+    ) -> int | None:
+
+        """
+        Verifies the given maximum number of connections is valid.
+
+        Args:
+            max_connections (int | None): The maximum number of connections to validate, or None.
+
+        Returns:
+            int | None: The validated maximum number of connections.
+
+        Raises:
+            SocketIOInproperMaxConnectionsError: If the maximum number of connections is neither None
+                                                 nor a positive integer.
+        """
+
+        if max_connections is None:
+            return None
+
+        if not isinstance(max_connections, int) or isinstance(max_connections, bool):
+            raise SocketIOInproperMaxConnectionsError(max_connections)
+
+        if max_connections < 1:
+            raise SocketIOInproperMaxConnectionsError(max_connections)
+
+        return max_connections
@@ -0,0 +1,60 @@
+"""
+Workers validation utility for the SocketIO framework.
+
+Provides logic to validate the number of worker processes requested for a
+SocketIO server, ensuring the platform is able to fork them and that they
+are not combined with a gRPC server.
+"""
+
+import os
+
+from exceptions.socketio_exceptions.socketio_exceptions import (
+    SocketIOInproperWorkersError,
+    SocketIOWorkersWithGRPCError,
+)
+
+
+class SocketIOWorkersValidator:
+    
+    """
+    A static utility class to validate the number of workers used by the SocketIO server.
+    
+    It ensures the number of workers is a positive integer and that multiple workers
+    are only requested on platforms supporting `os.fork` and without a gRPC server.
+    """
+
+    @staticmethod
+    def verify_workers_validity (
+        workers: int,
+        grpc_port: int | None = None,
+    ) -> int:
+        
+        """
+        Verifies the given number of workers is valid for the current platform.
+
+        Args:
+            workers (int): The number of worker processes to validate.
+            grpc_port (int | None, optional): The port of the gRPC server, if used. Defaults to None.
+
+        Returns:
+            int: The validated number of workers.
+
+        Raises:
+            SocketIOInproperWorkersError: If the number of workers is not a positive integer,
+                                          or if multiple workers cannot be forked on this platform.
+            SocketIOWorkersWithGRPCError: If multiple workers are requested along with a gRPC server.
+        """
+        
+        if not isinstance(workers, int) or isinstance(workers, bool):
+            raise SocketIOInproperWorkersError(workers)
+        
+        if workers < 1:
+            raise SocketIOInproperWorkersError(workers)
+        
+        if workers > 1 and not hasattr(os, 'fork'):
+            raise SocketIOInproperWorkersError(workers)
+
+        if workers > 1 and grpc_port:
+            raise SocketIOWorkersWithGRPCError(workers)
+
+        return workers
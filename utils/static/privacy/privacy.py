@@ -5,7 +5,7 @@ This module provides a decorator that enforces private method semantics in Pytho
 by restricting access to the method from outside the defining class.
 """
 
-import inspect
+import sys
 from functools import wraps
 
 
@@ -17,6 +17,9 @@ def privatemethod(method):
     Ensures the decorated method can only be accessed from within its own class.
     If accessed externally, raises a RuntimeError.
 
+    The caller is found by walking the frame chain directly, as building the full
+    `inspect.stack()` reads source lines and cost milliseconds per call.
+
     Args:
         method (Callable): The method to protect.
 
@@ -29,11 +32,12 @@ def privatemethod(method):
     
     @wraps(method)
     def wrapper(self, *args, **kwargs):
-        stack = inspect.stack()
-        for frame_info in stack[1:]:
-            caller_self = frame_info.frame.f_locals.get('self')
+        frame = sys._getframe(1)
+        while frame is not None:
+            caller_self = frame.f_locals.get('self')
             if isinstance(caller_self, self.__class__):
                 return method(self, *args, **kwargs)
+            frame = frame.f_back
         raise RuntimeError(
             f"Method '{method.__name__}' is private and cannot be accessed externally."
         )